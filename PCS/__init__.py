@@ -1 +1 @@
-from pcsParser import PCS
+from .pcsParser import PCS, PCSParseError, ObjectID, PCSObject, ActiveConfiguration, Configuration
@@ -6,7 +6,33 @@
 
 import re
 import random
+import math
 import copy
+import itertools
+import os
+import io
+import hashlib
+import time
+import logging
+import pickle
+import tempfile
+import gc
+import functools
+import difflib
+import bisect
+import collections
+import concurrent.futures
+
+try:
+    import numpy as np
+except ImportError:
+    #numpy is only needed for the functions that work on batches of 
+    #configurations, see requireNumpy().
+    np = None
+
+#All of the warnings and debugging output of the parser go to this logger. 
+#Errors are raised as exceptions instead, see PCSParseError.
+logger = logging.getLogger('PCS')
 
 
 #Handy things to remember for later, possibly I should just make them into functions themselves:
@@ -19,140 +45,1059 @@ import copy
 #paramList = [{'default': 50, 'values': [10, 500], 'type': 'integer', 'name': 'ASCENT_CANDIDATES', 'log': True}, {'default': 0, 'values': [0, 5], 'type': 'integer', 'name': 'BACKBONE_TRIALS', 'log': False}, {'default': 'NO', 'values': ['YES', 'NO'], 'type': 'categorical', 'name': 'BACKTRACKING', 'log': False}]
 
 
+class ObjectID(int):
+    """
+    The ID of an "object" stored in the memory of a PCS instance. IDs are 
+    integers allocated separately by each PCS instance, so checking whether 
+    something is an ID is a type check. They print as '@#x', the form of the
+    string IDs used by earlier versions, and those strings are still accepted
+    wherever an ID is expected (see PCS.toID).
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return PCS.idPrefix + int.__repr__(self)
+
+    __str__ = __repr__
+
+    @staticmethod
+    def fromString(string):
+        #Returns the ObjectID for a string of the form '@#x', or None if the
+        #string is not in that format.
+        if(type(string) is str and string[0:len(PCS.idPrefix)] == PCS.idPrefix):
+            try:
+                return ObjectID(int(string[len(PCS.idPrefix):]))
+            except ValueError:
+                return None
+        return None
+
+
+class ObjectMemory(dict):
+    """
+    The "memory" of a PCS instance, which maps ObjectIDs to "objects". For 
+    compatibility, objects can also be looked up with string IDs of the form
+    '@#x'.
+    """
+    __slots__ = ()
+
+    def __missing__(self, key):
+        oid = ObjectID.fromString(key)
+        if(oid is None or not dict.__contains__(self, oid)):
+            raise KeyError(key)
+        return dict.__getitem__(self, oid)
+
+    def __contains__(self, key):
+        if(dict.__contains__(self, key)):
+            return True
+        oid = ObjectID.fromString(key)
+        return oid is not None and dict.__contains__(self, oid)
+
+    def get(self, key, default=None):
+        if(key in self):
+            return self[key]
+        return default
+
+
+class PCSParseError(Exception):
+    """
+    Raised when a line of a parameter configuration space file cannot be 
+    parsed. Instead of being printed, where the error occurred is stored in 
+    the exception: infile is the name of the file, lineNumber the number of 
+    the line (starting from 1), line the (stripped) text of the line and kind
+    the kind of line, as given by PCS.classifyLine (e.g., 'real' or 
+    'conditional'). Any of them is None if it is not known. The exception 
+    that caused the error, if any, is its __cause__.
+    """
+
+    def __init__(self, message, infile=None, lineNumber=None, line=None, kind=None):
+        Exception.__init__(self, message)
+        self.message = message
+        self.infile = infile
+        self.lineNumber = lineNumber
+        self.line = line
+        self.kind = kind
+
+    def __str__(self):
+        location = []
+        if(self.infile is not None):
+            location.append('file "' + str(self.infile) + '"')
+        if(self.lineNumber is not None):
+            location.append('line ' + str(self.lineNumber))
+        if(self.kind is not None):
+            location.append(str(self.kind))
+        if(self.line is not None):
+            location.append(repr(self.line))
+        if(len(location) == 0):
+            return self.message
+        return self.message + ' (' + ', '.join(location) + ')'
+
+    def __reduce__(self):
+        #Keeps the location when the exception is sent back from the 
+        #processes that parse files in parallel.
+        return (type(self), (self.message, self.infile, self.lineNumber, self.line, self.kind))
+
+
+class PCSObject(object):
+    """
+    An "object" stored in the memory of a PCS instance. Objects use __slots__
+    rather than a per-object dict, which makes them several times smaller, 
+    but they still support the dict-style access used throughout this module
+    (e.g., param['name'] and param['values'] = [...]). Accessing a field that
+    has not been set raises a KeyError, as it would for a dict. Unlike a 
+    dict, there is no values() method, because 'values' is a field of 
+    parameters; use items() instead.
+    """
+    __slots__ = ('id','type','comment')
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.fields() and hasattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.fields() else default
+
+    def fields(self):
+        #Returns the names of all of the slots of this class, in order.
+        return [f for cls in reversed(type(self).__mro__) for f in cls.__dict__.get('__slots__', ())]
+
+    def keys(self):
+        return [f for f in self.fields() if hasattr(self, f)]
+
+    def items(self):
+        return [(f, getattr(self, f)) for f in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def toDict(self):
+        #Returns a copy of the fields of this object as a dict.
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.toDict())
+
+
+class Parameter(PCSObject):
+    __slots__ = ('name','values','default')
+
+
+class NumericParameter(Parameter):
+    __slots__ = ('log',)
+
+
+class RealParameter(NumericParameter):
+    __slots__ = ()
+
+
+class IntegerParameter(NumericParameter):
+    __slots__ = ()
+
+
+class CategoricalParameter(Parameter):
+    __slots__ = ()
+
+
+class OrdinalParameter(Parameter):
+    __slots__ = ()
+
+
+class Value(PCSObject):
+    __slots__ = ('text',)
+
+
+class Comment(PCSObject):
+    __slots__ = ('text',)
+
+
+class Clause(PCSObject):
+    __slots__ = ('A','B','operator','brackets')
+
+
+class Conditional(PCSObject):
+    __slots__ = ('child','clauses')
+
+
+class Forbidden(PCSObject):
+    __slots__ = ('clause','syntax')
+
+
+class ValueArray(PCSObject):
+    __slots__ = ('values',)
+
+
+class Document(PCSObject):
+    __slots__ = ('content','source')
+
+
+
 class PCS:
     """
     A collection of useful functions for parsing and writing parameter configuration space (.pcs) files.
     """
 
     lineEnd = '(( *$)|( *#.*$))'
-    nextID = 0
     idPrefix = '@#'
 
-    def __init__(self, infile):
-        #Create the "memory" object. 
-        self.mem = {}
+    #The version of the format of the files written by saveCache(). This must
+    #be incremented whenever the attributes of a parsed PCS or the classes of
+    #its "objects" change, so that old cache files are ignored.
+    cacheFormat = 2
+
+    #The maximum number of times that sample() draws forbidden configurations
+    #again before it gives up.
+    maxSampleRounds = 100
+
+    #The maximum number of combinations of values of the parameters of a 
+    #table of forbidden clauses (see getForbiddenPlan), so that every 
+    #combination can be encoded as a 64 bit integer by forbiddenMask.
+    maxTableCombinations = 2**63 - 1
+
+    #The error codes returned by validate(), which are the indices of these
+    #descriptions. Each configuration gets the code of the first check that
+    #it fails, in this order.
+    validationErrors = ['valid',
+                        'unknown parameter',
+                        'invalid value',
+                        'out of range',
+                        'not an integer',
+                        'inactive parameter present',
+                        'active parameter missing',
+                        'forbidden']
+    cacheSuffix = '.pcscache'
+    #Attributes that are never written to the cache, because they hold 
+    #compiled functions or are rebuilt on demand.
+    uncachedAttributes = ['compiledClauses','paramPositions','topologicalOrder','activityPlan','descendantPlans','forbiddenPlan','textCodes','configurationCodec','conditionCaches','idCounter','instrumentationStats','instrumentationSampling']
+
+    #The functions that are timed and counted by enableInstrumentation(), and
+    #the name under which each of them is recorded. Names containing %s are
+    #recorded separately for each kind of line, see instrumentFunction().
+    instrumentedFunctions = {'parseDoc':'parse',
+                             'parseParameterLines':'parse parameters',
+                             'parseParameterLinesInParallel':'parse parameters',
+                             'parseDocumentLines':'parse document',
+                             'parseDocumentLinesInParallel':'parse document',
+                             'loadChunk':'load chunk',
+                             'classifyLine':'classify line',
+                             'parseParameterFields':'parse %s',
+                             'parseReal':'parse real',
+                             'parseInteger':'parse integer',
+                             'parseCategorical':'parse categorical',
+                             'parseOrdinal':'parse ordinal',
+                             'parseRealOldSyntax':'parse realOldSyntax',
+                             'parseIntegerOldSyntax':'parse integerOldSyntax',
+                             'parseCategoricalOldSyntax':'parse categoricalOldSyntax',
+                             'parseRawLine':'parse %s',
+                             'applyDiff':'apply diff',
+                             'printDocument':'print document',
+                             'printObject':'print object',
+                             'isActive':'isActive',
+                             'evalClause':'evalClause',
+                             'removeInactive':'removeInactive',
+                             'lookupParamID':'lookupParamID'}
+
+    #Attributes that are only created once the conditional statements, 
+    #forbidden clauses and comments of a lazily parsed space are parsed, see
+    #parseLazyLines().
+    lazyAttributes = ['doc','conditionList','conditionsByChild','conditionsByParent','forbiddenList','commentList']
+
+    #The print function for each type of "object", see printObject().
+    printFunctions = {'comment':'printComment',
+                      'integer':'printInteger',
+                      'real':'printReal',
+                      'categorical':'printCategorical',
+                      'ordinal':'printOrdinal',
+                      'conditional':'printConditional',
+                      'forbidden':'printForbidden',
+                      'value':'printValue',
+                      'valueArray':'printValueArray'}
+
+    #The class used to store each type of "object", see newObject().
+    objectClasses = {'real':RealParameter,
+                     'integer':IntegerParameter,
+                     'categorical':CategoricalParameter,
+                     'ordinal':OrdinalParameter,
+                     'value':Value,
+                     'comment':Comment,
+                     'clause':Clause,
+                     'conditional':Conditional,
+                     'forbidden':Forbidden,
+                     'valueArray':ValueArray,
+                     'document':Document,
+                     'object':PCSObject}
+
+    #Compiled patterns used by classifyLine(). paramLine matches the common
+    #forms of both the current and the old (SMAC/ParamILS) parameter syntax
+    #and extracts the name, type, range or values, default, log flag and 
+    #trailing comment in a single pass. The number patterns are the same 
+    #character classes that the original (per-type) regular expressions used.
+    paramLine = re.compile('^(?P<name>[^ \[\]{}#|]+)( (?P<type>real|integer|categorical|ordinal))?(?P<gap> *)'
+                           '(\[(?P<lower>[^\[\]{},#]+), *(?P<upper>[^\[\]{},#]+)\]|{(?P<values>[^\[\]{}#]+)})'
+                           ' *\[(?P<default>[^\[\]{}#]+)\] *(?P<flag>[a-z]*) *(#(?P<comment>.*))?$')
+    realNumber = re.compile('^-?([0-9]|\.|(e-?\+?))+$')
+    realNumberOldSyntax = re.compile('^-?([0-9]|\.|(e-?))+$')
+    integerNumber = re.compile('^-?[0-9]+$')
+
+    #The original line patterns, in order of precedence. These are only used
+    #for lines that paramLine does not recognize.
+    linePatterns = [('real',re.compile('^.+? real *\[-?([0-9]|\.|(e-?\+?))+?, *-?([0-9]|\.|(e-?\+?))+?\] *\[-?([0-9]|\.|(e-?\+?))+\] *(log)?' + lineEnd)),
+                    ('integer',re.compile('^.+? integer *\[-?([0-9])+?, *-?([0-9])+?\] *\[-?([0-9])+\] *(log)?' + lineEnd)),
+                    ('categorical',re.compile('^.+? categorical *{.+?} *\[.+?\]' + lineEnd)),
+                    ('ordinal',re.compile('^.+? ordinal *{.+?} *\[.+?\]' + lineEnd)),
+                    ('realOldSyntax',re.compile('^.+? *\[-?([0-9]|\.|(e-?))+?, *-?([0-9]|\.|(e-?))+?\] *\[-?([0-9]|\.|(e-?))+\] *l?' + lineEnd)),
+                    ('integerOldSyntax',re.compile('^.+? *\[-?([0-9])+?, *-?([0-9])+?\] *\[-?([0-9])+\] *l?il?' + lineEnd)),
+                    ('categoricalOldSyntax',re.compile('^.+? *{.+?} *\[.+?\]' + lineEnd)),
+                    ('conditional',re.compile('^.+? \| .+? ((==)|((!=)|((in)|(<|>)))) .+?( (((&&)|(\|\|)) .+? ((==)|((!=)|((in)|(<|>)))) .+?))*' + lineEnd)),
+                    ('forbidden',re.compile('^ *{.+?}' + lineEnd))]
+    #As in the original parser, the log flag of the current syntax is only
+    #recognized if the bounds have neither signs nor exponents.
+    logPattern = re.compile('^.+? .+? *\[([0-9]|\.)+?, *([0-9]|\.)+?\] *\[([0-9]|\.)+\] *log' + lineEnd)
+    logPatternOldSyntax = re.compile('^.+? *\[-?([0-9]|\.|(e-?))+?, *-?([0-9]|\.|(e-?))+?\] *\[-?([0-9]|\.|(e-?))+\] *l' + lineEnd)
+    logPatternsOldInteger = [re.compile('^.+? *\[-?([0-9])+?, *-?([0-9])+?\] *\[-?([0-9])+\] *il' + lineEnd),
+                             re.compile('^.+? *\[-?([0-9])+?, *-?([0-9])+?\] *\[-?([0-9])+\] *li' + lineEnd)]
+
+    def __init__(self, infile, cache=None, lazy=False, workers=None, instrument=None):
+        """__init__
+
+        Parses a parameter configuration space file.
+
+        Parameters
+        ----------
+        infile : str
+            The name and location of the parameter configuration space file to parse
+        cache : None, True or str
+            If None (the default), the file is always parsed. Otherwise, the 
+            parsed space is also stored in a cache file, which is loaded 
+            instead of parsing the file the next time that the same file 
+            contents are read. If True, the cache file is stored next to
+            infile, otherwise cache is the name of the directory in which to
+            store it. Cache files are only used if both the contents of 
+            infile and PCS.cacheFormat match the ones used to write them.
+            Cache files are pickles, so anyone who can write to the cache 
+            directory could run code in every process that loads them. Only
+            use a directory that is private to you: cache files are ignored 
+            (with a warning) unless both they and their directory belong to
+            the current user and cannot be written by anyone else, see 
+            isTrustedCacheFile.
+        lazy : bool
+            If True, only the parameters are parsed up front. The conditional
+            statements, forbidden clauses and comments are parsed the first 
+            time that any of them (or the document) is needed, so any errors
+            in them are only reported then (and again every time that any of
+            them is needed after that). If a cache file was written in lazy
+            mode and is loaded with lazy=False, the remaining lines are parsed
+            when it is loaded, and the cache file is replaced.
+        workers : None or int
+            If greater than 1, the file is parsed by a pool of this many 
+            processes, see parseDoc. The result is identical to parsing the 
+            file in this process. Since the parsed "objects" still have to be
+            unpickled by this process, this is only worthwhile for very large
+            files on machines with several idle cores.
+        instrument : None or int
+            If not None, instrumentation is enabled before the file is parsed,
+            and every instrument-th call to each instrumented function is 
+            timed, see enableInstrumentation.
+        """
+        self.initAttributes()
+        if(instrument is not None):
+            self.enableInstrumentation(instrument)
+        #The file that the space was parsed from, which reload() reads again.
+        self.infile = infile
+
+        if(cache is None):
+            self.parseDoc(infile,lazy=lazy,workers=workers)
+        else:
+            with open(infile,'rb') as f_in:
+                data = f_in.read()
+            digest = hashlib.sha256(data).hexdigest()
+            cacheFile = self.getCacheFile(infile,cache,digest)
+            if(not self.loadCache(cacheFile,digest)):
+                #Parse exactly the contents that were hashed, decoded the same
+                #way that open() would decode them.
+                self.parseDoc(infile,io.TextIOWrapper(io.BytesIO(data)),lazy,workers)
+                self.saveCache(cacheFile,digest)
+            elif(not lazy and 'lazyDocument' in self.__dict__):
+                #The cache file was written in lazy mode. Parse the remaining
+                #lines now, so that any errors in them are raised here, and 
+                #store the complete space for next time.
+                self.parseLazyLines()
+                self.saveCache(cacheFile,digest)
+            #The cache file may have been written for a copy of infile.
+            self.infile = infile
+
+    def initAttributes(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Creates the attributes of an empty space. 
+        #Create the "memory" object and the allocator for the IDs of the
+        #"objects" stored in it.
+        self.mem = ObjectMemory()
+        self.idCounter = itertools.count()
         #Create lists for each group of "objects"
         self.paramList = []
+        #Maps parameter names to their IDs
+        self.paramIndex = {}
         self.conditionList = []
+        #Map parameter IDs to the conditions in which they appear as the child
+        #or as a parent (anywhere in the clause), respectively.
+        self.conditionsByChild = {}
+        self.conditionsByParent = {}
         self.forbiddenList = []
         self.valueList = []
         self.commentList = []
+        #Caches of things derived from the above, see clearCaches().
+        self.compiledClauses = {}
+        self.paramPositions = None
+        self.topologicalOrder = None
+        self.activityPlan = None
+        self.descendantPlans = {}
+        self.forbiddenPlan = None
+        self.textCodes = {}
+        self.configurationCodec = None
+        self.conditionCaches = {}
+        #The maximum number of entries in the cache of each conditional 
+        #statement, or None if they are not cached, see 
+        #setConditionCacheSize().
+        self.conditionCacheSize = None
+        #The timings and call counts recorded by the instrumented functions,
+        #and how often they are sampled (None if instrumentation is 
+        #disabled), see enableInstrumentation().
+        self.instrumentationStats = {}
+        self.instrumentationSampling = None
+
+    def __getstate__(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the attributes that are pickled, i.e., everything but the 
+        #caches of derived state (which may hold compiled functions), see 
+        #uncachedAttributes, and the instrumented functions.
+        state = {}
+        for attr in self.__dict__:
+            if(attr not in PCS.uncachedAttributes and attr not in PCS.instrumentedFunctions):
+                state[attr] = self.__dict__[attr]
+        state['nextID'] = self.nextID()
+        return state
+
+    def __setstate__(self, state):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Restores the attributes returned by __getstate__, with empty caches.
+        state = dict(state)
+        nextID = state.pop('nextID')
+        self.compiledClauses = {}
+        self.descendantPlans = {}
+        self.textCodes = {}
+        self.conditionCaches = {}
+        self.conditionCacheSize = None
+        #Keep recording if instrumentation was enabled before the state was
+        #loaded (see loadCache).
+        self.instrumentationStats = self.__dict__.get('instrumentationStats',{})
+        self.instrumentationSampling = self.__dict__.get('instrumentationSampling')
+        self.clearCaches()
+        self.__dict__.update(state)
+        self.idCounter = itertools.count(nextID)
+
+    def getCacheFile(self,infile,cache,digest):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the name of the cache file for infile. Cache files stored next
+        #to infile are named after it, whereas cache files in a cache directory
+        #are named after the hash of the contents of infile, so that several
+        #files can share one directory.
+        if(cache is True):
+            return infile + PCS.cacheSuffix
+        return os.path.join(cache, digest + PCS.cacheSuffix)
+
+
+    def loadCache(self,cacheFile,digest):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Loads the parsed space from the cache file and returns True, or 
+        #returns False if the cache file does not exist, is unreadable, was
+        #written for a different file or with a different cache format, or 
+        #could have been written by another user (see isTrustedCacheFile).
+        #Unpickling creates a very large number of objects, which would 
+        #otherwise trigger the cyclic garbage collector over and over again.
+        gcEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(cacheFile,'rb') as f_in:
+                if(not self.isTrustedCacheFile(cacheFile,f_in)):
+                    logger.warning('Ignoring the cache file "%s", because it or its directory belongs to another user or can be written by other users.',cacheFile)
+                    return False
+                (cacheFormat, cacheDigest) = pickle.load(f_in)
+                if(cacheFormat != PCS.cacheFormat or cacheDigest != digest):
+                    return False
+                state = pickle.load(f_in)
+        except Exception:
+            return False
+        finally:
+            if(gcEnabled):
+                gc.enable()
+        self.__setstate__(state)
+        return True
+
+
+    def isTrustedCacheFile(self,cacheFile,f_in):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns True if the open cache file f_in, and the directory that it
+        #is in, belong to the current user and cannot be written by the group
+        #or by other users, so that nobody else could have put a malicious 
+        #pickle there. The file is checked through f_in, so it cannot be 
+        #swapped after the check. Ownership cannot be checked this way on 
+        #systems without user IDs (i.e., Windows), where this always returns
+        #True.
+        if(not hasattr(os,'getuid')):
+            return True
+        uid = os.getuid()
+        for info in [os.fstat(f_in.fileno()),os.stat(os.path.dirname(os.path.abspath(cacheFile)))]:
+            if(info.st_uid != uid or info.st_mode & 0o022):
+                return False
+        return True
+
+
+    def saveCache(self,cacheFile,digest):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Stores the parsed space in the cache file. The file is written under a
+        #temporary name and then renamed, so that other processes never read a
+        #partially written cache file, even if several of them write it at the
+        #same time. Failing to write the cache is not an error. The cache 
+        #directory is created if it does not exist.
+        state = self.__getstate__()
+        directory = os.path.dirname(os.path.abspath(cacheFile))
+        try:
+            #A new cache directory is only accessible to the current user.
+            os.makedirs(directory,mode=0o700,exist_ok=True)
+            (fd, tmpFile) = tempfile.mkstemp(dir=directory,prefix='.tmp-',suffix=PCS.cacheSuffix)
+        except OSError:
+            logger.warning('Unable to write the cache file "%s".',cacheFile)
+            return
+        try:
+            with os.fdopen(fd,'wb') as f_out:
+                pickle.dump((PCS.cacheFormat, digest),f_out,pickle.HIGHEST_PROTOCOL)
+                pickle.dump(state,f_out,pickle.HIGHEST_PROTOCOL)
+            #mkstemp creates files that only the owner can read.
+            os.chmod(tmpFile,0o644)
+            os.replace(tmpFile,cacheFile)
+        except Exception:
+            logger.warning('Unable to write the cache file "%s".',cacheFile)
+            if(os.path.exists(tmpFile)):
+                os.remove(tmpFile)
 
-        self.parseDoc(infile)
 
-    def parseDoc(self,infile):
+    def parseDoc(self,infile,f_in=None,lazy=False,workers=None):
         """parseDoc
 
         This function parses a parameter configuration space file of the format
         used by GPS and SMAC.
 
+        Each line is read once and classified by classifyLine(), which also
+        extracts the fields of the common parameter declarations so that they
+        can be turned into parameters without parsing the line a second time.
+        The comments, conditional statements and forbidden clauses are parsed
+        in a second pass, once all of the parameters are known.
+
         Note: parameter values may not contain parameter names as a substring. 
  
         Parameters
         ----------
         infile : str
             The name and location of the parameter configuration space file to parse
+        f_in : file object or None
+            If not None, the lines of the file are read from f_in instead of 
+            opening infile.
+        lazy : bool
+            If True, the lines that do not contain parameters are only parsed
+            when they are first needed, see parseLazyLines().
+        workers : None or int
+            If greater than 1, both passes split the lines into chunks that
+            are parsed by a pool of this many processes. The "objects" created
+            for each chunk are then given the same IDs that they would have 
+            been given by parsing the file in this process, see 
+            parseParameterLinesInParallel() and 
+            parseDocumentLinesInParallel().
         """
         #An array of IDs that represents the parameter configuration space document.
-        self.doc = self.newObject()
+        self.doc = self.newObject('document')
         #Set the type of the document "object"
         self.doc['type'] = 'document'
         #initialize the contents of the document
         self.doc['content'] = []
-    
-        with open(infile) as f_in:
+        #Maps the IDs in the contents to the text of the lines that they were
+        #parsed from, see applyDiff().
+        self.doc['source'] = {}
+
+        parallel = workers is not None and workers > 1
+        if(f_in is None):
+            f_in = open(infile)
+        with f_in:
             #Pass through the document once to tag each line, and parse the
             #lines that contain parameters.
-            for line in f_in:
-                line = line.strip()
-                if(re.search('^' + PCS.lineEnd,line)):
-                    #We have a comment line or an empty line
-                    #f_out.write(line + '#Empty line or comment\n')
-                    #object = self.parseComment(line)
-                    self.doc['content'].append(['comment',line])
-                elif(re.search('^.+? real *\[-?([0-9]|\.|(e-?\+?))+?, *-?([0-9]|\.|(e-?\+?))+?\] *\[-?([0-9]|\.|(e-?\+?))+\] *(log)?' + PCS.lineEnd,line)):
-                    #We have a real parameter
-                    #Note: this does not completely validate the string, since
-                    #we may still have something like 10.0.0 as a value,
-                    #Or, the default value may not be in the specified range. 
-                    #f_out.write(line + '#Real parameter\n')
-                    obj = self.parseReal(line)
-                    self.doc['content'].append(obj['id'])
-                elif(re.search('^.+? integer *\[-?([0-9])+?, *-?([0-9])+?\] *\[-?([0-9])+\] *(log)?' + PCS.lineEnd,line)):
-                    #We have an integer parameter
-                    #f_out.write(line + '#integer parameter\n')
-                    obj = self.parseInteger(line)
-                    self.doc['content'].append(obj['id'])
-                elif(re.search('^.+? categorical *{.+?} *\[.+?\]' + PCS.lineEnd,line)):
-                    #We have a categorical parameter
-                    #f_out.write(line + '#categorical parameter\n')
-                    obj = self.parseCategorical(line)
-                    self.doc['content'].append(obj['id'])
-                elif(re.search('^.+? ordinal *{.+?} *\[.+?\]' + PCS.lineEnd,line)):
-                    #we have an ordinal parameter
-                    #f_out.write(line + '#ordinal parameter\n')
-                    obj = self.parseOrdinal(line)
-                    self.doc['content'].append(obj['id'])
-                elif(re.search('^.+? *\[-?([0-9]|\.|(e-?))+?, *-?([0-9]|\.|(e-?))+?\] *\[-?([0-9]|\.|(e-?))+\] *l?' + PCS.lineEnd,line)):
-                    #We have a real parameter in the old syntax
-                    obj = self.parseRealOldSyntax(line)
-                    self.doc['content'].append(obj['id'])
-                elif(re.search('^.+? *\[-?([0-9])+?, *-?([0-9])+?\] *\[-?([0-9])+\] *l?il?' + PCS.lineEnd,line)):
-                    #We have an integer parameter in the old syntax
-                    obj = self.parseIntegerOldSyntax(line)
-                    self.doc['content'].append(obj['id'])
-                elif(re.search('^.+? *{.+?} *\[.+?\]' + PCS.lineEnd,line)):
-                    #We have a categorical parameter in the old syntax
-                    obj = self.parseCategoricalOldSyntax(line)
-                    self.doc['content'].append(obj['id'])
-                elif(re.search('^.+? \| .+? ((==)|((!=)|((in)|(<|>)))) .+?( (((&&)|(\|\|)) .+? ((==)|((!=)|((in)|(<|>)))) .+?))*' + PCS.lineEnd,line)):
-                    #We have a conditional statement
-                    #f_out.write(line + '#conditional statement\n')
-                    #object = parseConditional(line)
-                    self.doc['content'].append(['conditional',line])
-                elif(re.search('^ *{.+?}' + PCS.lineEnd,line)):
-                    #We have a forbidden clause
-                    #f_out.write(line + '#Forbidden clause\n')
-                    #object = parseForbidden(line)
-                    self.doc['content'].append(['forbidden',line])
-                else:
-                    #f_out.write(line + '#Unknown line\n')
-                    print('[Warning]: The following unrecognized line in the parameter configuration space file "' + infile + '" is being converted to a comment and we are attempting to continue.')
-                    print(line)
-                    #object = self.parseComment('#' + line)
-                    self.doc['content'].append(['comment','#' + line])
+            if(parallel):
+                self.parseParameterLinesInParallel(f_in.readlines(),infile,workers)
+            else:
+                self.parseParameterLines(f_in,infile,self.doc['content'],self.doc['source'])
+
+        if(lazy):
+            #Put the document and the comments of the parameters aside, and 
+            #remove the attributes that the remaining lines are parsed into, 
+            #so that __getattr__ parses them when they are first accessed.
+            self.lazyDocument = (self.__dict__.pop('doc'),self.__dict__.pop('commentList'))
+            for attr in PCS.lazyAttributes:
+                self.__dict__.pop(attr,None)
+            return
+
+        if(parallel):
+            self.parseDocumentLinesInParallel(workers)
+        else:
+            self.parseDocumentLines()
+
+
+    def parseParameterLines(self,lines,infile,content,source,lineNumbers=None):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #The first pass of parseDoc. Classifies each line, parses the lines
+        #that contain parameters and appends the ID of each parameter, or the
+        #raw line tagged with its kind for all other lines, to content. The
+        #(stripped) text of each parameter line is stored in source. The text
+        #of the other lines is the last item of their raw line. lineNumbers
+        #gives the number of each line in infile (by default, the lines are 
+        #numbered from 1), which is stored in any PCSParseError that is 
+        #raised.
+        if(lineNumbers is None):
+            lineNumbers = itertools.count(1)
+        parsers = {'real':self.parseReal,
+                   'integer':self.parseInteger,
+                   'categorical':self.parseCategorical,
+                   'ordinal':self.parseOrdinal,
+                   'realOldSyntax':self.parseRealOldSyntax,
+                   'integerOldSyntax':self.parseIntegerOldSyntax,
+                   'categoricalOldSyntax':self.parseCategoricalOldSyntax}
+
+        for (lineNumber,line) in zip(lineNumbers,lines):
+            line = line.strip()
+            (kind, fields) = self.classifyLine(line)
+            if(kind == 'comment'):
+                #We have a comment line or an empty line
+                content.append(['comment',line])
+            elif(kind in parsers):
+                try:
+                    if(fields is not None):
+                        #The classifier already extracted everything we need.
+                        obj = self.parseParameterFields(kind,fields,line)
+                    else:
+                        obj = parsers[kind](line)
+                except Exception as error:
+                    raise self.parseError(error,None,line,kind,lineNumber,infile)
+                content.append(obj['id'])
+                source[obj['id']] = line
+            elif(kind == 'conditional'):
+                #We have a conditional statement
+                content.append(['conditional',line])
+            elif(kind == 'forbidden'):
+                #We have a forbidden clause
+                content.append(['forbidden',line])
+            else:
+                logger.warning('The following unrecognized line %d in the parameter configuration space file "%s" is being converted to a comment and we are attempting to continue: %s',lineNumber,infile,line)
+                content.append(['comment','#' + line,line])
 
+
+    def parseDocumentLines(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #The second pass of parseDoc, which parses the comments, conditional
+        #statements and forbidden clauses that were left in the document as 
+        #raw lines, and then checks the document.
         for i in range(0,len(self.doc['content'])):
             line = self.doc['content'][i]
             if(isinstance(line,list)):
                 #This line has not yet been parsed.
-                if(line[0] == 'comment'):
-                    obj = self.parseComment(line[1])
-                elif(line[0] == 'conditional'):
-                    obj = self.parseConditional(line[1])
-                elif(line[0] == 'forbidden'):
-                    obj = self.parseForbidden(line[1])
-                else:
-                    print('[Error] The following line has an unknown type.')
-                    print(line)
-                    raise Exception('Unknown line type.')
                 #Replace the line with the now parsed object id. 
-                self.doc['content'][i] = obj['id']
+                self.doc['content'][i] = self.parseRawLine(line,i+1)['id']
+                self.doc['source'][self.doc['content'][i]] = line[-1]
 
 
         #Do some (non-exhaustive) checks to see if this is a valid document
         self.testDocumentCorrectness()
- 
+
+
+    def parseRawLine(self,line,lineNumber=None):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Parses a line that was left in the document by the first pass of 
+        #parseDoc, given as [kind, text], and returns the new "object". 
+        #lineNumber is the number of the line in the file, if known, which is
+        #stored in any PCSParseError that is raised.
+        try:
+            if(line[0] == 'comment'):
+                return self.parseComment(line[1])
+            elif(line[0] == 'conditional'):
+                return self.parseConditional(line[1])
+            elif(line[0] == 'forbidden'):
+                return self.parseForbidden(line[1])
+            else:
+                raise PCSParseError('Unknown line type.')
+        except Exception as error:
+            raise self.parseError(error,None,line[-1],line[0],lineNumber)
+
+
+    def parseError(self,error,message=None,line=None,kind=None,lineNumber=None,infile=None):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a PCSParseError for an exception that was raised while 
+        #parsing a line, to be raised in its place. Other exceptions are 
+        #wrapped in a new PCSParseError (with message in front of their 
+        #message, if given), whereas a PCSParseError is returned as it is. 
+        #Either way, any information about where the error occurred that it
+        #does not have yet is filled in. infile defaults to the file that the
+        #space was parsed from.
+        if(not isinstance(error,PCSParseError)):
+            cause = error
+            if(message is None):
+                message = str(cause)
+            else:
+                message = message.rstrip('.') + ': ' + str(cause)
+            error = PCSParseError(message)
+            error.__cause__ = cause
+        if(infile is None):
+            infile = getattr(self,'infile',None)
+        for (attr,value) in [('infile',infile),('lineNumber',lineNumber),('line',line),('kind',kind)]:
+            if(getattr(error,attr) is None):
+                setattr(error,attr,value)
+        return error
+
+
+    def parseParameterLinesInParallel(self,lines,infile,workers):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #The first pass of parseDoc, run by a pool of processes. Each process
+        #parses a contiguous chunk of the lines into an empty space (see 
+        #parseParameterChunk), creating its "objects" in the same order in
+        #which they would have been created here. loadChunk then gives them
+        #the next free IDs, in that order, so they get exactly the IDs of a 
+        #serial parse.
+        chunks = self.splitChunks(lines,workers)
+        #As in loadCache, keep the cyclic garbage collector from running over
+        #and over again while the results are unpickled and merged.
+        gcEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+                starts = itertools.accumulate([0] + [len(chunk) for chunk in chunks])
+                results = pool.map(parseParameterChunk,[type(self)]*len(chunks),[infile]*len(chunks),chunks,starts)
+                for data in results:
+                    (content,objects,params,values,comments,source) = self.loadChunk(data)
+                    self.doc['content'].extend(content)
+                    self.doc['source'].update(source)
+                    for param in params:
+                        self.addParameter(param)
+                    self.valueList.extend(values)
+                    self.commentList.extend(comments)
+        finally:
+            if(gcEnabled):
+                gc.enable()
+
+
+    def parseDocumentLinesInParallel(self,workers):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #The second pass of parseDoc, run by a pool of processes. Every 
+        #process starts from a copy of the space with all of its parameters,
+        #and parses contiguous chunks of the remaining lines (see 
+        #parseDocumentChunk). As in parseParameterLinesInParallel, loadChunk
+        #then gives the new "objects" of each chunk the next free IDs.
+        content = self.doc['content']
+        source = self.doc['source']
+        pending = [i for i in range(0,len(content)) if isinstance(content[i],list)]
+        chunks = self.splitChunks(pending,workers)
+        start = self.nextID()
+        gcEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            with concurrent.futures.ProcessPoolExecutor(workers,initializer=initDocumentWorker,initargs=(self,start)) as pool:
+                results = pool.map(parseDocumentChunk,[[content[i] for i in chunk] for chunk in chunks],chunks)
+                for (chunk,data) in zip(chunks,results):
+                    (ids,objects,conditions,parents,forbiddens,comments,values) = self.loadChunk(data)
+                    for (i,oid) in zip(chunk,ids):
+                        source[oid] = content[i][-1]
+                        content[i] = oid
+                    for (condition,pids) in zip(conditions,parents):
+                        self.conditionList.append(condition)
+                        self.indexConditional(condition,pids)
+                    self.forbiddenList.extend(forbiddens)
+                    self.commentList.extend(comments)
+                    self.valueList.extend(values)
+        finally:
+            if(gcEnabled):
+                gc.enable()
+        self.forbiddenPlan = None
+
+        #Do some (non-exhaustive) checks to see if this is a valid document
+        self.testDocumentCorrectness()
+
+
+    def parseDocumentChunk(self,lines,positions):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Run by the processes of the pool used by parseDocumentLinesInParallel
+        #on their copy of the space. Parses the raw lines with IDs that start
+        #at the next free ID of the original space, and removes the new 
+        #"objects" again, so that every chunk starts from the same state.
+        #positions are the indices of the lines in the document. Returns the
+        #IDs of the "objects" for the lines, all of the new "objects" in the
+        #order in which they were created, the new conditional statements, 
+        #the IDs of the parameters in each of their clauses and the new 
+        #forbidden clauses, comments and values.
+        start = self.chunkStart
+        self.idCounter = itertools.count(start)
+        self.conditionList = []
+        self.forbiddenList = []
+        self.commentList = []
+        self.valueList = []
+        ids = [self.parseRawLine(line,i+1)['id'] for (line,i) in zip(lines,positions)]
+        parents = [self.getClauseParameters(condition['clauses']) for condition in self.conditionList]
+        objects = [self.mem.pop(ObjectID(i)) for i in range(start,self.nextID())]
+        self.conditionsByChild = {}
+        self.conditionsByParent = {}
+        self.clearCaches()
+        return (ids,objects,self.conditionList,parents,self.forbiddenList,self.commentList,self.valueList)
+
+
+    def splitChunks(self,items,workers):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Splits a list into contiguous chunks, a few per worker, so that the
+        #work stays balanced even if some lines take longer to parse.
+        size = max(1,-(-len(items)//(4*workers)))
+        return [items[i:i+size] for i in range(0,len(items),size)]
+
+
+    def nextID(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the ID that the next "object" will be given.
+        nextID = next(self.idCounter)
+        self.idCounter = itertools.count(nextID)
+        return nextID
+
+
+    def loadChunk(self,data):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Unpickles the result of parsing a chunk of lines in another process
+        #(see dumpChunk), and stores the "objects" that were created for the
+        #chunk in memory. The new "objects" are given the next free IDs, in
+        #the order in which they were created, and every reference to them is
+        #updated as it is unpickled.
+        (numObjects,data) = data
+        base = self.nextID()
+        ids = list(map(ObjectID,range(base,base + numObjects)))
+        unpickler = pickle.Unpickler(io.BytesIO(data))
+        unpickler.persistent_load = ids.__getitem__
+        result = unpickler.load()
+        #The "objects" are always the second item of the result.
+        self.mem.update(zip(ids,result[1]))
+        self.idCounter = itertools.count(base + numObjects)
+        return result
+
+
+    def parseLazyLines(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Parses the lines that were skipped by parseDoc in lazy mode, all at 
+        #once. If that fails, the document has already been partially 
+        #converted, so it cannot be parsed again. Instead, the lazy 
+        #attributes are removed again and the error is stored in lazyError,
+        #so that every later access to any of them raises it as well.
+        (doc,comments) = self.__dict__.pop('lazyDocument')
+        self.conditionList = []
+        self.conditionsByChild = {}
+        self.conditionsByParent = {}
+        self.forbiddenList = []
+        self.commentList = comments
+        self.doc = doc
+        try:
+            self.parseDocumentLines()
+        except Exception as error:
+            for attr in PCS.lazyAttributes:
+                self.__dict__.pop(attr,None)
+            self.lazyError = error
+            raise
+
+
+    def __getattr__(self,name):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Only called for attributes that do not exist, i.e., for the 
+        #attributes of a lazily parsed space that have not been parsed yet.
+        if(name in PCS.lazyAttributes and 'lazyError' in self.__dict__):
+            raise self.lazyError
+        if(name in PCS.lazyAttributes and 'lazyDocument' in self.__dict__):
+            self.parseLazyLines()
+            return self.__dict__[name]
+        raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+
+
+    def classifyLine(self,line):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Works out what kind of line we have with as little work as possible.
+        #Returns a tuple (kind, fields). kind is one of 'comment', 'real',
+        #'integer', 'categorical', 'ordinal', 'realOldSyntax',
+        #'integerOldSyntax', 'categoricalOldSyntax', 'conditional',
+        #'forbidden' or 'unknown'. If the line is a parameter declaration
+        #in one of the common forms, fields is a dict with its name, type,
+        #lower, upper, values, default, flag and comment, otherwise it is None.
+        #The line should already be stripped.
+        if(len(line) == 0 or line[0] == '#'):
+            return ('comment',None)
+
+        match = PCS.paramLine.match(line)
+        if(match):
+            fields = match.groupdict()
+            kind = self.checkParamFields(fields)
+            if(kind is not None):
+                return (kind,fields)
+
+        #Fall back on the original patterns, which handle all of the less
+        #common spacing and formatting variations. Every parameter pattern
+        #requires a '[' for the default value, so we can skip them otherwise.
+        if('[' in line):
+            patterns = PCS.linePatterns
+        else:
+            patterns = PCS.linePatterns[-2:]
+        for (kind,pattern) in patterns:
+            if(pattern.search(line)):
+                return (kind,None)
+
+        return ('unknown',None)
+
+
+    def checkParamFields(self,fields):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for classifyLine. Checks that the fields matched by
+        #paramLine form a parameter that the original patterns would have
+        #accepted, and returns the kind of the parameter, or None if the line
+        #needs to be handled by the original patterns.
+        paramType = fields['type']
+        flag = fields['flag']
+        bounds = [fields['lower'],fields['upper'],fields['default']]
+        if(paramType in ['real','integer']):
+            if(fields['values'] is not None or flag not in ['','log']):
+                return None
+            if(paramType == 'real'):
+                number = PCS.realNumber
+            else:
+                number = PCS.integerNumber
+            for bound in bounds:
+                if(not number.match(bound)):
+                    return None
+            return paramType
+        elif(paramType in ['categorical','ordinal']):
+            if(fields['values'] is None or not flag == '' or fields['gap'] == ''):
+                return None
+            return paramType
+        elif(fields['values'] is not None):
+            if(not flag == ''):
+                return None
+            return 'categoricalOldSyntax'
+        elif(flag in ['','l']):
+            for bound in bounds:
+                if(not PCS.realNumberOldSyntax.match(bound)):
+                    return None
+            return 'realOldSyntax'
+        elif(flag in ['i','il','li','lil']):
+            for bound in bounds:
+                if(not PCS.integerNumber.match(bound)):
+                    return None
+            return 'integerOldSyntax'
+        return None
+
+
+    def parseParameterFields(self,kind,fields,line):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Creates and returns a dict object for the parameter whose fields were
+        #extracted by classifyLine(). This produces the same object as the
+        #corresponding parse function (e.g., parseReal or
+        #parseCategoricalOldSyntax) would for the line, without re-parsing it.
+        param = self.newObject(kind.replace('OldSyntax',''))
+        param['name'] = fields['name']
+        param['type'] = kind.replace('OldSyntax','')
+        if(param['type'] in ['real','integer']):
+            if(param['type'] == 'real'):
+                cast = float
+            else:
+                cast = int
+            try:
+                param['values'] = [cast(fields['lower']), cast(fields['upper'])]
+            except Exception as error:
+                raise self.parseError(error,'Failed to parse the range of values.',line)
+            try:
+                param['default'] = cast(fields['default'])
+            except Exception as error:
+                raise self.parseError(error,'Failed to parse the default value.',line)
+            #Check if the default value is within the specified range.
+            if(not (param['default'] >= param['values'][0] and param['default'] <= param['values'][1])):
+                raise PCSParseError('The default value for ' + param['name'] + ' does not fall within the specified range.',line=line.strip())
+            #Check for a log scale
+            if(kind == 'realOldSyntax'):
+                param['log'] = fields['flag'] == 'l'
+            elif(kind == 'integerOldSyntax'):
+                param['log'] = fields['flag'] in ['il','li']
+            else:
+                param['log'] = fields['flag'] == 'log' and PCS.logPattern.search(line) is not None
+        else:
+            #Remove any whitespace and create value objects.
+            keyValuePair = {}
+            values = fields['values'].split(',')
+            for i in range(0,len(values)):
+                keyValuePair[values[i].strip()] = self.parseValue(values[i])
+                values[i] = keyValuePair[values[i].strip()]['id']
+            param['values'] = values
+            #Grab the default value
+            try:
+                param['default'] = keyValuePair[fields['default'].strip()]['id']
+            except Exception as error:
+                raise self.parseError(error,'Failed to parse the default value.',line)
+        #Grab any trailing comments
+        if(fields['comment'] is not None):
+            comment = self.parseComment(fields['comment'].split('#')[0].strip())
+            param['comment'] = comment['id']
+        else:
+            param['comment'] = ''
+
+        #Store the parameter in the parameter list and the name index
+        self.addParameter(param)
+
+        return param
+
 
     def parseIntegerOldSyntax(self,line):
         #Author: Yasha Pushal
         #Create: February 21st, 2018
-        #Last udpated: F2019-03-06
+        #Last udpated: 2026-10-18
         #parses and returns a dict object containing the information about the integer parameter
         #stored in the line in the old syntax.
 
         #Create the object
-        param = self.newObject()
+        param = self.newObject('integer')
         #set the type
         param['type'] = 'integer'
         #get the paramter name
@@ -161,24 +1106,18 @@ class PCS:
         values = line.split('[')[1].split(']')[0].split(',')
         try:
             param['values'] = [int(values[0]), int(values[1])]
-        except:
-            print('[Error]: Failed to parse the range of values for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the range of values.',line)
         #Grab the default value
         try:
             param['default'] = int(line.split('[')[2].split(']')[0])
-        except:
-            print('[Error]: Failed to parse the default value for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the default value.',line)
         #Check if the default value is within the specified range. 
         if(not (param['default'] >= param['values'][0] and param['default'] <= param['values'][1])):
-            print('[Error]: The default value for ' + param['name'] + ' does not fall within the specified range:')
-            print(line.strip())
-            raise Exception('The default value for ' + param['name'] + ' does not fall within the specified range.')
+            raise PCSParseError('The default value for ' + param['name'] + ' does not fall within the specified range.',line=line.strip())
         #Check for a log scale
-        if(re.search('^.+? *\[-?([0-9])+?, *-?([0-9])+?\] *\[-?([0-9])+\] *il' + PCS.lineEnd,line) or re.search('^.+? *\[-?([0-9])+?, *-?([0-9])+?\] *\[-?([0-9])+\] *li' + PCS.lineEnd,line)):
+        if(PCS.logPatternsOldInteger[0].search(line) or PCS.logPatternsOldInteger[1].search(line)):
             param['log'] = True
         else:
             param['log'] = False
@@ -188,8 +1127,8 @@ class PCS:
             param['comment'] = comment['id']
         else:
             param['comment'] = ''
-        #Store the parameter in the parameter list
-        self.paramList.append(param)
+        #Store the parameter in the parameter list and the name index
+        self.addParameter(param)
 
         return param
 
@@ -198,12 +1137,12 @@ class PCS:
     def parseRealOldSyntax(self,line):
         #Author: Yasha Pushal
         #Create: February 21st, 2018
-        #Last udpated: 2019-03-06
+        #Last udpated: 2026-10-18
         #parses and returns a dict object containing the information about the real parameter
         #stored in the line in the old syntax.
  
         #Create the object
-        param = self.newObject()
+        param = self.newObject('real')
         #set the type
         param['type'] = 'real'
         #get the paramter name
@@ -212,24 +1151,18 @@ class PCS:
         values = line.split('[')[1].split(']')[0].split(',')
         try:
             param['values'] = [float(values[0]), float(values[1])]
-        except:
-            print('[Error]: Failed to parse the range of values for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the range of values.',line)
         #Grab the default value
         try:
             param['default'] = float(line.split('[')[2].split(']')[0])
-        except:
-            print('[Error]: Failed to parse the default value for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the default value.',line)
         #Check if the default value is within the specified range. 
         if(not (param['default'] >= param['values'][0] and param['default'] <= param['values'][1])):
-            print('[Error]: The default value for ' + param['name'] + ' does not fall within the specified range:')
-            print(line.strip())
-            raise Exception('The default value for ' + param['name'] + ' does not fall within the specified range.')
+            raise PCSParseError('The default value for ' + param['name'] + ' does not fall within the specified range.',line=line.strip())
         #Check for a log scale
-        if(re.search('^.+? *\[-?([0-9]|\.|(e-?))+?, *-?([0-9]|\.|(e-?))+?\] *\[-?([0-9]|\.|(e-?))+\] *l' + PCS.lineEnd,line)):
+        if(PCS.logPatternOldSyntax.search(line)):
             param['log'] = True
         else:
             param['log'] = False
@@ -239,8 +1172,8 @@ class PCS:
             param['comment'] = comment['id']
         else:
             param['comment'] = ''
-        #Store the parameter in the parameter list
-        self.paramList.append(param)
+        #Store the parameter in the parameter list and the name index
+        self.addParameter(param)
 
         return param
 
@@ -249,12 +1182,10 @@ class PCS:
     def parseCategoricalOldSyntax(self,line):
         #Author: Yasha Pushak
         #Created: February 21st, 2018
-        #Last updated: February 21st, 2018
+        #Last updated: 2026-10-18
         #Parses and returns a dict object containing the information about the 
         #categorical parameter stored in the line in the old syntax
-        param = {}
-        #Create an ID for the parameter
-        param['id'] = self.getID()
+        param = self.newObject('categorical')
         #get the parameter name
         param['name'] = line.split(' ')[0].split('{')[0].strip()
         #get the parameter type
@@ -271,14 +1202,10 @@ class PCS:
         try:
             param['default'] = keyValuePair[line.split('[')[1].split(']')[0].strip()]['id']
 
-        except:
-            print('[Error]: Failed to parse the default value for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the default value.',line)
         if(param['default'] not in param['values']):
-            print('[Error]: The default value for ' + param['name'] + ' does not fall within the specified set of values:')
-            print(line.strip())
-            raise Exception('The default value for ' + param['name'] + ' does not fall within the specified set of values.')
+            raise PCSParseError('The default value for ' + param['name'] + ' does not fall within the specified set of values.',line=line.strip())
         #Grab any trailing comments
         if(len(line.split('#'))>1):
             comment = self.parseComment(line.split('#')[1].strip())
@@ -286,10 +1213,8 @@ class PCS:
         else:
             param['comment'] = ''
 
-        #Add the new object to memory.
-        self.mem[param['id']] = param
-        #store the parameter in the parameter list
-        self.paramList.append(param)
+        #Store the parameter in the parameter list and the name index
+        self.addParameter(param)
 
         return param
 
@@ -297,42 +1222,32 @@ class PCS:
 
     def parseReal(self,line):
         #Author: Yasha Pushak
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Parses and returns a dict object containing the information about the real
         #parameter stored in the line.
-        param = {}
-        #Create an ID for the parameter
-        param['id'] = self.getID()
+        param = self.newObject('real')
         #get the parameter name
         param['name'] = line.split(' ')[0].strip()
         #get the parameter type
         param['type'] = line.split(' ')[1].split('[')[0].strip()
         if(not param['type'] == 'real'):
-            print('[Error]: Called parseReal() on non-real parameter:')
-            print(line.strip())
-            raise Exception('Called parseReal() on non-real parameter.')
+            raise PCSParseError('Called parseReal() on non-real parameter.',line=line.strip())
         #Get the range of values
         values = line.split('[')[1].split(']')[0].split(',')
         try:
             param['values'] = [float(values[0]), float(values[1])]
-        except:
-            print('[Error]: Failed to parse the range of values for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the range of values.',line)
         #Grab the default value
         try: 
             param['default'] = float(line.split('[')[2].split(']')[0])
-        except:
-            print('[Error]: Failed to parse the default value for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the default value.',line)
         #Check if the default value is within the specified range. 
         if(not (param['default'] >= param['values'][0] and param['default'] <= param['values'][1])):
-            print('[Error]: The default value for ' + param['name'] + ' does not fall within the specified range:')
-            print(line.strip())
-            raise Exception('The default value for ' + param['name'] + ' does not fall within the specified range.')
+            raise PCSParseError('The default value for ' + param['name'] + ' does not fall within the specified range.',line=line.strip())
         #check if this parameter should be searched on a log scale.
-        if(re.search('^.+? .+? *\[([0-9]|\.)+?, *([0-9]|\.)+?\] *\[([0-9]|\.)+\] *log' + PCS.lineEnd,line)):
+        if(PCS.logPattern.search(line)):
             param['log'] = True
         else:
             param['log'] = False
@@ -343,52 +1258,40 @@ class PCS:
         else:
             param['comment'] = ''
 
-        #Add the new object to memory
-        self.mem[param['id']] = param
-        #Store the parameter in the parameter list
-        self.paramList.append(param)
+        #Store the parameter in the parameter list and the name index
+        self.addParameter(param)
 
         return param
  
 
     def parseInteger(self,line):
         #Author: Yasha Pushak
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Parses and returns a dict object containing the information about the real
         #parameter stored in the line.
-        param = {}
-        #Create an ID for the parameter
-        param['id'] = self.getID()
+        param = self.newObject('integer')
         #get the parameter name
         param['name'] = line.split(' ')[0].strip()
         #get the parameter type
         param['type'] = line.split(' ')[1].split('[')[0].strip()
         if(not param['type'] == 'integer'):
-            print('[Error]: called parseInteger() on non-integer parameter:')
-            print(line.strip())
-            raise Exception('Called parseInteger() on a non-integer parameter.')
+            raise PCSParseError('Called parseInteger() on a non-integer parameter.',line=line.strip())
         #Get the range of values
         values = line.split('[')[1].split(']')[0].split(',')
         try:
             param['values'] = [int(values[0]), int(values[1])]
-        except:
-            print('[Error]: Failed to parse the range of values for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the range of values.',line)
         #Grab the default value
         try:
             param['default'] = int(line.split('[')[2].split(']')[0])
-        except:
-            print('[Error]: Failed to parse the default value for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the default value.',line)
         #check that the default value is within the specifeid range. 
         if(not (param['default'] >= param['values'][0] and param['default'] <= param['values'][1])):
-            print('[Error]: The default value for ' + param['name'] + ' does not fall within the specified range:')
-            print(line.strip())
-            raise Exception('The default value for ' + param['name'] + ' does not fall within the specified range.')
+            raise PCSParseError('The default value for ' + param['name'] + ' does not fall within the specified range.',line=line.strip())
         #check if this parameter should be searched on a log scale.
-        if(re.search('^.+? .+? *\[([0-9]|\.)+?, *([0-9]|\.)+?\] *\[([0-9]|\.)+\] *log' + PCS.lineEnd,line)):
+        if(PCS.logPattern.search(line)):
             param['log'] = True
         else:
             param['log'] = False
@@ -399,30 +1302,24 @@ class PCS:
         else:
             param['comment'] = ''
 
-        #Add the new object to memory.
-        self.mem[param['id']] = param
-        #Store the parameter in the parameter list
-        self.paramList.append(param)
+        #Store the parameter in the parameter list and the name index
+        self.addParameter(param)
 
         return param
 
 
     def parseCategorical(self,line):
         #Author: Yasha Pushak
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Parses and returns a dict object containing the information about the 
         #categorical parameter stored in the line.
-        param = {}
-        #Create an ID for the parameter
-        param['id'] = self.getID()
+        param = self.newObject('categorical')
         #get the parameter name
         param['name'] = line.split(' ')[0].strip()
         #get the parameter type
         param['type'] = line.split(' ')[1].split('[')[0].strip()
         if(not param['type'] == 'categorical'):
-            print('[Error]: called parseCategorical() on non-categorical parameter:')
-            print(line.strip())
-            raise exception('Called parseCategorical() on a non-categorical parameter.')
+            raise PCSParseError('Called parseCategorical() on a non-categorical parameter.',line=line.strip())
         #Get the range of values
         values = line.split('{')[1].split('}')[0].split(',')
         #Remove any whitespace and create value objects.
@@ -435,14 +1332,10 @@ class PCS:
         try:
             param['default'] = keyValuePair[line.split('[')[1].split(']')[0].strip()]['id']
 
-        except:
-            print('[Error]: Failed to parse the default value for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the default value.',line)
         if(param['default'] not in param['values']):
-            print('[Error]: The default value for ' + param['name'] + ' does not fall within the specified set of values:')
-            print(line.strip())
-            raise Exception('The default value for ' + param['name'] + ' does not fall within the specified set of values.')
+            raise PCSParseError('The default value for ' + param['name'] + ' does not fall within the specified set of values.',line=line.strip())
         #Grab any trailing comments
         if(len(line.split('#'))>1):
             comment = self.parseComment(line.split('#')[1].strip())
@@ -450,30 +1343,24 @@ class PCS:
         else:
             param['comment'] = ''
 
-        #Add the new object to memory.
-        self.mem[param['id']] = param
-        #store the parameter in the parameter list
-        self.paramList.append(param)
+        #Store the parameter in the parameter list and the name index
+        self.addParameter(param)
 
         return param
 
 
     def parseOrdinal(self,line):
         #Author: Yasha Pushak
-        #Last updated: October 24th, 2016
+        #Last updated: 2026-10-18
         #Parses and returns a dict object containing the information about the 
         #ordinal parameter stored in the line.
-        param = {}
-        #Create an iD for the parameter
-        param['id'] = self.getID()
+        param = self.newObject('ordinal')
         #get the parameter name
         param['name'] = line.split(' ')[0].strip()
         #get the parameter type
         param['type'] = line.split(' ')[1].split('[')[0].strip()
         if(not param['type'] == 'ordinal'):
-            print('[Error]: called parseOrdinal() on non-ordinal parameter:')
-            print(line.strip())
-            raise exception('Called parseOrdinal() on a non-ordinal parameter.')
+            raise PCSParseError('Called parseOrdinal() on a non-ordinal parameter.',line=line.strip())
          #Get the range of values
         values = line.split('{')[1].split('}')[0].split(',')
         #Remove any whitespace and create value objects.
@@ -485,14 +1372,10 @@ class PCS:
         #Grab the default value
         try:
             param['default'] = keyValuePair[line.split('[')[1].split(']')[0].strip()]['id']
-        except:
-            print('[Error]: Failed to parse the default value for:')
-            print(line)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Failed to parse the default value.',line)
         if(param['default'] not in param['values']):
-            print('[Error]: The default value for ' + param['name'] + ' does not fall within the specified set of values:')
-            print(line.strip())
-            raise Exception('The default value for ' + param['name'] + ' does not fall within the specified set of values.')
+            raise PCSParseError('The default value for ' + param['name'] + ' does not fall within the specified set of values.',line=line.strip())
         #Grab any trailing comments
         if(len(line.split('#'))>1):
             comment = self.parseComment(line.split('#')[1].strip())
@@ -500,24 +1383,18 @@ class PCS:
         else:
             param['comment'] = ''
 
-        #Add the new object to memory
-        self.mem[param['id']] = param
-        #Store the parameter in the parameter list
-        self.paramList.append(param)
+        #Store the parameter in the parameter list and the name index
+        self.addParameter(param)
 
         return param
 
 
     def parseValue(self,term):
         #Author: Yasha Pushak
-        #Last updated: O2019-03-06
+        #Last updated: 2026-10-18
         #Creates and returns a dict "object" representing the value in term.
     
-        value = {}
-        #Create an ID for the value
-        value['id'] = self.getID()
-        #Add the new "object" to memory
-        self.mem[value['id']] = value
+        value = self.newObject('value')
         #Store the type of this object
         value['type'] = 'value'
         #Store the text of the value
@@ -530,11 +1407,9 @@ class PCS:
 
     def parseComment(self,line):
         #Author: Yasha Pushak
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Creates and returns a dict representing the comment in line.
-        comment = {}
-        #Create an ID for the comment
-        comment['id'] = self.getID()
+        comment = self.newObject('comment')
         #Store the type of this object
         comment['type'] = 'comment'
         #Store the text of the comment
@@ -542,8 +1417,6 @@ class PCS:
             line = line[1:]
         comment['text'] = line
  
-        #Add the new object to memory
-        self.mem[comment['id']] = comment
         #store the comment in the comment list
         self.commentList.append(comment)
   
@@ -552,17 +1425,13 @@ class PCS:
 
     def parseConditional(self,line):
         #Author: Yasha Pushak
-        #Last updated: December 8th, 2016
+        #Last updated: 2026-10-18
         #Parses the conditional statement represented in the line. 
 
         #Store the line in case we need to print it in an error message
         linecp = line
     
-        condition = {}
-        #Get and store an ID for the condition.
-        condition['id'] = self.getID()
-        #Store the new object in memory.
-        self.mem[condition['id']] = condition
+        condition = self.newObject('conditional')
         #Store the conditional in the condition list
         self.conditionList.append(condition)
         #Store the type of the object
@@ -586,30 +1455,27 @@ class PCS:
 
             condition['clauses'] = self.parseConditionalClause(line,linecp)
 
+            self.indexConditional(condition)
+
             return condition
-        except:
-            print('[Error]: Something went wrong while parsing the following conditional statement.')
-            print(linecp)
-            raise
+        except Exception as error:
+            raise self.parseError(error,'Unable to parse the conditional statement.',linecp,'conditional')
 
 
     def parseForbidden(self,line):
         #Author: Yasha Pushak
         #Created before: December 8th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Parses and returns an "object" that corresponds to the forbidden statement 
         #stored in the line.
  
         #Create a new object
-        forbidden = {} 
-        #Create an ID
-        forbidden['id'] = self.getID()
+        forbidden = self.newObject('forbidden')
         #Set its type
         forbidden['type'] = 'forbidden'
-        #store the forbidden "object" in "memory"
-        self.mem[forbidden['id']] = forbidden
         #store the forbidden clause in the forbidden list
         self.forbiddenList.append(forbidden)
+        self.forbiddenPlan = None
     
         linecp = line
    
@@ -686,7 +1552,7 @@ class PCS:
     def parseConditionalClause(self,string,linecp):
         #Author: Yasha Pushak
         #Created Before: December 7th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #A helper functison that parses a conditional statement condition clause.
 
         #The ordering here for splitting on logical or and logical and is important,
@@ -724,15 +1590,14 @@ class PCS:
                     B = self.parseValueArray(value[1:-1],A)
                 else:
                     #Create an array of values with only one value
+                    found = False
                     for valueID in self.mem[A]['values']:
                         if (self.mem[valueID]['text'] == value):
                             B = valueID
                             found = True
                             break
                     if(not found):
-                        print('[Error]: Conditional statement specifies a parameter value that does not exist for the parameter.')
-                        print(linecp)
-                        raise Exception('Conditional statement specifies a parameter value that does not exist for the parameter.')
+                        raise PCSParseError('Conditional statement specifies a parameter value that does not exist for the parameter.',line=linecp)
             else:
                 B = value
  
@@ -743,18 +1608,16 @@ class PCS:
     def parseAdvancedClause(self,string,linecp):
         #Author: Yasha Pushak
         #Created Before: December 8th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #A helper function that parses a forbidden statement written in the 
         #advanced syntax.
  
         string = string.strip()
 
         if('(' in string):
-            print("'" + string + "'")
-            print(len(string))
             #We have some brackets to handle first.
             tokens = self.splitBraces(string)
-            print(tokens)    
+            logger.debug("Split the brackets of '%s' (%d characters) into %s",string,len(string),tokens)
   
             if(len(tokens) == 1 and tokens[0][0] == 0 and tokens[0][1] == (len(string) - 1)):
                 #The entire statement has brackets around it.
@@ -769,7 +1632,7 @@ class PCS:
                 token = tokens[i]
                 #Replace the top-level brackets in the string with the ID of the 
                 #newly created clause.
-                string = string[:token[0]] + self.parseAdvancedClause(string[token[0]:token[1]+1].strip(),linecp)['id'] + string[token[1]+1:]
+                string = string[:token[0]] + str(self.parseAdvancedClause(string[token[0]:token[1]+1].strip(),linecp)['id']) + string[token[1]+1:]
                 #print(string)
         #At this point, any brackets have been removed, so we can now begin handling
         #operators.
@@ -789,7 +1652,7 @@ class PCS:
             #At this point, we may encounter a string that is the ID of an already-
             #parsed clause that was originally contained in brackets. If so, we 
             #need to simply return the object corresponding to that ID.
-            return self.mem[string]
+            return self.mem[self.toID(string)]
         else:
             #It is possible that they may be trying to use one of the arithmetic
             #operators or functions. Currently we do not support these. Currently,
@@ -849,9 +1712,7 @@ class PCS:
                 #If we couldn't match either A or B to parameters, then this is not
                 #a valid clause.
                 if(not foundA and not foundB):
-                    print('[Error]: Unable to parse the following forbidden statement because two units could not be matched to parameters.')
-                    print(linecp)
-                    raise Exception('Unable to parse a forbidden statement because two units could not be matched to parameters.')
+                    raise PCSParseError('Unable to parse a forbidden statement because two units could not be matched to parameters.',line=linecp)
                 elif(not foundA):
                     #If we didn't find A, but B is a numeric parameter, we'll create
                     #a new value for A to wrap the numeric text.
@@ -868,20 +1729,14 @@ class PCS:
                         foundB = True
                 #If we still haven't managed to parse A or B, throw an exception.
                 if(not foundA):
-                    print('[Error]: Unable to parse the following forbidden statement because the unit "' + A + '" could not be parsed.')
-                    print(linecp)
-                    raise Exception('Unable to parse the following forbidden statement because the unit "' + A + '" could not be parsed.')
+                    raise PCSParseError('Unable to parse the following forbidden statement because the unit "' + A + '" could not be parsed.',line=linecp)
                 elif(not foundB):
-                    print('[Error]: Unable to parse the following forbidden statement because the unit "' + B + '" could not be parsed.')
-                    print(linecp)
-                    raise Exception('Unable to parse the following forbidden statement because the unit "' + B + '" could not be parsed.')
+                    raise PCSParseError('Unable to parse the following forbidden statement because the unit "' + B + '" could not be parsed.',line=linecp)
 
                 #If we got this far, then we parsed everything.
                 return self.newClause(A,B,operator)
-            except:
-                print('[Error]: An error occured while parsing the following advanced forbidden statement. Please ensure that no arithmetic operators or functions are being used, as we do not currently support them.')
-                print(linecp)
-                raise
+            except Exception as error:
+                raise self.parseError(error,'Unable to parse the advanced forbidden statement. Please ensure that no arithmetic operators or functions are being used, as we do not currently support them.',linecp,'forbidden')
 
         
 
@@ -949,91 +1804,141 @@ class PCS:
     def getID(self):
         #Author: Yasha Pushak
         #Created Before: October 20th, 2016
-        #Last Updated: 2019-03-06
-        #This function simply returns the next unique ID of the form '@#x' where x
-        #is the ID of the object.
-        cid = PCS.idPrefix + str(PCS.nextID)
-        PCS.nextID += 1
-        return cid
+        #Last Updated: 2026-10-18
+        #This function simply returns the next unique ID. IDs are allocated by
+        #each instance separately, and drawing from the counter is atomic, so
+        #several parsers may allocate IDs at the same time.
+        return ObjectID(next(self.idCounter))
+
+
+    def toID(self,obj):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns obj as an ObjectID if it is an ID, or a string of the form 
+        #'@#x' that refers to an "object" in memory, and None otherwise.
+        if(type(obj) is ObjectID):
+            return obj
+        oid = ObjectID.fromString(obj)
+        if(oid is not None and dict.__contains__(self.mem,oid)):
+            return oid
+        return None
 
 
     def lookupParamID(self,name):
         #Author: Yasha Pushak
         #Created Before: October 20th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Looks up the ID of a parameter by name. Throws an exception if no parameter
         #with such a name is in memory (yet).
-        for param in self.paramList:
-            if(param['name'] == name):
-                return param['id']
+        try:
+            return self.paramIndex[name]
+        except KeyError:
+            raise Exception('No parameter exists with name: ' + name)
+
 
-        raise Exception('No parameter exists with name: ' + name)
+    def getParam(self,name):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the parameter "object" with the specified name. Throws an
+        #exception if no parameter with such a name is in memory (yet).
+        return self.mem[self.lookupParamID(name)]
+
+
+    def addParameter(self,param):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Stores a newly created parameter in the parameter list and the name
+        #index. If two parameters share a name, lookups return the first one,
+        #as they always have.
+        self.paramList.append(param)
+        if(param['name'] not in self.paramIndex):
+            self.paramIndex[param['name']] = param['id']
+        self.clearCaches()
+
+
+    def dropParameter(self,param):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Removes a parameter from the parameter list and the name index. The
+        #"object" itself is left in memory, since it may still be referenced
+        #(e.g., by the comment that replaces it in the document).
+        param = self.getObject(param)
+        self.paramList.remove(param)
+        if(self.paramIndex.get(param['name']) == param['id']):
+            del self.paramIndex[param['name']]
+            #Fall back on any other parameter with the same name.
+            for other in self.paramList:
+                if(other['name'] == param['name']):
+                    self.paramIndex[other['name']] = other['id']
+                    break
+        self.clearCaches()
 
 
     def printObject(self,obj, printType = ''):
         #Author: Yasha Pushak
         #Created Before: October 20th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #A generic print method that allows any "object" to be printed, either by ID
         #or passed in directly.
     
         #Check that we have either an instance of an object, or the ID of an object.
-        if(isinstance(obj,str)):
-            #If we have a string, it may be an ID.
-            if(obj not in self.mem):
-                print('[Warning]: The following string that was not a valid ID was passed into printObject. We are printing as a string and attempting to continue.')
-                print(obj)
-                return [obj]
-            else:
-               #The object passed in was an object ID. Get the corresponding object
-               obj = self.mem[obj]
+        if(self.isID(obj)):
+            #The object passed in was an object ID. Get the corresponding object
+            obj = self.getObject(obj)
+        elif(isinstance(obj,str)):
+            logger.warning('The following string that was not a valid ID was passed into printObject. We are printing as a string and attempting to continue: %s',obj)
+            return [obj]
                 
        #Check if we have an "object" with a type.
         try:
             objType = obj['type']
         except:
-            print('[Warning]: The following non-"object" was passed to printObject. We are casting it to a string and attempting to continue.')
-            print(obj)
+            logger.warning('The following non-"object" was passed to printObject. We are casting it to a string and attempting to continue: %s',obj)
             return([str(obj)])
     
         #Check the type of the object and handle accordingly.
         if(objType == 'document'):
             return self.printDocument(obj)
-        elif(objType == 'comment'):
-            return self.printComment(obj)
-        elif(objType == 'integer'):
-            return self.printInteger(obj)
-        elif(objType == 'real'):
-            return self.printReal(obj)
-        elif(objType == 'categorical'):
-            return self.printCategorical(obj)
-        elif(objType == 'ordinal'):
-            return self.printOrdinal(obj)
-        elif(objType == 'conditional'):
-            return self.printConditional(obj)
-        elif(objType == 'forbidden'):
-            return self.printForbidden(obj)
-        elif(objType == 'value'):
-            return self.printValue(obj)
         elif(objType == 'clause'):
             return self.printClause(obj,printType)
-        elif(objType == 'valueArray'):
-            return self.printValueArray(obj)
+        elif(objType in PCS.printFunctions):
+            return getattr(self,PCS.printFunctions[objType])(obj)
         else:
-            print('[Warning]: Un-implemented print function for type: ' + objType + '. We are casting it to a string and attempting to continue.')
+            logger.warning('Un-implemented print function for type: %s. We are casting it to a string and attempting to continue.',objType)
             return [str(obj)]
 
 
     def printDocument(self):
         #Author: Yasha Pushak
         #Created Before: October 20th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Prints a document by printing each of it's objects. 
-        string = ''
+        return ''.join(self.documentLines())
+
+
+    def writeDocument(self,outfile):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Writes the document to outfile, which is either the name of a file or
+        #a file object, one line at a time. The output is the same as 
+        #printDocument(), but the text of the document is never held in 
+        #memory all at once.
+        if(isinstance(outfile,str)):
+            with open(outfile,'w') as f_out:
+                self.writeDocument(f_out)
+            return
+        write = outfile.write
+        for line in self.documentLines():
+            write(line)
+
+
+    def documentLines(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A generator over the lines of the document, including the newlines.
         for obj in self.doc['content']:
             for line in self.printObject(obj):
-                string += line + '\n'
-        return string
+                yield line + '\n'
 
     def printComment(self,comment):
         #Author: Yasha Pushak
@@ -1049,72 +1954,50 @@ class PCS:
     def printInteger(self,integer):
         #Author: Yasha Pushak
         #Created Before: October 20th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Prints an integer 
-        string = ''
-        string += integer['name'] + ' '
-        string += integer['type'] + ' '
-        string += str(integer['values']) + ' ' 
-        string += '[' + str(integer['default']) + '] '
+        string = [integer['name'], ' ', integer['type'], ' ', str(integer['values']), ' [', str(integer['default']), '] ']
         if(integer['log']):
-            string += 'log '
-        if(len(integer['comment']) > 0):
-            string += self.printObject(integer['comment'])[0]
-        return [string]
+            string.append('log ')
+        if(not integer['comment'] == ''):
+            string.append(self.printObject(integer['comment'])[0])
+        return [''.join(string)]
 
 
 
     def printReal(self,real):
         #Author: Yasha Pushak
         #Created Before: October 20th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Prints a real 
-        string = ''
-        string += real['name'] + ' '
-        string += real['type'] + ' '
-        string += str(real['values']) + ' '
-        string += '[' + str(real['default']) + '] '
+        string = [real['name'], ' ', real['type'], ' ', str(real['values']), ' [', str(real['default']), '] ']
         if(real['log']):
-            string += 'log '
-        if(len(real['comment']) > 0):
-            string += self.printObject(real['comment'])[0]
-        return [string]
+            string.append('log ')
+        if(not real['comment'] == ''):
+            string.append(self.printObject(real['comment'])[0])
+        return [''.join(string)]
 
 
     def printCategorical(self,param):
         #Author: Yasha Pushak
         #Created Before: October 20th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Prints a categorical
-        string = ''
-        string += param['name'] + ' '
-        string += param['type'] + ' '
-        string += '{' + self.printObject(param['values'][0])[0]
-        for value in param['values'][1:]:
-            string += ', ' + self.printObject(value)[0]
-        string += '} '
-        string += '[' + self.printObject(param['default'])[0] + '] '
-        if(len(param['comment']) > 0):
-            string += self.printObject(param['comment'])[0]
-        return [string]
+        string = [param['name'], ' ', param['type'], ' {', self.printValues(param['values']), '} [', self.printObject(param['default'])[0], '] ']
+        if(not param['comment'] == ''):
+            string.append(self.printObject(param['comment'])[0])
+        return [''.join(string)]
 
 
     def printOrdinal(self,param):
         #Author: Yasha Pushak
         #Created Before: October 20th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Prints an ordinal
-        string = ''
-        string += param['name'] + ' '
-        string += param['type'] + ' '
-        string += '{' + self.printObject(param['values'][0])[0]
-        for value in param['values'][1:]:
-            string += ', ' + self.printObject(value)[0]
-        string += '} '
-        string += '[' + self.printObject(param['default'])[0] + '] '
-        if(len(param['comment']) > 0):
-            string += self.printObject(param['comment'])[0]
-        return [string]
+        string = [param['name'], ' ', param['type'], ' {', self.printValues(param['values']), '} [', self.printObject(param['default'])[0], '] ']
+        if(not param['comment'] == ''):
+            string.append(self.printObject(param['comment'])[0])
+        return [''.join(string)]
 
 
     def printValue(self,obj):
@@ -1150,7 +2033,7 @@ class PCS:
     def printClause(self,obj, printType):
         #Author: Yasha Pushak
         #Created Before: December 7th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #prints a classic forbidden object
 
         A = self.mem[obj['A']]
@@ -1169,7 +2052,7 @@ class PCS:
                 string += '='
             else:
                 string += operator
-                print('[Warning]: Printed unspecified operator for forbidden statement classic syntax: ' + operator)
+                logger.warning('Printed unspecified operator for forbidden statement classic syntax: %s',operator)
 
             string += self.printObject(B,printType)[0]
 
@@ -1209,76 +2092,76 @@ class PCS:
     def printValueArray(self,obj):
         #Author: Yasha Pushak
         #Created Before: December 7th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Prints a value array.
     
-        string = '{'
-        for value in obj['values']:
-            string += self.printObject(value)[0] + ', '
-        string = string[:-2] + '}'
-
-        return [string]
+        return ['{' + self.printValues(obj['values']) + '}']
+
+
+    def printValues(self,values):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the text of the values (objects or IDs), separated by commas.
+        texts = []
+        for value in values:
+            obj = dict.get(self.mem,value) if type(value) is ObjectID else None
+            if(obj is not None and obj['type'] == 'value'):
+                texts.append(obj['text'])
+            else:
+                texts.append(self.printObject(value)[0])
+        return ', '.join(texts)
     
 
     def getAttr(self,obj,attribute):
         #Author: Yasha Pushak
         #Created Before: October 20th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Returns the attribute of the object (specified directly, or by ID).
     
         #Check that we have either an instance of an object, or the ID of an object.
-        if(isinstance(obj,str)):
-            #If we have a string, it may be an ID.
-            if(obj not in self.mem):
-                print('[Error]: The following string that was not a valid ID was passed into getAttr().')
-                print(obj)
-                raise Exception('A string that was not a valid ID was passed into getAttr().')
-            else:
-                #The object passed in was an object ID. Get the corresponding object
-                obj = self.mem[obj]
+        if(self.isID(obj)):
+            #The object passed in was an object ID. Get the corresponding object
+            obj = self.getObject(obj)
+        elif(isinstance(obj,str)):
+            raise Exception('A string that was not a valid ID was passed into getAttr(): ' + obj)
     
-        try:
-            return obj[attribute]
-        except:
-            print('[Error]: Attribute ' + attribute + ' undefined for the following object:')
-            print(obj)
-            raise
+        return obj[attribute]
 
 
     def testDocumentCorrectness(self):
         #Author: Yasha Pushak
-        #Last updated: October 24th, 2016
+        #Last updated: 2026-10-18
         #Performs some simple checks to see if the document is valid.
         #These tests are not exhaustive and should not be considered sufficient
         #for proof of correctness.
 
         #check that there are no collisions between parameter names and values when
         #using the advanced forbidden syntax.
-        collision = False
-        for param in self.paramList:
-            for value in self.valueList:
-                if(param['name'] == value['text']):
-                    collision = True
-                    break
-            if(collision):
-                break
         advanced = False
         for forbidden in self.forbiddenList:
             if(forbidden['syntax'] == 'advanced'):
                 advanced = True
                 break
-        if(collision and advanced):
-            print('[Error]: Cannot use advanced syntax for forbidden clauses and have parameter names and values that collide. This issue will need to be resolved manually.')
+        if(not advanced):
+            return
+        names = set([param['name'] for param in self.paramList])
+        collision = False
+        for value in self.valueList:
+            if(value['text'] in names):
+                collision = True
+                break
+        if(collision):
+            logger.error('Cannot use advanced syntax for forbidden clauses and have parameter names and values that collide. This issue will need to be resolved manually.')
 
 
 
     def newValue(self, text):
         #Author: Yasha Pushak
         #Created Before: October 25th, 2016
-        #Last updated: 2019-03-07
+        #Last updated: 2026-10-18
         #Creates a new value object with the inputted text.
     
-        obj = self.newObject()
+        obj = self.newObject('value')
         obj['type'] = 'value'
         obj['text'] = text
 
@@ -1287,19 +2170,47 @@ class PCS:
         return obj
 
 
+    def newParameter(self,name,paramType,values,default,log=False):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Creates a new parameter object. For real and integer parameters, values
+        #is the [lower, upper] range and default is a number. For categorical
+        #and ordinal parameters, values is a list containing the text of each
+        #value and default is the text of the default value.
+
+        obj = self.newObject(paramType)
+        obj['type'] = paramType
+        obj['name'] = name
+        if(paramType in ['real','integer']):
+            obj['values'] = list(values)
+            obj['default'] = default
+            obj['log'] = log
+        else:
+            values = list(values)
+            if(default not in values):
+                raise Exception('The default value for ' + name + ' does not fall within the specified set of values.')
+            obj['values'] = [self.newValue(text)['id'] for text in values]
+            obj['default'] = obj['values'][values.index(default)]
+
+        self.addParameter(obj)
+
+        return obj
+
+
     def newConditional(self, child,clause):
         #Author: Yasha Pushak
         #Created Before: December 9th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Creates a new conditional object (specifically for hyperparameters)
         #child, parent, and value must be IDs (if applicable) rather than "objects"
    
-        obj = self.newObject()
+        obj = self.newObject('conditional')
         obj['type'] = 'conditional'
         obj['child'] = child
         obj['clauses'] = clause
 
         self.conditionList.append(obj)
+        self.indexConditional(obj)
 
         return obj
 
@@ -1307,15 +2218,16 @@ class PCS:
     def newForbidden(self,clause,syntax):
         #Author: Yasha Pushak
         #Created Before: October 31st, 2016
-        #Last updated: 2019-03-07
+        #Last updated: 2026-10-18
         #Creates a new forbidden clause with the pre-parsed clause.
     
-        obj = self.newObject()
+        obj = self.newObject('forbidden')
         obj['type'] = 'forbidden'
         obj['clause'] = clause
         obj['syntax' ] = syntax
 
         self.forbiddenList.append(obj)
+        self.forbiddenPlan = None
 
         return obj
 
@@ -1323,9 +2235,9 @@ class PCS:
     def newComment(self,text):
         #Author: Yasha Pushak
         #Created Before: October 25th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Creates a new comment object
-        obj = self.newObject()
+        obj = self.newObject('comment')
         obj['type'] = 'comment'
         obj['text'] = text
     
@@ -1338,17 +2250,17 @@ class PCS:
     def newClause(self,A,B,operator):
         #Author: Yasha Pushak
         #Created Before: December 7th, 2016
-        #Last updated: 2019-03-07
+        #Last updated: 2026-10-18
         #A clause is made up of either a two units and an operator that
         #acts on them. A unit is either a parameter, a value or another clause.
 
-        clause = self.newObject()
+        clause = self.newObject('clause')
         clause['type'] = 'clause'
-        if(type(A) is dict):
+        if(isinstance(A,(PCSObject,dict))):
             clause['A'] = A['id']
         else:
             clause['A'] = A
-        if(type(B) is dict):
+        if(isinstance(B,(PCSObject,dict))):
             clause['B'] = B['id']
         else:
             clause['B'] = B
@@ -1361,27 +2273,30 @@ class PCS:
     def newValueArray(self,values):
         #Author: Yasha Pushak
         #Created Before: December 7th, 2016
-        #Last updated: 2019-03-06
+        #Last updated: 2026-10-18
         #Creates a new object to store an array of values.
         #Currently only used with the 'in' operator of the conditional statements;
         #however, this definitely could have also been used to specify the list of
         #permissible value for categorical and ordinal parameters.
 
-        valueArray = self.newObject()
+        valueArray = self.newObject('valueArray')
         valueArray['type'] = 'valueArray'
         valueArray['values'] = values
 
         return valueArray
 
 
-    def newObject(self):
+    def newObject(self,objType='object'):
         #Author: Yasha Pushak
         #Created Before: October 25th, 2016
-        #Last updated: 2019-03-07
-        #Creates a new object
-        obj = {}
+        #Last updated: 2026-10-18
+        #Creates a new object of the specified type and stores it in memory.
+        #The object is an instance of the corresponding class in 
+        #PCS.objectClasses, which only has room for the fields used by that
+        #type of object.
+        obj = self.objectClasses[objType]()
         obj['id'] = self.getID()
-        obj['type'] = 'object'
+        obj['type'] = objType
         obj['comment'] = ''
         self.mem[obj['id']] = obj
 
@@ -1392,7 +2307,7 @@ class PCS:
     def isNumeric(self,obj):
         #Author: Yasha Pushak
         #Created Before: October 27th, 2016
-        #Last updated: 2019-03-07
+        #Last updated: 2026-10-18
         #Returns true of the object is a real or integer parameter.
         #Throws an exception if there is no type accosiated with the "object"
         #Returns false otherwise.
@@ -1400,16 +2315,14 @@ class PCS:
 
         try:
             return (obj['type'] in ['real','integer'])
-        except:
-            print('[Error]: Unable to evaluate the type of the following non-"object".')
-            print(obj)
-            raise
+        except (KeyError,TypeError):
+            raise TypeError('Unable to evaluate the type of the following non-"object": ' + str(obj))
 
 
     def isParameter(self,obj):
         #Author: Yasha Pushak
         #Created Before: 2019-06-07
-        #Last updated: 2019-06-07
+        #Last updated: 2026-10-18
         #Returns true of the object is any kind of parameter
         #Throws an exception if there is no type accosiated with the "object"
         #Returns false otherwise.
@@ -1417,17 +2330,15 @@ class PCS:
 
         try:
             return (obj['type'] in ['real','integer','categorical','ordinal'])
-        except:
-            print('[Error]: Unable to evaluate the type of the following non-"object".')
-            print(obj)
-            raise
+        except (KeyError,TypeError):
+            raise TypeError('Unable to evaluate the type of the following non-"object": ' + str(obj))
 
 
 
     def isParameter(self,obj):
         #Author: Yasha Pushak
         #created: December 7th, 2016
-        #Last updated: 2018-10-22
+        #Last updated: 2026-10-18
         #Returns true of the object is a real, integer, categorical, or ordinal 
         #parameter.
         #Throws an exception if there is no type accosiated with the "object"
@@ -1437,10 +2348,8 @@ class PCS:
 
         try:
             return obj['type'] in ['real','integer','categorical','ordinal']
-        except:
-            print('[Error]: Unable to evaluate the type of the following non-"object".')
-            print(obj)
-            raise
+        except (KeyError,TypeError):
+            raise TypeError('Unable to evaluate the type of the following non-"object": ' + str(obj))
 
 
     def containsParent(self,condition,param):
@@ -1495,12 +2404,14 @@ class PCS:
     def getObject(self,obj):
         #Author: Yasha Pushak
         #Created Before: December 8th, 2016
-        #Last updated: 2019-03-07
+        #Last updated: 2026-10-18
         #If the argument passed in is an object ID, then we get the object from 
         #memory with the corresponding ID. If it is already an object, we return it.
-        if(type(obj) is str and self.isID(obj)):
+        if(type(obj) is ObjectID):
             return self.mem[obj]
-        elif(type(obj) is dict):
+        elif(type(obj) is str and self.isID(obj)):
+            return self.mem[self.toID(obj)]
+        elif(isinstance(obj,(PCSObject,dict))):
             return obj
         else:
             raise Exception('Non-object:' + str(obj) + ' passed into getObject.')
@@ -1509,7 +2420,7 @@ class PCS:
     def getNamedValues(self,param):
         #Author: Yasha Pushak
         #Created Before: December 7th, 2016
-        #Last updated: 2019-03-07
+        #Last updated: 2026-10-18
         #Returns the values of the parameter as strings, rather than IDs or objects.
     
         try:
@@ -1525,66 +2436,102 @@ class PCS:
                 else:
                     output.append(value)
             return output
-        except:
-            print('[Error]: Something went wrong while getting the named values of the following object:')
-            print(param)
-            raise 
+        except Exception as error:
+            raise Exception('Unable to get the named values of ' + str(param) + ': ' + str(error)) from error
 
 
     def isID(self,string):
         #Author: Yasha Pushak
         #Created Before: December 8th, 2016
-        #Last updated: 2019-03-06
-        #Checks if the specified string is in the format of an ID, and if the ID is
-        #actually stored in memory... Which would probably be sufficient, actually.
-        if(len(string) > len(PCS.idPrefix) and string[0:len(PCS.idPrefix)] == PCS.idPrefix):
-            try:
-                num = int(string[len(PCS.idPrefix):])
-            except ValueError:
-                return False
-            return string in self.mem.keys()
+        #Last updated: 2026-10-18
+        #Checks if the argument is an ID. For compatibility, strings in the 
+        #format '@#x' are also IDs if the ID is actually stored in memory.
+        if(type(string) is ObjectID):
+            return True
+        return type(string) is str and self.toID(string) is not None
 
 
 
     def getParentConditions(self,param):
         #Author: YP
         #Created: 2018-10-22
-        #Last updated: 2019-04-26
+        #Last updated: 2026-10-18
         #Gets all of the parent clauses for the parameter
 
-        conditions = []
         param = self.getObject(param)
 
-        for condition in self.conditionList:
-            if(condition['child'] == param['id']):
-                conditions.append(condition)
-
-        return conditions
+        return list(self.conditionsByChild.get(param['id'],[]))
 
 
     def getChildConditions(self,param):
         #Author: YP
         #Created: 2019-06-07
-        #Last updated: 2019-06-07
-        #Gets all of the parent clauses for the parameter
+        #Last updated: 2026-10-18
+        #Gets all of the conditions in which the parameter appears as a parent,
+        #anywhere in the clause.
 
-        conditions = []
         param = self.getObject(param)
 
-        for condition in self.conditionList:
-            clause = self.getAttr(condition,'clauses')
-            if(self.getAttr(clause,'A') == param['id'] or self.getAttr(clause,'B') == param['id']):
-                conditions.append(condition)
-
-        return conditions
+        return list(self.conditionsByParent.get(param['id'],[]))
 
 
+    def getClauseParameters(self,clause):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the IDs of all of the parameters referenced anywhere in the 
+        #clause, in the order in which they first appear.
+        params = []
+        clause = self.getObject(clause)
+        for unit in [clause['A'],clause['B']]:
+            if(not self.isID(unit)):
+                continue
+            unit = self.getObject(unit)
+            if(self.isParameter(unit)):
+                if(unit['id'] not in params):
+                    params.append(unit['id'])
+            elif(unit['type'] == 'clause'):
+                for pid in self.getClauseParameters(unit):
+                    if(pid not in params):
+                        params.append(pid)
+        return params
+
+
+    def indexConditional(self,condition,parents=None):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Adds the conditional statement to the child and parent condition 
+        #indexes. parents are the IDs of the parameters in its clauses, as 
+        #returned by getClauseParameters, if they are already known.
+        condition = self.getObject(condition)
+        self.conditionsByChild.setdefault(condition['child'],[]).append(condition)
+        if(parents is None):
+            parents = self.getClauseParameters(condition['clauses'])
+        for pid in parents:
+            self.conditionsByParent.setdefault(pid,[]).append(condition)
+        self.clearCaches()
+
+
+    def unindexConditional(self,condition):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Removes the conditional statement from the child and parent condition
+        #indexes.
+        condition = self.getObject(condition)
+        for (index,pids) in [(self.conditionsByChild,[condition['child']]),
+                             (self.conditionsByParent,self.getClauseParameters(condition['clauses']))]:
+            for pid in pids:
+                conditions = [c for c in index.get(pid,[]) if c is not condition]
+                if(len(conditions) > 0):
+                    index[pid] = conditions
+                elif(pid in index):
+                    del index[pid]
+        self.clearCaches()
 
 
     def isActive(self,param,config):
         #Author: YP
         #Created: 2018-10-22
-        #Last updated: 2019-03-07
+        #Last updated: 2026-10-18
         #Checks to see if all parent conditions are satisfied.
         #for the parameter. param
         #config should be a dict containing parameter names, objects, or ids as 
@@ -1607,7 +2554,7 @@ class PCS:
 
         allTrue = True
         for cond in conds:
-            allTrue = allTrue and self.evalClause(self.getAttr(cond,'clauses'),config) 
+            allTrue = allTrue and self.compileCondition(cond,'id')(config) 
 
         return allTrue
         
@@ -1615,7 +2562,7 @@ class PCS:
     def convertConfigToIdsAndText(self,config):
         #Author: YP
         #Created: 2018-10-22
-        #Last updated: 2019-03-07
+        #Last updated: 2026-10-18
         #Converts a configuration as a dict with parameters as names, objects or
         #Ids as keys, and parameter values as objects or ids, or text, as values.
 
@@ -1623,16 +2570,13 @@ class PCS:
 
         for p in config.keys():
             #Get p as an ID
-            if(type(p) is str and not self.isID(p)):
-                pId = self.lookupParamID(p)
-            else:
-                pId = self.getAttr(self.getObject(p),'id')
+            pId = self.getConfigKeyID(p)
         
             v = config[p]
             #get v as text
-            if(type(v) is str and self.isID(v)):
+            if(self.isID(v)):
                 v = self.getAttr(v,'text')
-            elif(type(v) is dict):
+            elif(isinstance(v,(PCSObject,dict))):
                 v = self.getAttr(v,'text') 
  
             newConfig[pId] = v
@@ -1643,74 +2587,396 @@ class PCS:
     def evalClause(self,obj,config):
         #Author: YP
         #Created: 2018-10-22
-        #Last updated: 2019-03-07
+        #Last updated: 2026-10-18
         #Evaluates the condition using the configuration specified in config.
-        #Config must be a dict with parameters as keys (ids or objects), and 
-        #the values must be the parameter values (either as ids or objects)
-
+        #Config must be a dict with parameter ids as keys, and the values must
+        #be the parameter values as text (see convertConfigToIdsAndText).
+        #The clause is compiled into a python function the first time it is
+        #evaluated, see compileClause().
+        return self.compileClause(obj,'id')(config)
+
+
+    def compileClause(self,obj,keyBy='name'):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Compiles a clause (or any other unit of a clause) into a python 
+        #function that evaluates it against a configuration. The function is
+        #cached, so each clause is only compiled once.
+        #keyBy specifies how the configurations passed to the function are
+        #keyed: 'name' for a dict with parameter names as keys, 'id' for a dict
+        #with parameter IDs as keys, or 'index' for a list of parameter values
+        #in the same order as paramList (with None for missing parameters).
+        #Parameter values must be text (or numbers, for numerical parameters),
+        #and missing parameters evaluate to None, exactly as in evalClause().
+        #Equalities with real and integer parameters compare numbers, see 
+        #comparisonExpression.
         obj = self.getObject(obj)
+        key = (obj['id'],keyBy)
+        if(key not in self.compiledClauses):
+            namespace = {}
+            expression = self.clauseExpression(obj,keyBy,namespace)
+            source = 'def evaluate(config):\n    return ' + expression + '\n'
+            exec(compile(source,'<clause ' + str(obj['id']) + '>','exec'),namespace)
+            self.compiledClauses[key] = namespace['evaluate']
+        return self.compiledClauses[key]
+
+
+    def compileCondition(self,condition,keyBy='id'):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a function that evaluates the clauses of a conditional 
+        #statement against a configuration keyed by keyBy ('id' or 'name'), 
+        #see compileClause. If setConditionCacheSize has been called, the 
+        #results are cached in a bounded LRU cache per conditional statement,
+        #keyed on the values of only the parameters that appear in its 
+        #clauses.
+        condition = self.getObject(condition)
+        if(self.conditionCacheSize is None):
+            return self.compileClause(condition['clauses'],keyBy)
+        key = (condition['id'],keyBy)
+        if(key not in self.conditionCaches):
+            evaluate = self.compileClause(condition['clauses'],keyBy)
+            keys = []
+            for pid in self.getClauseParameters(condition['clauses']):
+                keys.append(pid if keyBy == 'id' else self.getAttr(pid,'name'))
+            def project(*values):
+                return evaluate(dict(zip(keys,values)))
+            memo = functools.lru_cache(maxsize=self.conditionCacheSize)(project)
+            #Compile the projection too, so that a cache hit costs only one 
+            #dict lookup per parameter plus the lookup in the cache.
+            namespace = {'memo':memo}
+            arguments = [self.constantExpression(k,namespace) for k in keys]
+            source = 'def evaluate(config):\n    return memo(' + ', '.join(['config.get(' + k + ')' for k in arguments]) + ')\n'
+            exec(compile(source,'<condition ' + str(condition['id']) + '>','exec'),namespace)
+            self.conditionCaches[key] = (namespace['evaluate'],memo)
+        return self.conditionCaches[key][0]
+
+
+    def setConditionCacheSize(self,maxSize=1024):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Turns on caching the results of evaluating conditional statements 
+        #(used by isActive, removeInactive, getActiveParameters and 
+        #ActiveConfiguration), with at most maxSize entries per conditional 
+        #statement and per type of configuration key. If maxSize is None, 
+        #caching is turned off again. The caches are emptied whenever the 
+        #parameters or conditions change, see clearCaches.
+        #Since the clauses are compiled, a cache lookup costs about as much as
+        #evaluating a small clause, so this only pays off for clauses that 
+        #are expensive to evaluate but depend on few parameters whose values
+        #repeat. For the spaces in benchmarks/bench_condition_cache.py, 
+        #caching makes resolveActive 0.8-1.1x as fast for conditions of 1 to
+        #8 comparisons over different parents (e.g., the CPLEX example), but
+        #about 1.5x, 3.5x and 6x as fast for conditions of 8, 32 and 64 
+        #comparisons of one categorical parent (e.g., 
+        #'c | a == v1 || a == v4 || ...'), and 2.5x, 7x and 12x as fast if 
+        #the parent is an integer.
+        if(maxSize is not None and maxSize <= 0):
+            raise Exception('The size of the condition caches must be positive.')
+        self.conditionCacheSize = maxSize
+        self.clearCaches()
+
+
+    def getConditionCacheStats(self,condition=None):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a dict with the number of hits and misses, the hit rate, the
+        #current number of entries and the maximum number of entries of the
+        #condition caches, in total or only for the specified conditional
+        #statement. The statistics are reset along with the caches.
+        stats = {'hits':0,'misses':0,'size':0,'maxSize':0}
+        for (key,(evaluate,memo)) in self.conditionCaches.items():
+            if(condition is not None and key[0] != self.getAttr(condition,'id')):
+                continue
+            info = memo.cache_info()
+            stats['hits'] += info.hits
+            stats['misses'] += info.misses
+            stats['size'] += info.currsize
+            stats['maxSize'] += info.maxsize
+        lookups = stats['hits'] + stats['misses']
+        stats['hitRate'] = stats['hits']/float(lookups) if lookups > 0 else 0.0
+        return stats
+
+
+    def enableInstrumentation(self,sampleEvery=1):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Starts recording the number of calls to, and the wall time spent in,
+        #each of the functions in PCS.instrumentedFunctions. This replaces the
+        #functions of this instance by timed wrappers, so the functions cost
+        #exactly as much as before while instrumentation is disabled. Only 
+        #every sampleEvery-th (outermost) call of each function is timed, 
+        #which bounds the overhead of the timers; all calls are counted. Note
+        #that some functions are bypassed by compiled fast paths (e.g., 
+        #removeInactive evaluates compiled clauses rather than calling 
+        #evalClause), and that the lines parsed by the processes of a parallel
+        #parse (see parseDoc) are not recorded. Any previous statistics are 
+        #discarded.
+        if(sampleEvery < 1):
+            raise Exception('Instrumentation must sample at least every call.')
+        self.disableInstrumentation()
+        self.instrumentationStats = {}
+        self.instrumentationSampling = sampleEvery
+        for name in PCS.instrumentedFunctions:
+            self.__dict__[name] = self.instrumentFunction(name,sampleEvery)
+
+
+    def disableInstrumentation(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Stops recording, and restores the original functions. The statistics
+        #recorded so far are kept.
+        for name in PCS.instrumentedFunctions:
+            self.__dict__.pop(name,None)
+        self.instrumentationSampling = None
+
+
+    def instrumentFunction(self,name,sampleEvery):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a wrapper around the method name of this instance, which 
+        #counts its calls and times every sampleEvery-th outermost call. 
+        #Recursive calls (e.g., of evalClause) are counted, but only the time
+        #of the outermost call is recorded. For parseParameterFields and 
+        #parseRawLine, the kind of line is filled into the recorded name.
+        #Each entry of instrumentationStats holds the number of calls, 
+        #outermost calls, timed calls, the total time of the timed calls and
+        #the current depth of recursion.
+        function = getattr(type(self),name).__get__(self)
+        label = PCS.instrumentedFunctions[name]
+        perKind = '%s' in label
+        stats = self.instrumentationStats
+        perfCounter = time.perf_counter
+
+        def wrapper(*args,**kwargs):
+            if(perKind):
+                #The kind of a parameter, or of a raw line [kind, text].
+                key = label % (args[0] if isinstance(args[0],str) else args[0][0])
+            else:
+                key = label
+            entry = stats.get(key)
+            if(entry is None):
+                entry = stats[key] = [0,0,0,0.0,0]
+            entry[0] += 1
+            if(entry[4] > 0):
+                return function(*args,**kwargs)
+            sampled = entry[1] % sampleEvery == 0
+            entry[1] += 1
+            entry[4] = 1
+            try:
+                if(not sampled):
+                    return function(*args,**kwargs)
+                start = perfCounter()
+                try:
+                    return function(*args,**kwargs)
+                finally:
+                    entry[3] += perfCounter() - start
+                    entry[2] += 1
+            finally:
+                entry[4] = 0
+
+        functools.update_wrapper(wrapper,function)
+        return wrapper
+
+
+    def getInstrumentationStats(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a snapshot of the statistics recorded since instrumentation 
+        #was enabled, as a dict that maps the name of each phase or function 
+        #(see PCS.instrumentedFunctions) to a dict with the number of calls 
+        #(including recursive calls), the number of timed calls, the total 
+        #wall time of the timed calls in seconds, the mean time per timed 
+        #call, and the estimated total time of all outermost calls (which is 
+        #the same as the total time unless calls are sampled).
+        snapshot = {}
+        for (key,(calls,outerCalls,timedCalls,total,depth)) in self.instrumentationStats.items():
+            mean = total/timedCalls if timedCalls > 0 else 0.0
+            snapshot[key] = {'calls':calls,
+                             'timedCalls':timedCalls,
+                             'time':total,
+                             'meanTime':mean,
+                             'estimatedTime':mean*outerCalls}
+        return snapshot
+
+
+    def resetInstrumentationStats(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Discards the statistics recorded so far, without disabling 
+        #instrumentation.
+        for entry in self.instrumentationStats.values():
+            entry[0:4] = [0,0,0,0.0]
+
+
+    def printInstrumentationStats(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a table of the statistics returned by getInstrumentationStats,
+        #sorted by estimated total time.
+        stats = self.getInstrumentationStats()
+        lines = ['%-28s %12s %12s %14s %14s' % ('phase', 'calls', 'timed', 'mean (us)', 'total (ms)')]
+        for key in sorted(stats, key=lambda key: -stats[key]['estimatedTime']):
+            entry = stats[key]
+            lines.append('%-28s %12d %12d %14.2f %14.2f' % (key, entry['calls'], entry['timedCalls'], 1e6*entry['meanTime'], 1e3*entry['estimatedTime']))
+        return '\n'.join(lines)
+
+
+    def logInstrumentationStats(self,level=logging.INFO):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Writes the table returned by printInstrumentationStats to the 'PCS'
+        #logger.
+        logger.log(level,'Instrumentation statistics:\n' + self.printInstrumentationStats())
+
+
+    def clauseExpression(self,unit,keyBy,namespace):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for compileClause. Returns the source of a python
+        #expression that evaluates the unit against "config". Any constants
+        #needed by the expression (keys, value text, sets of values) are
+        #stored in namespace, so that they are only computed once.
+        if(isinstance(unit,str) and not self.isID(unit)):
+            #A raw value that was not wrapped in a value object.
+            return self.constantExpression(unit,namespace)
+
+        obj = self.getObject(unit)
 
         if(self.isParameter(obj)):
-            #The object is a parameter, so we return the value
-            #for the parameter
-            if(obj['id'] not in config.keys()):
-                #raise Exception("There is not enough information about the parameter configuration to determine if the parameter should be active.")
-                return None
-            return config[obj['id']]
-        elif(self.getAttr(obj,'type') == 'value'):
-            return self.getAttr(obj,'text')
+            if(keyBy == 'id'):
+                return 'config.get(' + self.constantExpression(obj['id'],namespace) + ')'
+            elif(keyBy == 'name'):
+                return 'config.get(' + self.constantExpression(obj['name'],namespace) + ')'
+            elif(keyBy == 'index'):
+                if(obj['id'] not in self.getParamPositions()):
+                    #The parameter has been removed, so it is never set.
+                    return 'None'
+                return 'config[' + str(self.getParamPositions()[obj['id']]) + ']'
+            else:
+                raise Exception('Unknown configuration key type: ' + str(keyBy))
+        elif(obj['type'] == 'value'):
+            return self.constantExpression(obj['text'],namespace)
         elif(obj['type'] == 'clause'):
-            #The object is a clause, so we need to evaluate it (possibly 
-            #using recursion)
             operator = obj['operator']
-            if(operator == '&&'):
-                return self.evalClause(obj['A'],config) and self.evalClause(obj['B'],config)
-            elif(operator == '||'):
-                return self.evalClause(obj['A'],config) or self.evalClause(obj['B'],config)
-            elif(operator in ['<=','>=','<','>']): #Update 2019-03-06: I just realized that '<=' and '>=' apparently aren't supported by SMAC. I'm going to leave them
-                #here even though they're not actually supported in the parsing code I have above either. This way if ever desired the parsing code can be easily
-                #extended to include them. 
+            if(operator in ['&&','||']):
+                if(operator == '&&'):
+                    logical = ' and '
+                else:
+                    logical = ' or '
+                return '(' + self.clauseExpression(obj['A'],keyBy,namespace) + logical + self.clauseExpression(obj['B'],keyBy,namespace) + ')'
+            elif(operator in ['<=','>=','<','>']):
                 #We don't support ordinals here, so this won't handle them
                 #correctly.
-                A = float(self.evalClause(obj['A'],config))
-                B = float(self.evalClause(obj['B'],config))
-                if(operator == '<='):
-                    return A <= B
-                elif(operator == '>='):
-                    return A >= B
-                elif(operator == '<'):
-                    return A < B
-                elif(operator == '>'):
-                    return A > B
-                else:
-                    raise Exception("Invalid operator")
+                units = []
+                for unit in [obj['A'],obj['B']]:
+                    if(self.isConstant(unit)):
+                        units.append(self.constantExpression(float(self.getConstant(unit)),namespace))
+                    else:
+                        units.append('float(' + self.clauseExpression(unit,keyBy,namespace) + ')')
+                return '(' + units[0] + ' ' + operator + ' ' + units[1] + ')'
             elif(operator in ['==','!=']):
-                if(self.isID(obj['A'])):
-                    A = self.evalClause(obj['A'],config)
-                else:
-                    A = obj['A']
-                if(self.isID(obj['B'])):
-                    B = self.evalClause(obj['B'],config)
-                else:
-                    B = obj['B']
-                #A and B are now values as strings
+                #Values of real and integer parameters are compared as 
+                #numbers (so that 5, '5' and '5.0' are all equal), as they are
+                #by compileClauseArray. Anything else is compared as text.
+                numeric = self.isNumericUnit(obj['A']) or self.isNumericUnit(obj['B'])
+                A = self.comparisonExpression(obj['A'],numeric,keyBy,namespace)
+                B = self.comparisonExpression(obj['B'],numeric,keyBy,namespace)
                 if(operator == '=='):
-                    return A == B
-                elif(operator == '!='):
-                    return not A == B
+                    return '(' + A + ' == ' + B + ')'
+                return '(not ' + A + ' == ' + B + ')'
             elif(operator == 'in'):
-                if(self.isID(obj['A'])):
-                    A = self.evalClause(obj['A'],config)
+                numeric = self.isNumericUnit(obj['A'])
+                texts = [self.getAttr(v,'text') for v in self.getAttr(obj['B'],'values')]
+                if(numeric):
+                    values = frozenset([toNumber(text) for text in texts])
                 else:
-                    A = obj['A']
-                B = self.getAttr(obj['B'],'values')
-                vals = []
-                for v in B:
-                    vals.append(self.getAttr(v,'text'))
-                return A in vals
-           
-        print(obj) 
-        raise Exception("We should never have made it here.")
+                    values = frozenset(texts)
+                return '(' + self.comparisonExpression(obj['A'],numeric,keyBy,namespace) + ' in ' + self.constantExpression(values,namespace) + ')'
+
+        raise Exception('We should never have made it here: ' + str(obj))
+
+
+    def comparisonExpression(self,unit,numeric,keyBy,namespace):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for clauseExpression. Returns the source of an 
+        #expression for one side of an equality. If numeric is True, 
+        #constants are converted by toNumber now, and the values of 
+        #parameters when the expression is evaluated.
+        if(not numeric):
+            return self.clauseExpression(unit,keyBy,namespace)
+        if(self.isConstant(unit)):
+            return self.constantExpression(toNumber(self.getConstant(unit)),namespace)
+        namespace['toNumber'] = toNumber
+        return 'toNumber(' + self.clauseExpression(unit,keyBy,namespace) + ')'
+
+
+    def isNumericUnit(self,unit):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns true if the unit of a clause is a real or integer parameter.
+        return not self.isConstant(unit) and self.isNumeric(unit)
+
+
+    def constantExpression(self,value,namespace):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for clauseExpression. Stores the value in the
+        #namespace and returns the name under which it was stored.
+        name = 'k' + str(len(namespace))
+        namespace[name] = value
+        return name
+
+
+    def isConstant(self,unit):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns true if the unit of a clause is a value (either a raw value or
+        #a value object) rather than a parameter or another clause.
+        if(isinstance(unit,str) and not self.isID(unit)):
+            return True
+        return self.getObject(unit)['type'] == 'value'
+
+
+    def getConstant(self,unit):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the text of a unit for which isConstant() is true.
+        if(isinstance(unit,str) and not self.isID(unit)):
+            return unit
+        return self.getObject(unit)['text']
+
+
+    def getParamPositions(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a dict that maps each parameter ID to the position of the 
+        #parameter in paramList.
+        if(self.paramPositions is None):
+            self.paramPositions = {}
+            for i in range(0,len(self.paramList)):
+                self.paramPositions[self.paramList[i]['id']] = i
+        return self.paramPositions
+
+
+    def clearCaches(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Discards everything that was derived from the parameters and 
+        #conditions (e.g., compiled clauses). This must be called whenever 
+        #parameters or conditions are added or removed.
+        self.paramPositions = None
+        self.topologicalOrder = None
+        self.activityPlan = None
+        self.forbiddenPlan = None
+        self.configurationCodec = None
+        if(len(self.conditionCaches) > 0):
+            self.conditionCaches = {}
+        if(len(self.descendantPlans) > 0):
+            self.descendantPlans = {}
+        if(len(self.compiledClauses) > 0):
+            self.compiledClauses = {}
 
 
     def getDefault(self):
@@ -1733,10 +2999,12 @@ class PCS:
     def removeParameter(self,p):
         #Author: YP
         #Created: 2019-06-07
-        #Last updated: 2019-06-07
+        #Last updated: 2026-10-18
         #Removes a parameter, any parent conditional statements,
         #and the parameter's children if they are trivially turned off as a result
-        #of the removal.
+        #of the removal. Children that are trivially turned on lose their 
+        #conditional statement instead, since the removed parameter is fixed to
+        #its default value.
         #Note that we will only support conditional statements without && and ||.
 
         #Remove this parameter
@@ -1744,47 +3012,1743 @@ class PCS:
         
         #Remove any parent conditions
         for c in self.getParentConditions(pid):
-            cid = self.getAttr(c,'id')
-            if(cid in self.doc['content']):
-                i = self.doc['content'].index(cid)
-                self.doc['content'][i] = self.getAttr(self.newComment(self.printObject(cid)[0]),'id')
+            self.removeConditional(c)
 
         #Remove any children parameters (and their conditions)
         for c in self.getChildConditions(pid):
             cid = self.getAttr(c,'id')
+            if(c not in self.conditionList):
+                #Already removed along with another child.
+                continue
+            clause = self.getAttr(cid,'clauses')
+            if(not pid in [self.getAttr(clause,'A'),self.getAttr(clause,'B')]):
+                #We only support conditional statements without && and ||.
+                continue
             #Check if the condition is satisfied or not
-            default = self.getAttr(p,'default')
+            default = self.convertConfigToIdsAndText({pid:self.getAttr(p,'default')})
             #If it is not true, then we remove the condition and it's child parameter.
-            if(not self.evalClause(self.getAttr(cid,'clauses'),{pid:default})):
+            if(not self.evalClause(self.getAttr(cid,'clauses'),default)):
                 self.removeParameter(self.getAttr(cid,'child'))
+            else:
+                self.removeConditional(c)
 
         if(pid in self.doc['content']):
             i = self.doc['content'].index(pid)
             self.doc['content'][i] = self.getAttr(self.newComment(self.printObject(pid)[0]),'id')
 
+        self.dropParameter(pid)
+
+
+    def removeConditional(self,c):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Removes a conditional statement from the condition list and comments it
+        #out in the document.
+        cid = self.getAttr(c,'id')
+        if(cid in self.doc['content']):
+            i = self.doc['content'].index(cid)
+            self.doc['content'][i] = self.getAttr(self.newComment(self.printObject(cid)[0]),'id')
+        self.conditionList.remove(self.getObject(cid))
+        self.unindexConditional(cid)
+
+
+    def reload(self,infile=None):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Reads the parameter configuration space file again (by default, the
+        #file that the space was parsed from) and applies any changes made to
+        #it since, see applyDiff(). Returns the same as applyDiff().
+        if(infile is None):
+            infile = self.infile
+        with open(infile) as f_in:
+            text = f_in.read()
+        result = self.applyDiff(text)
+        self.infile = infile
+        return result
+
+
+    def applyDiff(self,newText):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Updates the space in place so that it represents newText, the full 
+        #text of an edited version of the parameter configuration space file.
+        #The lines of newText are compared with the lines of the document 
+        #(i.e., the text that each "object" in the document was parsed from,
+        #or its printed form if it was created or replaced since), and only 
+        #the lines that were inserted or modified are parsed. The "objects" 
+        #of unchanged lines, and their IDs, are kept as they are. The "objects"
+        #of removed lines are removed from memory, along with the conditional
+        #statements and forbidden clauses that refer to a removed parameter,
+        #whose lines are parsed again (against the new parameters) if they are
+        #still in the document. paramList, conditionList and forbiddenList are
+        #kept in the order of the document, as if newText had been parsed. 
+        #If any of the new lines cannot be parsed, the space is left unchanged
+        #and a PCSParseError is raised, with the number of the line in 
+        #newText.
+        #Returns two lists: the IDs of the "objects" that were removed from 
+        #the document and the IDs of the "objects" that were added to it.
+        content = self.doc['content']
+        source = self.doc['source']
+        oldLines = [self.getSourceLine(oid) for oid in content]
+        newLines = [line.strip() for line in io.StringIO(newText,newline=None)]
+
+        #Match the lines of the old and the new document, and keep the 
+        #"objects" of the matched lines.
+        newContent = [None if i is None else content[i] for i in self.matchLines(oldLines,newLines)]
+        kept = set(oid for oid in newContent if oid is not None)
+        removed = [oid for oid in content if oid not in kept]
+        removedSet = set(removed)
+
+        #Any conditional statements and forbidden clauses that refer to a 
+        #removed parameter have to go as well, even if their lines are 
+        #unchanged.
+        removedParams = set(oid for oid in removed if self.isParameter(self.mem[oid]))
+        dependents = []
+        if(len(removedParams) > 0):
+            for pid in removedParams:
+                dependents.extend(self.conditionsByChild.get(pid,[]))
+                dependents.extend(self.conditionsByParent.get(pid,[]))
+            for forbidden in self.forbiddenList:
+                if(not removedParams.isdisjoint(self.getClauseParameters(forbidden['clause']))):
+                    dependents.append(forbidden)
+        dependents = set(obj['id'] for obj in dependents)
+        for j in range(0,len(newContent)):
+            if(newContent[j] in dependents):
+                newContent[j] = None
+        removed.extend(oid for oid in dependents if oid not in removedSet)
+        pending = [j for j in range(0,len(newContent)) if newContent[j] is None]
+        if(len(removed) == 0 and len(pending) == 0):
+            return ([],[])
+
+        #Keep everything that is changed below, so that the space can be 
+        #restored if a line cannot be parsed. The "objects" themselves are 
+        #never modified.
+        backup = {'mem':dict(self.mem),
+                  'nextID':self.nextID(),
+                  'doc':(list(content),dict(source))}
+        for attr in ['paramList','paramIndex','conditionList','forbiddenList','valueList','commentList']:
+            backup[attr] = copy.copy(getattr(self,attr))
+        for attr in ['conditionsByChild','conditionsByParent']:
+            backup[attr] = dict((pid,list(conditions)) for (pid,conditions) in getattr(self,attr).items())
+        try:
+            self.removeDocumentObjects(removed)
+            #Parse the new lines in two passes, as parseDoc does.
+            lines = []
+            self.parseParameterLines([newLines[j] for j in pending],self.infile,lines,source,[j+1 for j in pending])
+            for (j,line) in zip(pending,lines):
+                if(not isinstance(line,list)):
+                    newContent[j] = line
+            for (j,line) in zip(pending,lines):
+                if(isinstance(line,list)):
+                    newContent[j] = self.parseRawLine(line,j+1)['id']
+                    source[newContent[j]] = line[-1]
+            content[:] = newContent
+
+            #Put the lists back into the order of the document. Anything that
+            #is not in the document stays at the end.
+            positions = dict((oid,i) for (i,oid) in enumerate(content))
+            for objects in [self.paramList,self.conditionList,self.forbiddenList]:
+                objects.sort(key=lambda obj: positions.get(obj['id'],len(positions)))
+            self.paramIndex.clear()
+            for param in self.paramList:
+                if(param['name'] not in self.paramIndex):
+                    self.paramIndex[param['name']] = param['id']
+            self.clearCaches()
+
+            #Do some (non-exhaustive) checks to see if this is a valid document
+            self.testDocumentCorrectness()
+        except:
+            self.mem.clear()
+            self.mem.update(backup.pop('mem'))
+            self.idCounter = itertools.count(backup.pop('nextID'))
+            (oldContent,oldSource) = backup.pop('doc')
+            content[:] = oldContent
+            source.clear()
+            source.update(oldSource)
+            for attr in backup:
+                if(isinstance(backup[attr],list)):
+                    getattr(self,attr)[:] = backup[attr]
+                else:
+                    getattr(self,attr).clear()
+                    getattr(self,attr).update(backup[attr])
+            self.clearCaches()
+            raise
+
+        return (removed,[oid for oid in content if oid not in kept])
+
+
+    def matchLines(self,oldLines,newLines):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for applyDiff. Matches the lines of two versions of
+        #a document, and returns a list with the index of the matching old 
+        #line for each new line, or None if it was inserted or modified. 
+        #Lines that occur exactly once in both versions are used as anchors 
+        #(as in patience diff), so that edits spread throughout a large file 
+        #take time that is close to linear in its length. Stretches between 
+        #the anchors that have no unique lines are matched by difflib.
+        matches = [None]*len(newLines)
+        stack = [(0,len(oldLines),0,len(newLines))]
+        while(len(stack) > 0):
+            (i1,i2,j1,j2) = stack.pop()
+            #Match the common first and last lines.
+            while(i1 < i2 and j1 < j2 and oldLines[i1] == newLines[j1]):
+                matches[j1] = i1
+                i1 += 1
+                j1 += 1
+            while(i1 < i2 and j1 < j2 and oldLines[i2-1] == newLines[j2-1]):
+                i2 -= 1
+                j2 -= 1
+                matches[j2] = i2
+            if(i1 == i2 or j1 == j2):
+                continue
+            #Find the lines that are unique in both stretches, and the longest
+            #sequence of them that appears in the same order in both.
+            oldCounts = collections.Counter(oldLines[i1:i2])
+            newCounts = collections.Counter(newLines[j1:j2])
+            oldIndex = {}
+            for i in range(i1,i2):
+                if(oldCounts[oldLines[i]] == 1 and newCounts[oldLines[i]] == 1):
+                    oldIndex[oldLines[i]] = i
+            anchors = [(j,oldIndex[newLines[j]]) for j in range(j1,j2) if newLines[j] in oldIndex]
+            if(len(anchors) == 0):
+                matcher = difflib.SequenceMatcher(None,oldLines[i1:i2],newLines[j1:j2],False)
+                for (i,j,size) in matcher.get_matching_blocks():
+                    for k in range(0,size):
+                        matches[j1+j+k] = i1+i+k
+                continue
+            #The longest increasing subsequence of the old indices, found by
+            #patience sorting.
+            tails = []
+            tailIndices = []
+            previous = [None]*len(anchors)
+            for k in range(0,len(anchors)):
+                pos = bisect.bisect_left(tails,anchors[k][1])
+                if(pos > 0):
+                    previous[k] = tailIndices[pos-1]
+                if(pos == len(tails)):
+                    tails.append(anchors[k][1])
+                    tailIndices.append(k)
+                else:
+                    tails[pos] = anchors[k][1]
+                    tailIndices[pos] = k
+            sequence = []
+            k = tailIndices[-1]
+            while(k is not None):
+                sequence.append(anchors[k])
+                k = previous[k]
+            sequence.reverse()
+            #Match the anchors, and then the stretches between them.
+            (i,j) = (i1,j1)
+            for (jAnchor,iAnchor) in sequence:
+                matches[jAnchor] = iAnchor
+                stack.append((i,iAnchor,j,jAnchor))
+                (i,j) = (iAnchor+1,jAnchor+1)
+            stack.append((i,i2,j,j2))
+        return matches
+
+
+    def getSourceLine(self,obj):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the (stripped) text of the line of the document that the 
+        #"object" was parsed from, or its printed form if it was not parsed 
+        #from a line.
+        oid = self.getAttr(obj,'id')
+        if(oid in self.doc['source']):
+            return self.doc['source'][oid]
+        return self.printObject(oid)[0].strip()
+
+
+    def removeDocumentObjects(self,removed):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for applyDiff. Removes the "objects" with the IDs in
+        #removed, and all of the "objects" that they own (e.g., their values,
+        #clauses and comments), from memory, the lists and the indexes. The 
+        #document itself is left as it is.
+        removed = set(removed)
+        for oid in removed:
+            obj = self.mem[oid]
+            if(obj['type'] == 'conditional'):
+                self.unindexConditional(obj)
+        owned = set()
+        for oid in removed:
+            owned.update(self.getOwnedObjects(oid))
+            self.doc['source'].pop(oid,None)
+        for objects in [self.paramList,self.conditionList,self.forbiddenList,self.valueList,self.commentList]:
+            objects[:] = [obj for obj in objects if obj['id'] not in owned]
+        #Fall back on any other parameter with the same name, as 
+        #dropParameter does.
+        names = set([name for (name,pid) in self.paramIndex.items() if pid in owned])
+        for name in names:
+            del self.paramIndex[name]
+        for other in self.paramList:
+            if(other['name'] in names and other['name'] not in self.paramIndex):
+                self.paramIndex[other['name']] = other['id']
+        for oid in owned:
+            del self.mem[oid]
+        self.clearCaches()
+
+
+    def getOwnedObjects(self,obj):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the IDs of the "object" and of all of the "objects" that only
+        #exist as a part of it: the comment, the values of a categorical or
+        #ordinal parameter, and the clauses, value arrays and (new) values of
+        #a conditional statement or forbidden clause. The parameters and the
+        #values of parameters that a clause refers to are not part of it.
+        obj = self.getObject(obj)
+        owned = [obj['id']]
+        if(self.isID(obj['comment'])):
+            owned.append(self.toID(obj['comment']))
+        if(obj['type'] in ['categorical','ordinal']):
+            owned.extend(obj['values'])
+        elif(obj['type'] == 'conditional'):
+            owned.extend(self.getOwnedClauseObjects(obj['clauses']))
+        elif(obj['type'] == 'forbidden'):
+            owned.extend(self.getOwnedClauseObjects(obj['clause']))
+        return owned
+
+
+    def getOwnedClauseObjects(self,clause):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for getOwnedObjects. Returns the IDs of the clause
+        #and of the clauses, value arrays and values that are a part of it.
+        clause = self.getObject(clause)
+        owned = [clause['id']]
+        units = [self.getObject(unit) if self.isID(unit) else None for unit in [clause['A'],clause['B']]]
+        for (unit,other) in [(units[0],units[1]),(units[1],units[0])]:
+            if(unit is None or self.isParameter(unit)):
+                continue
+            if(unit['type'] == 'clause'):
+                owned.extend(self.getOwnedClauseObjects(unit))
+            elif(unit['type'] == 'valueArray'):
+                owned.append(unit['id'])
+            elif(unit['type'] == 'value'):
+                #Values of the parameter on the other side belong to it.
+                if(not (other is not None and other['type'] in ['categorical','ordinal'] and unit['id'] in other['values'])):
+                    owned.append(unit['id'])
+        return owned
+
 
     def removeInactive(self,config):
         #Author: YP
         #Created: 2019-04-26
-        #Last updated: 2019-06-28
+        #Last updated: 2026-10-18
         #Removes all inactive child parameters.
         #config = {'p1':v1,'p2':v2,...}
+        #The keys and values of config may be given in any of the forms 
+        #accepted by isActive. A parameter is inactive if any of its parent 
+        #conditions is not satisfied or if any of its ancestors is inactive,
+        #see getActiveParameters.
+
+        active = self.resolveActive(self.convertConfigToIdsAndText(config))
 
-        #Now reduce the configuration only to the remaining active parameters.
-        #We need to keep on doing this until no changes occur, since there may
-        #be grandchildren that are not turned off correctly in the first pass
-        #that removes their parents.
-        oldConfig = config
         reducedConfig = {}
-        changed = True
-        while(changed):
-            changed = False
-            for p in oldConfig.keys():
-                if(self.isActive(p,oldConfig)):
-                    reducedConfig[p] = oldConfig[p]
+        for p in config.keys():
+            if(active[self.getConfigKeyID(p)]):
+                reducedConfig[p] = config[p]
+
+        return reducedConfig
+
+
+    def getActiveParameters(self,config):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the names of all of the parameters that are active in the 
+        #configuration, in the same order as paramList. Unlike isActive, this
+        #resolves the full hierarchy: a parameter is only active if all of its
+        #parent conditions are satisfied and all of its ancestors are active.
+        #config may be given in any of the forms accepted by isActive.
+        active = self.resolveActive(self.convertConfigToIdsAndText(config))
+        return [param['name'] for param in self.paramList if active[param['id']]]
+
+
+    def resolveActive(self,config):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Resolves the activity of every parameter in a single pass over the
+        #parameters in topological order. config must be a dict with 
+        #parameter IDs as keys and values as text (see 
+        #convertConfigToIdsAndText). Returns a dict that maps every parameter
+        #ID to True or False.
+        active = {}
+        for (pid,parents,evaluators) in self.getActivityPlan():
+            isActive = True
+            for parent in parents:
+                if(not active[parent]):
+                    isActive = False
+                    break
+            if(isActive):
+                for evaluate in evaluators:
+                    if(not evaluate(config)):
+                        isActive = False
+                        break
+            active[pid] = isActive
+        return active
+
+
+    def getActivityPlan(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a list with one tuple (parameter ID, parent IDs, compiled 
+        #parent conditions) for each parameter, in topological order, so that
+        #every parameter comes after all of its parents. This is computed once
+        #and cached until the parameters or conditions change.
+        if(self.activityPlan is None):
+            plan = []
+            positions = self.getParamPositions()
+            for pid in self.getTopologicalOrder():
+                parents = []
+                evaluators = []
+                for condition in self.conditionsByChild.get(pid,[]):
+                    for parent in self.getClauseParameters(condition['clauses']):
+                        #Skip any parents that have been removed.
+                        if(parent in positions and parent not in parents):
+                            parents.append(parent)
+                    evaluators.append(self.compileCondition(condition,'id'))
+                plan.append((pid,tuple(parents),tuple(evaluators)))
+            self.activityPlan = plan
+        return self.activityPlan
+
+
+    def getTopologicalOrder(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the IDs of all of the parameters ordered so that every parent
+        #comes before its children. Parameters without any relationship keep 
+        #their order from paramList. Throws an exception if the conditional
+        #statements contain a cycle.
+        if(self.topologicalOrder is None):
+            positions = self.getParamPositions()
+            known = set(positions)
+            numParents = {}
+            for param in self.paramList:
+                parents = set()
+                for condition in self.conditionsByChild.get(param['id'],[]):
+                    parents.update(self.getClauseParameters(condition['clauses']))
+                numParents[param['id']] = len(parents & known)
+            ready = [param['id'] for param in self.paramList if numParents[param['id']] == 0]
+            ready.reverse()
+            order = []
+            while(len(ready) > 0):
+                pid = ready.pop()
+                order.append(pid)
+                children = set()
+                for condition in self.conditionsByParent.get(pid,[]):
+                    children.add(condition['child'])
+                for child in sorted(children & known, key=lambda c: positions[c], reverse=True):
+                    numParents[child] -= 1
+                    if(numParents[child] == 0):
+                        ready.append(child)
+            if(len(order) < len(self.paramList)):
+                cycle = [self.getAttr(pid,'name') for pid in numParents if numParents[pid] > 0]
+                raise Exception('The conditional statements contain a cycle involving the parameters: ' + ', '.join(cycle))
+            self.topologicalOrder = order
+        return self.topologicalOrder
+
+
+    def getDescendantPlan(self,param):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a list with one tuple (name, parent names, parent conditions
+        #compiled for configurations keyed by name) for each descendant of 
+        #the parameter (i.e., its children, their children, and so on), in 
+        #topological order. This is used to re-resolve the activity of only 
+        #the parameters that can be affected when the value of param changes.
+        #Each plan is computed once and cached until the parameters or 
+        #conditions change.
+        pid = self.getConfigKeyID(param)
+        if(pid not in self.descendantPlans):
+            positions = self.getParamPositions()
+            descendants = set()
+            stack = [pid]
+            while(len(stack) > 0):
+                for condition in self.conditionsByParent.get(stack.pop(),[]):
+                    child = condition['child']
+                    if(child in positions and child not in descendants):
+                        descendants.add(child)
+                        stack.append(child)
+            plan = []
+            for child in self.getTopologicalOrder():
+                if(child not in descendants):
+                    continue
+                parents = []
+                evaluators = []
+                for condition in self.conditionsByChild.get(child,[]):
+                    for parent in self.getClauseParameters(condition['clauses']):
+                        name = self.getAttr(parent,'name')
+                        if(parent in positions and name not in parents):
+                            parents.append(name)
+                    evaluators.append(self.compileCondition(condition,'name'))
+                plan.append((self.getAttr(child,'name'),tuple(parents),tuple(evaluators)))
+            self.descendantPlans[pid] = plan
+        return self.descendantPlans[pid]
+
+
+    def neighbours(self,config,numericSteps=(0.1,),seed=None):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A generator over the one-exchange neighbours of a configuration (a 
+        #dict with parameter names as keys and parameter values as text, or
+        #numbers for numerical parameters), as used by ParamILS- and GPS-style
+        #local search. Each neighbour changes the value of one active 
+        #parameter:
+        # - categorical parameters take each of their other values;
+        # - ordinal parameters move to the next lower or higher value;
+        # - real and integer parameters move down and up by each of the 
+        #   numericSteps, given as fractions of their range (on a log scale,
+        #   if they have one), and are clipped to the range.
+        #Only the descendants of the changed parameter are re-resolved: 
+        #children that become active take their default value and children
+        #that become inactive are removed. Forbidden neighbours are skipped.
+        #If seed is None, the neighbours are generated in the order of 
+        #paramList, otherwise in a random order drawn with random.Random(seed).
+        #Neighbours are only created as they are requested, so callers can 
+        #stop early at little cost.
+        config = self.removeInactive(config)
+        moves = []
+        for param in self.paramList:
+            name = param['name']
+            if(name not in config):
+                continue
+            value = config[name]
+            if(param['type'] == 'categorical'):
+                for text in self.getNamedValues(param):
+                    if(text != value):
+                        moves.append((param,text))
+            elif(param['type'] == 'ordinal'):
+                texts = self.getNamedValues(param)
+                rank = texts.index(value)
+                for k in [rank - 1, rank + 1]:
+                    if(k >= 0 and k < len(texts)):
+                        moves.append((param,texts[k]))
+            else:
+                for step in numericSteps:
+                    for direction in [-1,1]:
+                        moves.append((param,direction*step))
+        if(seed is not None):
+            random.Random(seed).shuffle(moves)
+
+        defaults = None
+        seen = set()
+        for (param,move) in moves:
+            name = param['name']
+            if(self.isNumeric(param)):
+                move = self.stepValue(param,config[name],move)
+                if(move is None or (name,move) in seen):
+                    continue
+                seen.add((name,move))
+            neighbour = dict(config)
+            neighbour[name] = move
+            for (child,parents,evaluators) in self.getDescendantPlan(param):
+                active = True
+                for parent in parents:
+                    if(parent not in neighbour):
+                        active = False
+                        break
+                if(active):
+                    for evaluate in evaluators:
+                        if(not evaluate(neighbour)):
+                            active = False
+                            break
+                if(active and child not in neighbour):
+                    if(defaults is None):
+                        defaults = self.getDefault()
+                    neighbour[child] = defaults[child]
+                elif(not active and child in neighbour):
+                    del neighbour[child]
+            if(self.getForbidden(neighbour) is None):
+                yield neighbour
+
+
+    def stepValue(self,param,value,step):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for neighbours that moves the value of a real or 
+        #integer parameter by step (a fraction of its range, on a log scale if
+        #it has one) and clips it to the range. Integer values move by at 
+        #least one. Returns None if the value does not change.
+        (lower,upper,log) = self.getScale(param)
+        value = float(value)
+        if(log):
+            moved = math.exp(math.log(value) + step*(upper - lower))
+        else:
+            moved = value + step*(upper - lower)
+        (lower,upper) = param['values']
+        if(param['type'] == 'integer'):
+            moved = int(round(moved))
+            if(moved == value):
+                moved = int(value) + (1 if step > 0 else -1)
+        moved = min(max(moved,lower),upper)
+        if(moved == value):
+            return None
+        if(param['type'] == 'integer'):
+            return int(moved)
+        return float(moved)
+
+
+    def getConfigurationCodec(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the tables used to convert configurations to and from 
+        #Configuration objects: the parameter names in the same order as 
+        #paramList, a dict that maps each name to its position, a function 
+        #for each parameter that converts a value to its canonical form (a 
+        #float for real parameters, an int for integer parameters and the 
+        #index of the value for categorical and ordinal parameters) and, for
+        #each parameter, the list of value texts (None for numerical 
+        #parameters).
+        if(self.configurationCodec is None):
+            names = []
+            positions = {}
+            converters = []
+            texts = []
+            for param in self.paramList:
+                positions[param['name']] = len(names)
+                names.append(param['name'])
+                if(param['type'] == 'real'):
+                    converters.append(float)
+                    texts.append(None)
+                elif(param['type'] == 'integer'):
+                    converters.append(self.integerValue)
+                    texts.append(None)
+                else:
+                    converters.append(self.getValueCodes(param).__getitem__)
+                    texts.append(self.getNamedValues(param))
+            self.configurationCodec = (names,positions,converters,texts)
+        return self.configurationCodec
+
+
+    def integerValue(self,value):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Converts the value of an integer parameter (a number or text) to an
+        #int. Raises a ValueError if it is not a whole number.
+        if(type(value) is int):
+            return value
+        number = float(value)
+        value = int(number)
+        if(value != number):
+            raise ValueError(str(number) + ' is not a whole number.')
+        return value
+
+
+    def getConfigKeyID(self,p):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the ID of a parameter given as a key of a configuration: a 
+        #name, an ID or an "object".
+        if(type(p) is str and not self.isID(p)):
+            return self.lookupParamID(p)
+        return self.getAttr(self.getObject(p),'id')
+
+
+    def requireNumpy(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Raises an exception if numpy, which is needed for all of the functions
+        #that work on batches of configurations, is not installed.
+        if(np is None):
+            raise Exception('numpy is required to work with batches of configurations. Please install it with "pip install numpy".')
+
+
+    def configsToArray(self,configs):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Encodes a list of configurations (dicts with parameter names as keys
+        #and parameter values as text or numbers, e.g., as returned by 
+        #getDefault) as an N x P numpy array, with one column per parameter in
+        #the same order as paramList. Numerical parameters are stored as 
+        #numbers, categorical and ordinal parameters as the index of their 
+        #value in the parameter's list of values, and missing parameters as
+        #NaN.
+        self.requireNumpy()
+        X = np.empty((len(configs),len(self.paramList)),order='F')
+        names = [param['name'] for param in self.paramList]
+        #Reading the configurations one at a time and then transposing them
+        #is much faster than reading one parameter at a time.
+        rows = [list(map(config.get,names)) for config in configs]
+        columns = zip(*rows) if len(rows) > 0 else [[] for name in names]
+        for (j,column) in zip(range(0,len(self.paramList)),columns):
+            param = self.paramList[j]
+            name = param['name']
+            if(self.isNumeric(param)):
+                X[:,j] = [np.nan if v is None else float(v) for v in column]
+            else:
+                codes = self.getValueCodes(param)
+                codes[None] = np.nan
+                try:
+                    X[:,j] = [codes[v] for v in column]
+                except KeyError:
+                    for v in column:
+                        if(v not in codes):
+                            raise Exception('"' + str(v) + '" is not a value of ' + name + '.')
+        return X
+
+
+    def arrayToConfigs(self,X):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Decodes an array created by configsToArray back into a list of 
+        #configurations (dicts with parameter names as keys). NaN entries are
+        #left out.
+        self.requireNumpy()
+        X = np.asarray(X,dtype=float)
+        names = [param['name'] for param in self.paramList]
+        missing = np.isnan(X)
+        #Decode each parameter into a list of values, with None for missing
+        #values, and then build the configurations one at a time.
+        columns = []
+        for j in range(0,len(self.paramList)):
+            param = self.paramList[j]
+            column = X[:,j]
+            if(not self.isNumeric(param)):
+                texts = self.getNamedValues(param) + [None]
+                codes = np.where(missing[:,j],len(texts) - 1,column).astype(int)
+                columns.append([texts[k] for k in codes.tolist()])
+                continue
+            if(param['type'] == 'integer'):
+                values = np.where(missing[:,j],0,column).astype(int).tolist()
+            else:
+                values = column.tolist()
+            if(missing[:,j].any()):
+                for i in np.flatnonzero(missing[:,j]).tolist():
+                    values[i] = None
+            columns.append(values)
+        configs = []
+        for (row,incomplete) in zip(zip(*columns),missing.any(axis=1).tolist()):
+            if(incomplete):
+                configs.append({name: value for (name,value) in zip(names,row) if value is not None})
+            else:
+                configs.append(dict(zip(names,row)))
+        if(len(names) == 0):
+            configs = [{} for i in range(0,X.shape[0])]
+        return configs
+
+
+    def sample(self,n,seed=None,asArray=False):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Draws n random configurations in one batch. Real and integer 
+        #parameters are sampled uniformly from their range, or log-uniformly if
+        #they are on a log scale, and categorical and ordinal parameters are
+        #sampled uniformly from their values. Inactive parameters are left
+        #out, and configurations that are forbidden are drawn again.
+        #seed may be anything accepted by numpy.random.default_rng. Returns a
+        #list of configurations (dicts with parameter names as keys), or, if 
+        #asArray is True, an array encoded as by configsToArray, which is much
+        #faster for large batches.
+        self.requireNumpy()
+        rng = np.random.default_rng(seed)
+        X = self.sampleArray(n,rng)
+        forbidden = self.forbiddenMask(X)
+        rounds = 0
+        while(forbidden.any()):
+            rounds += 1
+            if(rounds > PCS.maxSampleRounds):
+                raise Exception('Unable to sample configurations that are not forbidden after ' + str(PCS.maxSampleRounds) + ' attempts.')
+            rows = np.flatnonzero(forbidden)
+            X[rows] = self.sampleArray(len(rows),rng)
+            forbidden[rows] = self.forbiddenMask(X[rows])
+        if(asArray):
+            return X
+        return self.arrayToConfigs(X)
+
+
+    def sampleArray(self,n,rng):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for sample that draws n configurations, ignoring the
+        #forbidden clauses, and returns them encoded as by configsToArray.
+        #Columns are stored contiguously, since they are filled one at a time.
+        X = np.empty((n,len(self.paramList)),order='F')
+        for j in range(0,len(self.paramList)):
+            param = self.paramList[j]
+            if(self.isNumeric(param)):
+                (lower,upper) = param['values']
+                if(param['type'] == 'integer'):
+                    #Sample from [lower, upper + 1) and round down.
+                    upper = upper + 1
+                if(param['log']):
+                    if(lower <= 0):
+                        raise Exception('Cannot sample ' + param['name'] + ' on a log scale, because its range includes values that are not positive.')
+                    X[:,j] = np.exp(rng.uniform(np.log(lower),np.log(upper),n))
+                else:
+                    X[:,j] = rng.uniform(lower,upper,n)
+                if(param['type'] == 'integer'):
+                    X[:,j] = np.minimum(np.floor(X[:,j]),upper - 1)
+            else:
+                X[:,j] = rng.integers(0,len(param['values']),n)
+        X[~self.getActiveMask(X)] = np.nan
+        return X
+
+
+    def forbiddenMask(self,configs):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Checks a whole batch of configurations against the forbidden clauses
+        #at once. configs is either a list of configurations (dicts with 
+        #parameter names as keys) or an array encoded as by configsToArray.
+        #Returns a boolean array that is True for every configuration that is
+        #forbidden (see getForbidden).
+        self.requireNumpy()
+        if(isinstance(configs,np.ndarray)):
+            X = np.asarray(configs,dtype=float)
+        else:
+            X = self.configsToArray(configs)
+        forbidden = np.zeros(X.shape[0],dtype=bool)
+        (tables,plan) = self.getForbiddenPlan()
+        for (names,pids,columns,lookup,radices,codes) in tables:
+            #Combine the value indices of the parameters into a single integer
+            #and look it up, unless any of them are missing.
+            missing = np.zeros(X.shape[0],dtype=bool)
+            combined = np.zeros(X.shape[0],dtype=np.int64)
+            for k in range(0,len(columns)):
+                column = X[:,columns[k]]
+                missing |= np.isnan(column)
+                combined += np.where(np.isnan(column),0,column).astype(np.int64)*radices[k]
+            forbidden |= np.isin(combined,codes) & ~missing
+        for (index,obj,columns,names,evaluateByName,evaluateById) in plan:
+            satisfied = self.compileClauseArray(obj['clause'])(X)
+            for j in columns:
+                satisfied &= ~np.isnan(X[:,j])
+            forbidden |= satisfied
+        return forbidden
+
+
+    def isForbidden(self,config):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns True if the configuration satisfies any of the forbidden 
+        #clauses, see getForbidden.
+        return self.getForbidden(config) is not None
+
+
+    def getForbidden(self,config):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the first forbidden "object" (in the order of forbiddenList)
+        #whose clause is satisfied by the configuration, or None if the 
+        #configuration is not forbidden. Following SMAC, a forbidden clause
+        #only applies to configurations in which all of its parameters are 
+        #present, i.e., active.
+        #config may be given in any of the forms accepted by isActive; it is
+        #checked most quickly if it has parameter names as keys and parameter
+        #values as text (or numbers, for numerical parameters). Values of 
+        #numerical parameters are compared as numbers (so 5, '5' and '5.0' 
+        #are equal), exactly as in forbiddenMask, see comparisonExpression.
+        byName = config.keys() <= self.paramIndex.keys()
+        if(byName):
+            for value in config.values():
+                if(isinstance(value,(PCSObject,dict,ObjectID))):
+                    byName = False
+                    break
+        if(not byName):
+            config = self.convertConfigToIdsAndText(config)
+        (tables,plan) = self.getForbiddenPlan()
+        #Forbidden clauses that are conjunctions of equalities cost one lookup
+        #per set of parameters.
+        first = None
+        for (names,pids,columns,lookup,radices,codes) in tables:
+            if(byName):
+                hit = lookup.get(tuple([config.get(name) for name in names]))
+            else:
+                hit = lookup.get(tuple([config.get(pid) for pid in pids]))
+            if(hit is not None and (first is None or hit[0] < first[0])):
+                first = hit
+        #Only the other clauses that come before the first hit can change the
+        #result.
+        for (index,obj,columns,names,evaluateByName,evaluateById) in plan:
+            if(first is not None and index > first[0]):
+                break
+            if(byName):
+                for name in names:
+                    if(name not in config):
+                        break
+                else:
+                    if(evaluateByName(config)):
+                        return obj
+            else:
+                for j in columns:
+                    if(self.paramList[j]['id'] not in config):
+                        break
+                else:
+                    if(evaluateById(config)):
+                        return obj
+        if(first is None):
+            return None
+        return first[1]
+
+
+    def getForbiddenPlan(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Compiles the forbidden clauses for getForbidden and forbiddenMask.
+        #Returns a tuple (tables, plan). 
+        #Clauses that are conjunctions of equalities between categorical or 
+        #ordinal parameters and their values (e.g., the classic {a=x, b=y}) 
+        #are stored in tables if there are several of them for the same set of
+        #parameters, with one entry (parameter names, parameter IDs,
+        #columns of the parameters in encoded arrays, lookup, radices, codes)
+        #for each set of parameters used by such clauses. lookup maps tuples 
+        #of the text of the values of the parameters to (index in 
+        #forbiddenList, forbidden "object") for the first clause that forbids
+        #them. codes is an array of the same combinations of values, encoded
+        #as the sum of the value indices times the (integer) radices, or None
+        #if numpy is not installed. 
+        #plan contains one entry (index in forbiddenList, forbidden "object",
+        #columns of its parameters, names of its parameters, clause compiled 
+        #for configurations keyed by name, clause compiled for configurations
+        #keyed by ID) for each of the other clauses, in order. Clauses that 
+        #refer to a parameter that has been removed are left out. 
+        #This is computed once and cached until the parameters or forbidden 
+        #clauses change.
+        if(self.forbiddenPlan is None):
+            positions = self.getParamPositions()
+            equalities = {}
+            tables = {}
+            for index in range(0,len(self.forbiddenList)):
+                obj = self.forbiddenList[index]
+                pairs = self.getEqualities(obj['clause'])
+                if(pairs is not None and all([pid in positions for (pid,text) in pairs])):
+                    pairs.sort(key=lambda pair: positions[pair[0]])
+                    equalities[index] = pairs
+                    key = tuple([pid for (pid,text) in pairs])
+                    lookup = tables.setdefault(key,{})
+                    texts = tuple([text for (pid,text) in pairs])
+                    if(texts not in lookup):
+                        lookup[texts] = (index,obj)
+            #A lookup is only faster than evaluating the clause if there are
+            #several clauses for the same set of parameters. The combinations
+            #of values are encoded as 64 bit integers by forbiddenMask, so the
+            #clauses of sets of parameters with more combinations than that
+            #are evaluated one at a time instead.
+            for key in list(tables.keys()):
+                combinations = 1
+                for pid in key:
+                    combinations *= len(self.getAttr(pid,'values'))
+                if(len(tables[key]) < 2 or combinations > PCS.maxTableCombinations):
+                    del tables[key]
+            plan = []
+            for index in range(0,len(self.forbiddenList)):
+                obj = self.forbiddenList[index]
+                if(index in equalities and tuple([pid for (pid,text) in equalities[index]]) in tables):
+                    continue
+                pids = self.getClauseParameters(obj['clause'])
+                if(not all([pid in positions for pid in pids])):
+                    continue
+                plan.append((index,
+                             obj,
+                             tuple([positions[pid] for pid in pids]),
+                             tuple([self.getAttr(pid,'name') for pid in pids]),
+                             self.compileClause(obj['clause'],'name'),
+                             self.compileClause(obj['clause'],'id')))
+            self.forbiddenPlan = ([self.getForbiddenTable(pids,lookup) for (pids,lookup) in tables.items()],plan)
+        return self.forbiddenPlan
+
+
+    def getForbiddenTable(self,pids,lookup):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for getForbiddenPlan that builds the entry of the
+        #tables for the set of parameters pids.
+        positions = self.getParamPositions()
+        radices = []
+        radix = 1
+        for pid in pids:
+            radices.append(radix)
+            radix *= len(self.getAttr(pid,'values'))
+        codes = None
+        if(np is not None):
+            valueCodes = [self.getValueCodes(pid) for pid in pids]
+            codes = np.array(sorted([sum([valueCodes[k][texts[k]]*radices[k] for k in range(0,len(pids))]) for texts in lookup]),dtype=np.int64)
+        return (tuple([self.getAttr(pid,'name') for pid in pids]),
+                pids,
+                tuple([positions[pid] for pid in pids]),
+                lookup,
+                tuple(radices),
+                codes)
+
+
+    def getEqualities(self,clause):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #If the clause is a conjunction (&&) of equalities (==) between 
+        #distinct categorical or ordinal parameters and their values, returns
+        #a list of the pairs (parameter ID, text of the value). Returns None
+        #otherwise.
+        clause = self.getObject(clause)
+        if(clause['type'] != 'clause'):
+            return None
+        if(clause['operator'] == '&&'):
+            pairs = []
+            for unit in [clause['A'],clause['B']]:
+                if(not self.isID(unit)):
+                    return None
+                unitPairs = self.getEqualities(unit)
+                if(unitPairs is None):
+                    return None
+                pairs.extend(unitPairs)
+            if(len(set([pid for (pid,text) in pairs])) < len(pairs)):
+                #The same parameter appears twice.
+                return None
+            return pairs
+        if(clause['operator'] != '=='):
+            return None
+        (A,B) = (clause['A'],clause['B'])
+        if(not self.isID(A) or not self.isID(B)):
+            return None
+        (A,B) = (self.getObject(A),self.getObject(B))
+        if(self.isParameter(B)):
+            (A,B) = (B,A)
+        if(not self.isParameter(A) or self.isNumeric(A) or B['type'] != 'value'):
+            return None
+        if(B['text'] not in self.getNamedValues(A)):
+            return None
+        return [(A['id'],B['text'])]
+
+
+    def validate(self,configs):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Checks a whole batch of configurations at once. configs is either a
+        #list of configurations (dicts with parameter names as keys) or an 
+        #array encoded as by configsToArray. Every value must be a value of
+        #its parameter (for categorical and ordinal parameters) or a number
+        #within the range of its parameter (for numerical parameters), the
+        #values of integer parameters must be whole numbers, exactly the 
+        #active parameters must be present and no forbidden clause may be 
+        #satisfied. 
+        #Returns two arrays with one entry per configuration: the error code,
+        #i.e., the index of the first failed check in PCS.validationErrors (0
+        #if the configuration is valid), and the position in paramList of the
+        #first parameter that failed it (-1 if the configuration is valid or
+        #if the check is not about a single parameter).
+        self.requireNumpy()
+        if(isinstance(configs,np.ndarray)):
+            X = np.array(configs,dtype=float,order='F')
+            if(X.ndim != 2 or X.shape[1] != len(self.paramList)):
+                raise Exception('Expected an array with one column for each of the ' + str(len(self.paramList)) + ' parameters.')
+            unknown = np.zeros(X.shape[0],dtype=bool)
+            invalid = np.zeros(X.shape,dtype=bool,order='F')
+        else:
+            (X,unknown,invalid) = self.validationArray(configs)
+        present = ~np.isnan(X)
+        outOfRange = np.zeros(X.shape,dtype=bool,order='F')
+        notInteger = np.zeros(X.shape,dtype=bool,order='F')
+        with np.errstate(invalid='ignore'):
+            for j in range(0,len(self.paramList)):
+                param = self.paramList[j]
+                column = X[:,j]
+                if(self.isNumeric(param)):
+                    (lower,upper) = param['values']
+                    outOfRange[:,j] = (column < lower) | (column > upper)
+                    if(param['type'] == 'integer'):
+                        notInteger[:,j] = present[:,j] & (column != np.floor(column))
+                else:
+                    invalid[:,j] |= (column < 0) | (column >= len(param['values'])) | (column != np.floor(column)) 
+                    invalid[:,j] &= present[:,j]
+        #Resolve the activity of the parameters as if the invalid values were
+        #missing.
+        X[invalid] = np.nan
+        active = self.getActiveMask(X)
+        errors = np.zeros(X.shape[0],dtype=np.int8)
+        params = np.full(X.shape[0],-1,dtype=np.int32)
+        checks = [unknown,invalid,outOfRange,notInteger,present & ~active,active & ~present]
+        for code in range(1,len(checks) + 1):
+            failed = checks[code - 1]
+            if(failed.ndim == 1):
+                errors[failed & (errors == 0)] = code
+                continue
+            rows = np.flatnonzero(failed.any(axis=1) & (errors == 0))
+            errors[rows] = code
+            params[rows] = failed[rows].argmax(axis=1)
+        rows = np.flatnonzero(errors == 0)
+        if(len(rows) > 0):
+            errors[rows[self.forbiddenMask(X[rows])]] = self.validationErrors.index('forbidden')
+        return errors, params
+
+
+    def validationArray(self,configs):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for validate that encodes a list of configurations
+        #as configsToArray does, but without raising exceptions. Unknown 
+        #values of categorical and ordinal parameters are encoded as -1. 
+        #Returns the array, a boolean array that is True for every 
+        #configuration with unknown parameter names and a boolean array that
+        #is True wherever the value of a numerical parameter is not a number
+        #(these values are encoded as NaN).
+        X = np.empty((len(configs),len(self.paramList)),order='F')
+        invalid = np.zeros(X.shape,dtype=bool,order='F')
+        names = [param['name'] for param in self.paramList]
+        known = set(names)
+        unknown = np.array([not known.issuperset(config) for config in configs],dtype=bool)
+        rows = [list(map(config.get,names)) for config in configs]
+        columns = zip(*rows) if len(rows) > 0 else [[] for name in names]
+        for (j,column) in zip(range(0,len(self.paramList)),columns):
+            param = self.paramList[j]
+            if(self.isNumeric(param)):
+                try:
+                    X[:,j] = [np.nan if v is None else float(v) for v in column]
+                except (ValueError, TypeError):
+                    for i in range(0,len(column)):
+                        try:
+                            X[i,j] = np.nan if column[i] is None else float(column[i])
+                        except (ValueError, TypeError):
+                            X[i,j] = np.nan
+                            invalid[i,j] = True
+            else:
+                codes = self.getValueCodes(param)
+                codes[None] = np.nan
+                X[:,j] = [codes.get(v,-1.0) for v in column]
+        return X, unknown, invalid
+
+
+    def encode(self,configs,impute=-1.0):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Encodes a batch of configurations as numerical feature vectors, e.g.,
+        #for fitting surrogate models. configs is either a list of 
+        #configurations (dicts with parameter names as keys) or an array 
+        #encoded as by configsToArray. Returns an N x P array with one column
+        #per parameter in the same order as paramList. Real and integer 
+        #parameters are scaled to [0, 1] (on a log scale, if they have one), 
+        #categorical parameters are encoded as the index of their value and 
+        #ordinal parameters as the rank of their value. Missing (inactive) 
+        #parameters are set to impute.
+        self.requireNumpy()
+        if(isinstance(configs,np.ndarray)):
+            X = np.asarray(configs,dtype=float)
+        else:
+            X = self.configsToArray(configs)
+        Z = np.empty(X.shape,order='F')
+        for j in range(0,len(self.paramList)):
+            param = self.paramList[j]
+            if(self.isNumeric(param)):
+                (lower,upper,log) = self.getScale(param)
+                column = X[:,j]
+                if(log):
+                    column = np.log(column)
+                if(upper > lower):
+                    Z[:,j] = (column - lower)/(upper - lower)
+                else:
+                    Z[:,j] = 0
+            else:
+                Z[:,j] = X[:,j]
+        Z[np.isnan(X)] = impute
+        return Z
+
+
+    def decode(self,Z,asArray=False):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Decodes a batch of feature vectors created by encode (or, e.g., 
+        #proposed by a model that was fit to them) back into configurations.
+        #Values are clipped to the range of each parameter and integer, 
+        #categorical and ordinal values are rounded. Which parameters are 
+        #active is resolved from the decoded values, so the values imputed for
+        #inactive parameters are ignored. Returns a list of configurations 
+        #(dicts with parameter names as keys), or, if asArray is True, an 
+        #array encoded as by configsToArray.
+        self.requireNumpy()
+        Z = np.asarray(Z,dtype=float)
+        if(Z.ndim != 2 or Z.shape[1] != len(self.paramList)):
+            raise Exception('Expected an array with one column for each of the ' + str(len(self.paramList)) + ' parameters.')
+        X = np.empty(Z.shape,order='F')
+        for j in range(0,len(self.paramList)):
+            param = self.paramList[j]
+            if(self.isNumeric(param)):
+                (lower,upper,log) = self.getScale(param)
+                column = lower + np.clip(Z[:,j],0,1)*(upper - lower)
+                if(log):
+                    column = np.exp(column)
+                (lower,upper) = param['values']
+                if(param['type'] == 'integer'):
+                    column = np.round(column)
+                X[:,j] = np.clip(column,lower,upper)
+            else:
+                X[:,j] = np.clip(np.round(Z[:,j]),0,len(param['values']) - 1)
+        X[~self.getActiveMask(X)] = np.nan
+        if(asArray):
+            return X
+        return self.arrayToConfigs(X)
+
+
+    def getScale(self,param):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns (lower, upper, log) for a real or integer parameter, where
+        #lower and upper are the bounds of its range, transformed to a log
+        #scale if log is True.
+        param = self.getObject(param)
+        (lower,upper) = param['values']
+        if(not param['log']):
+            return (float(lower),float(upper),False)
+        if(lower <= 0):
+            raise Exception(param['name'] + ' cannot be on a log scale, because its range includes values that are not positive.')
+        return (math.log(lower),math.log(upper),True)
+
+
+    def getValueCodes(self,param):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a dict that maps the text of each value of a categorical or 
+        #ordinal parameter to its index in the parameter's list of values.
+        codes = {}
+        texts = self.getNamedValues(self.getObject(param))
+        for i in range(0,len(texts)):
+            if(texts[i] not in codes):
+                codes[texts[i]] = i
+        return codes
+
+
+    def getActiveMask(self,X):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Resolves the activity of every parameter for a whole batch of 
+        #configurations at once. X must be an N x P array encoded as by 
+        #configsToArray. Returns an N x P boolean array that is True wherever
+        #the parameter is active, i.e., all of its parent conditions are 
+        #satisfied and all of its ancestors are active (see 
+        #getActiveParameters).
+        #Comparisons with missing (NaN) parameters are false, except for !=.
+        self.requireNumpy()
+        X = np.asarray(X,dtype=float)
+        if(X.ndim != 2 or X.shape[1] != len(self.paramList)):
+            raise Exception('Expected an array with one column for each of the ' + str(len(self.paramList)) + ' parameters.')
+        mask = np.ones(X.shape,dtype=bool)
+        positions = self.getParamPositions()
+        for (pid,parents,evaluators) in self.getActivityPlan():
+            j = positions[pid]
+            for parent in parents:
+                mask[:,j] &= mask[:,positions[parent]]
+            for condition in self.conditionsByChild.get(pid,[]):
+                mask[:,j] &= self.compileClauseArray(condition['clauses'])(X)
+        return mask
+
+
+    def compileClauseArray(self,obj):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Compiles a clause into a function that evaluates it for every row of
+        #an array encoded as by configsToArray, returning a boolean array.
+        #The function is cached with the other compiled clauses.
+        obj = self.getObject(obj)
+        key = (obj['id'],'array')
+        if(key not in self.compiledClauses):
+            self.compiledClauses[key] = self.arrayClause(obj)
+        return self.compiledClauses[key]
+
+
+    def arrayClause(self,obj):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #A helper function for compileClauseArray that builds the function for
+        #a single clause, recursively.
+        operator = obj['operator']
+        if(operator in ['&&','||']):
+            evalA = self.arrayClause(self.getObject(obj['A']))
+            evalB = self.arrayClause(self.getObject(obj['B']))
+            if(operator == '&&'):
+                return lambda X: evalA(X) & evalB(X)
+            return lambda X: evalA(X) | evalB(X)
+
+        A = obj['A']
+        B = obj['B']
+        if(self.isConstant(A) and not self.isConstant(B)):
+            #Put the parameter on the left.
+            (A,B) = (B,A)
+            operator = {'<':'>','>':'<','<=':'>=','>=':'<='}.get(operator,operator)
+        A = self.getObject(A)
+        if(not self.isParameter(A)):
+            raise Exception('Clauses must compare a parameter with a value or another parameter: ' + str(obj))
+        column = self.arrayColumn(A)
+
+        if(operator == 'in'):
+            texts = [self.getAttr(v,'text') for v in self.getAttr(B,'values')]
+            codes = np.array([self.arrayCode(A,text) for text in texts])
+            return lambda X: np.isin(column(X),codes)
+
+        if(self.isConstant(B)):
+            if(operator in ['==','!=']):
+                code = self.arrayCode(A,self.getConstant(B))
+                if(operator == '=='):
+                    return lambda X: column(X) == code
+                return lambda X: ~(column(X) == code)
+            #Numerical comparisons use the numerical value of the text.
+            code = float(self.getConstant(B))
+            valuesA = self.arrayNumbers(A)
+            return lambda X: self.compareArrays(valuesA(X),operator,code)
+
+        #We are comparing two parameters.
+        B = self.getObject(B)
+        if(operator in ['==','!='] and not self.isNumeric(A) and not self.isNumeric(B)):
+            valuesA = self.arrayTexts(A)
+            valuesB = self.arrayTexts(B)
+        else:
+            valuesA = self.arrayNumbers(A)
+            valuesB = self.arrayNumbers(B)
+        return lambda X: self.compareArrays(valuesA(X),operator,valuesB(X))
+
+
+    def arrayColumn(self,param):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a function that extracts the column of a parameter from an 
+        #encoded array. Clauses can still name a parameter that has been 
+        #removed (see removeParameter), which is treated as missing in every
+        #row, i.e., its column is all NaN.
+        positions = self.getParamPositions()
+        if(param['id'] not in positions):
+            return lambda X: np.full(X.shape[0],np.nan)
+        j = positions[param['id']]
+        return lambda X: X[:,j]
+
+
+    def arrayCode(self,param,text):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the number that stands for the value text of the parameter in
+        #an array encoded by configsToArray, or NaN if it is not a value of 
+        #the parameter (or not a number, for a numerical parameter).
+        if(self.isNumeric(param)):
+            return toNumber(text)
+        return self.getValueCodes(param).get(text,np.nan)
+
+
+    def arrayNumbers(self,param):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a function that extracts the numerical values of a parameter
+        #from an encoded array. The values of categorical and ordinal 
+        #parameters are converted from text (NaN if they are not numbers).
+        column = self.arrayColumn(param)
+        if(self.isNumeric(param)):
+            return column
+        numbers = []
+        for text in self.getNamedValues(param):
+            try:
+                numbers.append(float(text))
+            except ValueError:
+                numbers.append(np.nan)
+        return self.arrayLookup(column,np.array(numbers + [np.nan]))
+
+
+    def arrayTexts(self,param):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a function that extracts the values of a categorical or 
+        #ordinal parameter from an encoded array as codes of the value text 
+        #that can be compared with the values of other parameters.
+        column = self.arrayColumn(param)
+        codes = []
+        for text in self.getNamedValues(param):
+            codes.append(self.getTextCode(text))
+        return self.arrayLookup(column,np.array(codes + [np.nan]))
+
+
+    def arrayLookup(self,column,table):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a function that maps the value indices in the column of an 
+        #encoded array (extracted by the function column, see arrayColumn) 
+        #through table. The last entry of the table is used for missing (NaN)
+        #values.
+        missing = len(table) - 1
+        def lookup(X):
+            values = column(X)
+            return table[np.where(np.isnan(values),missing,values).astype(int)]
+        return lookup
+
+
+    def getTextCode(self,text):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a number that uniquely identifies the text of a value. These
+        #are used to compare the values of two different parameters in 
+        #encoded arrays.
+        if(text not in self.textCodes):
+            self.textCodes[text] = -1.0 - len(self.textCodes)
+        return self.textCodes[text]
+
+
+    def compareArrays(self,A,operator,B):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Applies the comparison operator element-wise.
+        if(operator == '=='):
+            return A == B
+        elif(operator == '!='):
+            return ~(A == B)
+        elif(operator == '<'):
+            return A < B
+        elif(operator == '>'):
+            return A > B
+        elif(operator == '<='):
+            return A <= B
+        elif(operator == '>='):
+            return A >= B
+        raise Exception('Unknown operator: ' + operator)
+
+
+
+def toNumber(value):
+    #Converts the value of a parameter to a float for the comparisons of 
+    #compiled clauses, see PCS.comparisonExpression. Missing values (None)
+    #stay None, and text that is not a number becomes NaN, so that neither 
+    #is equal to any number, as with the NaNs of the arrays used by 
+    #PCS.compileClauseArray.
+    if(value is None):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+#The functions below are run by the processes of the pools that parseDoc 
+#uses to parse files in parallel. They are defined at the top level of the
+#module so that they can be sent to the processes.
+
+def parseParameterChunk(cls, infile, lines, start):
+    #Parses the parameters in a chunk of lines, the first of which is line 
+    #start + 1 of infile, into an empty space of class cls, see 
+    #PCS.parseParameterLinesInParallel. Returns the content of the
+    #chunk of the document, all of the new "objects" in the order in which
+    #they were created, the parameters, the values, the comments and the text
+    #of the parameter lines.
+    space = cls.__new__(cls)
+    space.initAttributes()
+    content = []
+    source = {}
+    space.parseParameterLines(lines, infile, content, source, itertools.count(start + 1))
+    return dumpChunk((content, list(space.mem.values()), space.paramList, space.valueList, space.commentList, source), 0)
+
+
+workerSpace = None
+
+
+def initDocumentWorker(space, start):
+    #Stores the copy of the space that the process parses lines into, see
+    #PCS.parseDocumentLinesInParallel.
+    global workerSpace
+    workerSpace = space
+    workerSpace.chunkStart = start
+
+
+def parseDocumentChunk(lines, positions):
+    return dumpChunk(workerSpace.parseDocumentChunk(lines, positions), workerSpace.chunkStart)
+
+
+def dumpChunk(result, start):
+    #Pickles the result of parsing a chunk of lines, the second item of which
+    #must be the list of new "objects", whose IDs start at start. Returns the
+    #number of new "objects" and the pickled result, see PCS.loadChunk.
+    f_out = io.BytesIO()
+    ChunkPickler(f_out, pickle.HIGHEST_PROTOCOL, start).dump(result)
+    return (len(result[1]), f_out.getvalue())
+
+
+class ChunkPickler(pickle.Pickler):
+    """
+    Pickles the result of parsing a chunk of lines in another process, with 
+    the IDs of the "objects" created for the chunk replaced by their position
+    in the order in which they were created (i.e., their ID minus the first
+    ID used for the chunk). PCS.loadChunk then gives them the IDs that they
+    would have been given by parsing the whole file in one process. IDs of 
+    "objects" that existed before the chunk was parsed are pickled as usual.
+    """
+
+    def __init__(self, f_out, protocol, start):
+        pickle.Pickler.__init__(self, f_out, protocol)
+        self.start = start
+
+    def persistent_id(self, obj):
+        if(type(obj) is ObjectID and obj >= self.start):
+            return obj - self.start
+        return None
+
+
+class ActiveConfiguration(object):
+    """
+    A mutable configuration of the parameters of a PCS instance that keeps
+    track of which parameters are active as it changes, one parameter at a
+    time. Changing a parameter with set() only re-resolves the parameters 
+    whose conditions can be affected, i.e., the descendants of the parameter,
+    rather than the whole configuration (as removeInactive does). 
+
+    The last value of every parameter is remembered, even while it is 
+    inactive, so a child that becomes active again gets back its last value
+    (or its default, if it never had another one).
+
+    The configuration behaves like a read-only dict of the active parameters
+    (names to values as text, or numbers for numerical parameters).
+    """
+
+    def __init__(self, pcs, config=None):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Creates a configuration for the PCS instance, starting from the 
+        #default configuration updated with the values in config (a dict with
+        #parameter names as keys), if any.
+        self.pcs = pcs
+        self.values = pcs.getDefault()
+        if(config is not None):
+            for name in config:
+                self.checkName(name)
+                self.values[name] = config[name]
+        self.active = set(pcs.getActiveParameters(self.values))
+
+    def set(self, name, value):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Sets the value of the parameter and updates the activity of its 
+        #descendants. Returns a list of the names of the parameters whose 
+        #activity changed, in topological order.
+        self.checkName(name)
+        self.values[name] = value
+        if(name not in self.active):
+            #Nothing depends on the value of an inactive parameter.
+            return []
+        changed = []
+        for (child,parents,evaluators) in self.pcs.getDescendantPlan(name):
+            isActive = True
+            for parent in parents:
+                if(parent not in self.active):
+                    isActive = False
+                    break
+            if(isActive):
+                #All of the parents are active, so their values are the same
+                #as in the dict of the active parameters.
+                for evaluate in evaluators:
+                    if(not evaluate(self.values)):
+                        isActive = False
+                        break
+            if(isActive != (child in self.active)):
+                if(isActive):
+                    self.active.add(child)
                 else:
-                    changed = True
-            oldConfig = reducedConfig
-            reducedConfig = {}
+                    self.active.remove(child)
+                changed.append(child)
+        return changed
+
+    def update(self, config):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Sets the values of all of the parameters in config, one at a time.
+        for name in config:
+            self.set(name, config[name])
+
+    def isActive(self, name):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        return name in self.active
+
+    def getValue(self, name):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the last value of the parameter, even if it is inactive.
+        self.checkName(name)
+        return self.values[name]
+
+    def toDict(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns a dict of the active parameters, in the same order as 
+        #paramList, as returned by removeInactive.
+        config = {}
+        for param in self.pcs.paramList:
+            if(param['name'] in self.active):
+                config[param['name']] = self.values[param['name']]
+        return config
+
+    def copy(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        other = ActiveConfiguration.__new__(ActiveConfiguration)
+        other.pcs = self.pcs
+        other.values = dict(self.values)
+        other.active = set(self.active)
+        return other
+
+    def checkName(self, name):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Raises an exception if name is not the name of a parameter.
+        if(name not in self.pcs.paramIndex):
+            raise Exception('There is no parameter named ' + str(name) + '.')
+
+    def __getitem__(self, name):
+        if(name not in self.active):
+            raise KeyError(name)
+        return self.values[name]
+
+    def get(self, name, default=None):
+        if(name not in self.active):
+            return default
+        return self.values[name]
+
+    def __contains__(self, name):
+        return name in self.active
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.toDict())
+
+    def keys(self):
+        return self.toDict().keys()
+
+    def items(self):
+        return self.toDict().items()
+
+    def __repr__(self):
+        return 'ActiveConfiguration(' + repr(self.toDict()) + ')'
+
+
+
+class Configuration(object):
+    """
+    An immutable, hashable configuration of the parameters of a PCS instance,
+    meant for removing duplicate configurations and as a key of dicts (e.g., 
+    of the results of runs).
+
+    The values are stored in a tuple in the same order as paramList, in a 
+    canonical form: floats for real parameters, ints for integer parameters
+    and the index of the value for categorical and ordinal parameters. 
+    Parameters that are missing from the configuration (e.g., because they
+    are inactive) are stored as None. The hash is only computed once, and two
+    configurations are equal if they belong to the same PCS instance and have
+    the same values.
+
+    The configuration behaves like a read-only dict of the parameters that 
+    are present (names to values as text, or numbers for numerical 
+    parameters).
+
+    A configuration is a snapshot: it keeps the names and value texts of the
+    parameters (see PCS.getConfigurationCodec) from when it was created, so
+    it still decodes to the same values if parameters are removed or changed
+    later (e.g., by removeParameter or applyDiff). Configurations created 
+    before and after such a change are only equal if the change left the 
+    names and values of all of the parameters as they were.
+    """
+
+    __slots__ = ('pcs','codec','values','hashValue')
+
+    def __init__(self, pcs, config):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Creates a configuration from a dict with parameter names as keys and
+        #parameter values as text or numbers, as returned by getDefault or 
+        #removeInactive.
+        codec = pcs.getConfigurationCodec()
+        (names,positions,converters,texts) = codec
+        try:
+            values = tuple([None if value is None else convert(value) for (convert,value) in zip(converters,map(config.get,names))])
+            valid = len(values) - values.count(None) == len(config)
+        except (KeyError, ValueError, TypeError, OverflowError):
+            valid = False
+        if(not valid):
+            #Find the name or value that is not valid.
+            for name in config:
+                if(name not in positions):
+                    raise Exception('There is no parameter named ' + str(name) + '.')
+                try:
+                    converters[positions[name]](config[name])
+                except (KeyError, ValueError, TypeError, OverflowError):
+                    raise Exception('"' + str(config[name]) + '" is not a value of ' + name + '.')
+        object.__setattr__(self, 'pcs', pcs)
+        object.__setattr__(self, 'codec', codec)
+        object.__setattr__(self, 'values', values)
+        object.__setattr__(self, 'hashValue', hash(values))
+
+    def toDict(self):
+        #Created: 2026-10-18
+        #Last updated: 2026-10-18
+        #Returns the configuration as a dict with parameter names as keys, in
+        #the same order as paramList (when the configuration was created), in
+        #the same form as removeInactive.
+        (names,positions,converters,texts) = self.codec
+        config = {}
+        for (name,value,valueTexts) in zip(names,self.values,texts):
+            if(value is not None):
+                config[name] = value if valueTexts is None else valueTexts[value]
+        return config
+
+    def __hash__(self):
+        return self.hashValue
+
+    def __eq__(self, other):
+        if(self is other):
+            return True
+        if(type(other) is not Configuration):
+            return NotImplemented
+        if(self.hashValue != other.hashValue or self.pcs is not other.pcs or self.values != other.values):
+            return False
+        #The values only mean the same thing if the parameters are the same.
+        return self.codec is other.codec or (self.codec[0] == other.codec[0] and self.codec[3] == other.codec[3])
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if(equal is NotImplemented):
+            return equal
+        return not equal
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Configurations are immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError('Configurations are immutable.')
+
+    def __getstate__(self):
+        #The hash is not stored, since the hash of None may differ between
+        #processes. Only the names and value texts of the codec are needed 
+        #once the configuration has been created.
+        return (self.pcs, self.values, self.codec[0], self.codec[3])
+
+    def __setstate__(self, state):
+        (pcs, values, names, texts) = state
+        positions = dict((name, j) for (j, name) in enumerate(names))
+        object.__setattr__(self, 'pcs', pcs)
+        object.__setattr__(self, 'codec', (names, positions, None, texts))
+        object.__setattr__(self, 'values', values)
+        object.__setattr__(self, 'hashValue', hash(values))
+
+    def __getitem__(self, name):
+        (names,positions,converters,texts) = self.codec
+        j = positions.get(name)
+        if(j is None or self.values[j] is None):
+            raise KeyError(name)
+        return self.values[j] if texts[j] is None else texts[j][self.values[j]]
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __contains__(self, name):
+        (names,positions,converters,texts) = self.codec
+        j = positions.get(name)
+        return j is not None and self.values[j] is not None
+
+    def __len__(self):
+        return len(self.values) - self.values.count(None)
+
+    def __iter__(self):
+        return iter(self.toDict())
+
+    def keys(self):
+        return self.toDict().keys()
+
+    def items(self):
+        return self.toDict().items()
 
-        return oldConfig
+    def __repr__(self):
+        return 'Configuration(' + repr(self.toDict()) + ')'
@@ -0,0 +1,81 @@
+#Compares keeping track of the active parameters of a configuration that 
+#changes one parameter at a time by calling PCS.removeInactive after every
+#change against updating an ActiveConfiguration, on the example CPLEX space
+#and on synthetic conditional trees.
+#
+#Usage: python benchmarks/bench_active_configuration.py
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS, ActiveConfiguration
+from synthetic import generateTreePCS
+
+example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'params-cplex.pcs')
+
+
+def changes(pcs, n, seed):
+    #Returns n random (name, value) changes. Categorical values mostly take
+    #their first value, so that the trees stay deep.
+    rng = random.Random(seed)
+    result = []
+    for i in range(0, n):
+        param = rng.choice(pcs.paramList)
+        if(pcs.isNumeric(param)):
+            value = rng.choice(param['values'])
+        else:
+            texts = pcs.getNamedValues(param)
+            value = rng.choice([texts[0]]*3 + texts)
+        result.append((param['name'], value))
+    return result
+
+
+def removeInactiveLoop(pcs, updates):
+    config = pcs.getDefault()
+    for (name, value) in updates:
+        config[name] = value
+        active = pcs.removeInactive(config)
+    return active
+
+
+def activeConfigurationLoop(pcs, updates):
+    config = ActiveConfiguration(pcs)
+    for (name, value) in updates:
+        config.set(name, value)
+    return config.toDict()
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    spaces = [('params-cplex.pcs', example)]
+    for (depth, fanOut) in [(6, 2), (8, 2)]:
+        filename = os.path.join(tmpdir, 'tree-' + str(depth) + '-' + str(fanOut) + '.pcs')
+        with open(filename, 'w') as f_out:
+            f_out.write(generateTreePCS(depth, fanOut))
+        spaces.append(('tree depth ' + str(depth) + ', fan-out ' + str(fanOut), filename))
+    print('%-26s %7s %18s %18s %9s' % ('space', 'params', 'removeInactive (us)', 'set (us)', 'speedup'))
+    for (name, filename) in spaces:
+        pcs = PCS(filename)
+        updates = changes(pcs, 2000, 0)
+        assert removeInactiveLoop(pcs, updates) == activeConfigurationLoop(pcs, updates)
+        full = timeIt(lambda: removeInactiveLoop(pcs, updates), 1)/len(updates)
+        incremental = timeIt(lambda: activeConfigurationLoop(pcs, updates))/len(updates)
+        print('%-26s %7d %18.1f %18.1f %8.0fx' % (name, len(pcs.paramList), 1e6*full, 1e6*incremental, full/incremental))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#Compares resolving the active parameters of a configuration with a single
+#pass in topological order (PCS.removeInactive, PCS.getActiveParameters)
+#against the original fixpoint, which called isActive on every parameter
+#until nothing changed, on deep synthetic conditional trees.
+#
+#Usage: python benchmarks/bench_activity.py
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import generateTreePCS
+
+
+def originalRemoveInactive(pcs, config):
+    #The original fixpoint implementation of removeInactive.
+    oldConfig = config
+    reducedConfig = {}
+    changed = True
+    while(changed):
+        changed = False
+        for p in oldConfig.keys():
+            if(pcs.isActive(p, oldConfig)):
+                reducedConfig[p] = oldConfig[p]
+            else:
+                changed = True
+        oldConfig = reducedConfig
+        reducedConfig = {}
+    return oldConfig
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    rng = random.Random(0)
+    print('%6s %7s %7s %14s %14s %9s' % ('depth', 'fan-out', 'params', 'fixpoint (ms)', 'ordered (ms)', 'speedup'))
+    for (depth, fanOut) in [(4, 2), (8, 1), (6, 2), (16, 1), (32, 1), (8, 2)]:
+        filename = os.path.join(tmpdir, 'tree.pcs')
+        with open(filename, 'w') as f_out:
+            f_out.write(generateTreePCS(depth, fanOut))
+        pcs = PCS(filename)
+        configs = []
+        for i in range(0, 20):
+            config = {}
+            for param in pcs.paramList:
+                #Mostly pick the first value so that the trees stay deep.
+                config[param['name']] = rng.choice(['v0']*8 + ['v1', 'v2'])
+            configs.append(config)
+        for config in configs:
+            assert originalRemoveInactive(pcs, config) == pcs.removeInactive(config)
+        fixpoint = timeIt(lambda: [originalRemoveInactive(pcs, config) for config in configs])/len(configs)
+        ordered = timeIt(lambda: [pcs.removeInactive(config) for config in configs])/len(configs)
+        print('%6d %7d %7d %14.3f %14.3f %8.1fx' % (depth, fanOut, len(pcs.paramList), fixpoint*1000, ordered*1000, fixpoint/ordered))
+        os.remove(filename)
+    os.rmdir(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
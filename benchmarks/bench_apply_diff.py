@@ -0,0 +1,67 @@
+#Measures the time to bring a parsed PCS up to date after a pcs file has been
+#edited, by parsing the edited file from scratch and by applying the changes
+#to the existing space (PCS.applyDiff), for edits of increasing size on a
+#synthetic space with many conditional statements. Each edit adds a comment
+#to a line, which is enough for the line to be parsed again (along with the
+#conditional statements of an edited parameter). Also checks that the result
+#matches the edited file, and reports the fraction of the parameters that 
+#kept their IDs.
+#
+#Usage: python benchmarks/bench_apply_diff.py [numParams]
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import generatePCS
+
+
+def editLines(lines, numEdits):
+    #Returns a copy of the lines with numEdits lines edited, spread evenly
+    #over the file.
+    lines = list(lines)
+    if(numEdits == 0):
+        return lines
+    step = max(1, len(lines)//numEdits)
+    for i in range(0, len(lines), step)[:numEdits]:
+        if('#' not in lines[i]):
+            lines[i] = lines[i] + ' #edited'
+        else:
+            lines[i] = lines[i] + ' edited'
+    return lines
+
+
+def main():
+    numParams = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    tmpdir = tempfile.mkdtemp()
+    filename = os.path.join(tmpdir, 'space.pcs')
+    with open(filename, 'w') as f_out:
+        f_out.write(generatePCS(numParams, conditionalFraction=0.5, clauseSize=2))
+    with open(filename) as f_in:
+        lines = f_in.read().splitlines()
+    print('%d parameters, %d lines' % (numParams, len(lines)))
+    print('%8s %14s %16s %9s %9s' % ('edits', 'reparse (ms)', 'applyDiff (ms)', 'speedup', 'kept IDs'))
+    for numEdits in [0, 1, 10, 100, 1000]:
+        text = '\n'.join(editLines(lines, numEdits)) + '\n'
+        edited = os.path.join(tmpdir, 'edited.pcs')
+        with open(edited, 'w') as f_out:
+            f_out.write(text)
+        start = time.perf_counter()
+        fresh = PCS(edited)
+        reparse = time.perf_counter() - start
+        pcs = PCS(filename)
+        ids = dict((param['name'], param['id']) for param in pcs.paramList)
+        start = time.perf_counter()
+        pcs.applyDiff(text)
+        applyDiff = time.perf_counter() - start
+        assert pcs.printDocument() == fresh.printDocument()
+        kept = sum([ids.get(param['name']) == param['id'] for param in pcs.paramList])
+        print('%8d %14.1f %16.1f %8.1fx %8.1f%%' % (numEdits, 1e3*reparse, 1e3*applyDiff, reparse/applyDiff, 100.0*kept/len(pcs.paramList)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+#Compares parsing a pcs file against loading the parsed space from the 
+#on-disk cache (PCS(infile, cache=...)) for synthetic spaces of increasing
+#size.
+#
+#Usage: python benchmarks/bench_cache.py
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import writePCS
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    print('%7s %11s %11s %9s' % ('params', 'parse (s)', 'cache (s)', 'speedup'))
+    for numParams in [1000, 10000, 50000]:
+        filename = os.path.join(tmpdir, 'synthetic-' + str(numParams) + '.pcs')
+        writePCS(filename, numParams)
+        parse = timeIt(lambda: PCS(filename))
+        #Write the cache file
+        PCS(filename, cache=tmpdir)
+        cached = timeIt(lambda: PCS(filename, cache=tmpdir))
+        assert PCS(filename, cache=tmpdir).printDocument() == PCS(filename).printDocument()
+        print('%7d %11.3f %11.3f %8.1fx' % (numParams, parse, cached, parse/cached))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+#Measures the per-call latency of evaluating conditional clauses with the
+#compiled evaluators (PCS.compileClause, used by PCS.evalClause) against
+#the original recursive implementation of evalClause.
+#
+#Usage: python benchmarks/bench_clauses.py [numParams [clauseSize]]
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import writePCS
+
+
+class OriginalEvalPCS(PCS):
+    #Evaluates clauses by walking the clause tree, as evalClause originally
+    #did.
+
+    def evalClause(self, obj, config):
+        obj = self.getObject(obj)
+
+        if(self.isParameter(obj)):
+            if(obj['id'] not in config.keys()):
+                return None
+            return config[obj['id']]
+        elif(self.getAttr(obj,'type') == 'value'):
+            return self.getAttr(obj,'text')
+        elif(obj['type'] == 'clause'):
+            operator = obj['operator']
+            if(operator == '&&'):
+                return self.evalClause(obj['A'],config) and self.evalClause(obj['B'],config)
+            elif(operator == '||'):
+                return self.evalClause(obj['A'],config) or self.evalClause(obj['B'],config)
+            elif(operator in ['<=','>=','<','>']):
+                A = float(self.evalClause(obj['A'],config))
+                B = float(self.evalClause(obj['B'],config))
+                if(operator == '<='):
+                    return A <= B
+                elif(operator == '>='):
+                    return A >= B
+                elif(operator == '<'):
+                    return A < B
+                elif(operator == '>'):
+                    return A > B
+            elif(operator in ['==','!=']):
+                if(self.isID(obj['A'])):
+                    A = self.evalClause(obj['A'],config)
+                else:
+                    A = obj['A']
+                if(self.isID(obj['B'])):
+                    B = self.evalClause(obj['B'],config)
+                else:
+                    B = obj['B']
+                if(operator == '=='):
+                    return A == B
+                elif(operator == '!='):
+                    return not A == B
+            elif(operator == 'in'):
+                if(self.isID(obj['A'])):
+                    A = self.evalClause(obj['A'],config)
+                else:
+                    A = obj['A']
+                B = self.getAttr(obj['B'],'values')
+                vals = []
+                for v in B:
+                    vals.append(self.getAttr(v,'text'))
+                return A in vals
+        raise Exception("We should never have made it here.")
+
+
+def randomConfigs(pcs, number, seed=0):
+    #Returns random configurations keyed by parameter name, with some
+    #parameters left out.
+    rng = random.Random(seed)
+    configs = []
+    for i in range(0, number):
+        config = {}
+        for param in pcs.paramList:
+            if(rng.random() < 0.1):
+                continue
+            if(pcs.isNumeric(param)):
+                config[param['name']] = rng.uniform(*param['values'])
+            else:
+                config[param['name']] = pcs.getAttr(rng.choice(param['values']), 'text')
+        configs.append(config)
+    return configs
+
+
+def perCall(function, calls):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start)/calls*1e9
+
+
+def main(numParams, clauseSize):
+    filename = writePCS(os.path.join(tempfile.mkdtemp(), 'clauses.pcs'), numParams, conditionalFraction=1, clauseSize=clauseSize)
+    original = OriginalEvalPCS(filename)
+    current = PCS(filename)
+    nameConfigs = randomConfigs(current, 200)
+    originalClauses = [c['clauses'] for c in original.conditionList]
+    currentClauses = [c['clauses'] for c in current.conditionList]
+    originalConfigs = [original.convertConfigToIdsAndText(config) for config in nameConfigs]
+    currentConfigs = [current.convertConfigToIdsAndText(config) for config in nameConfigs]
+    calls = len(nameConfigs)*len(currentClauses)
+
+    #The two implementations must agree.
+    for (a, b) in zip(originalConfigs, currentConfigs):
+        for (clauseA, clauseB) in zip(originalClauses, currentClauses):
+            assert original.evalClause(clauseA, a) == current.evalClause(clauseB, b)
+
+    def runOriginal():
+        for config in originalConfigs:
+            for clause in originalClauses:
+                original.evalClause(clause, config)
+
+    def runWrapper():
+        for config in currentConfigs:
+            for clause in currentClauses:
+                current.evalClause(clause, config)
+
+    evaluators = [current.compileClause(clause, 'name') for clause in currentClauses]
+
+    def runCompiled():
+        for config in nameConfigs:
+            for evaluate in evaluators:
+                evaluate(config)
+
+    print('%d conditions with %d comparisons each, %d configurations' % (len(currentClauses), clauseSize, len(nameConfigs)))
+    print('%-32s %10s' % ('implementation', 'ns/call'))
+    print('%-32s %10.0f' % ('original evalClause', perCall(runOriginal, calls)))
+    print('%-32s %10.0f' % ('evalClause (compiled, by id)', perCall(runWrapper, calls)))
+    print('%-32s %10.0f' % ('compileClause (by name)', perCall(runCompiled, calls)))
+    os.remove(filename)
+
+
+if __name__ == '__main__':
+    numParams = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    clauseSize = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    main(numParams, clauseSize)
@@ -0,0 +1,83 @@
+#Measures the effect of caching the results of the conditional statements
+#(PCS.setConditionCacheSize) on resolving the active parameters of many 
+#configurations that share the same parent values, on the example CPLEX
+#configuration space, on synthetic spaces with conditions made up of 1 or 8
+#comparisons, and on spaces with wide conditions that compare one parent with
+#many values (e.g., 'c | a == v1 || a == v4 || ...'), which is where caching
+#pays off. Both removeInactive and resolveActive (which skips converting the
+#configuration to parameter IDs) are timed.
+#
+#Usage: python benchmarks/bench_condition_cache.py
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import generatePCS
+
+example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'params-cplex.pcs')
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def wideConditions(numChildren, numComparisons, numeric):
+    #Returns the text of a pcs file in which each of numChildren children is
+    #active for numComparisons values of one parent, which is either an
+    #integer or a categorical parameter.
+    lines = ['x integer [0,200] [0]', 'a categorical {' + ','.join(['v' + str(i) for i in range(0, 200)]) + '} [v0]']
+    for c in range(0, numChildren):
+        lines.append('c' + str(c) + ' real [0,1] [0.5]')
+        values = [(7*c + 3*i) % 200 for i in range(0, numComparisons)]
+        if(numeric):
+            comparisons = ['x == ' + str(v) for v in values]
+        else:
+            comparisons = ['a == v' + str(v) for v in values]
+        lines.append('c' + str(c) + ' | ' + ' || '.join(comparisons))
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    spaces = [('params-cplex.pcs', example)]
+    for clauseSize in [1, 8]:
+        filename = os.path.join(tmpdir, 'clauses-' + str(clauseSize) + '.pcs')
+        with open(filename, 'w') as f_out:
+            f_out.write(generatePCS(200, conditionalFraction=0.8, oldSyntaxFraction=0, domainSize=3, clauseSize=clauseSize))
+        spaces.append(('200 params, clause size ' + str(clauseSize), filename))
+    for numComparisons in [8, 32, 64]:
+        for numeric in [False, True]:
+            filename = os.path.join(tmpdir, 'wide-' + str(numComparisons) + '-' + str(numeric) + '.pcs')
+            with open(filename, 'w') as f_out:
+                f_out.write(wideConditions(20, numComparisons, numeric))
+            spaces.append(('wide ' + ('integer' if numeric else 'categorical') + ', ' + str(numComparisons) + ' comparisons', filename))
+    print('%-34s %-15s %14s %14s %9s %9s' % ('space', 'function', 'uncached (us)', 'cached (us)', 'speedup', 'hit rate'))
+    for (name, filename) in spaces:
+        pcs = PCS(filename)
+        configs = [dict(pcs.getDefault(), **config) for config in pcs.sample(5000, seed=0)]
+        converted = [pcs.convertConfigToIdsAndText(config) for config in configs]
+        functions = [('removeInactive', lambda: [pcs.removeInactive(config) for config in configs]),
+                     ('resolveActive', lambda: [pcs.resolveActive(config) for config in converted])]
+        for (functionName, function) in functions:
+            pcs.setConditionCacheSize(None)
+            expected = function()
+            uncached = timeIt(function)/len(configs)
+            pcs.setConditionCacheSize(1024)
+            assert expected == function()
+            cached = timeIt(function)/len(configs)
+            stats = pcs.getConditionCacheStats()
+            print('%-34s %-15s %14.1f %14.1f %8.2fx %8.1f%%' % (name, functionName, 1e6*uncached, 1e6*cached, uncached/cached, 100*stats['hitRate']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#Compares removing duplicate configurations and looking up memoized results
+#with plain dicts as configurations, keyed by frozenset(config.items()) or 
+#by a sorted tuple of the items, against Configuration objects, on the 
+#example CPLEX configuration space.
+#
+#Usage: python benchmarks/bench_configuration.py
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS, Configuration
+
+example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'params-cplex.pcs')
+
+
+def candidates(pcs, n, numUnique, seed):
+    #Returns n random configurations, drawn from numUnique distinct ones, as
+    #new dicts (as they would be after, e.g., being read from a file).
+    unique = pcs.sample(numUnique, seed=seed)
+    rng = random.Random(seed)
+    return [dict(rng.choice(unique)) for i in range(0, n)]
+
+
+def frozensetKey(config):
+    return frozenset(config.items())
+
+
+def sortedKey(config):
+    return tuple(sorted(config.items()))
+
+
+def dedup(configs, key):
+    seen = set()
+    unique = []
+    for config in configs:
+        k = key(config)
+        if(k not in seen):
+            seen.add(k)
+            unique.append(config)
+    return unique
+
+
+def memo(configs, keys):
+    #Looks up every configuration in a dict of results, many times over.
+    results = {}
+    for k in keys:
+        results[k] = 0
+    for i in range(0, 10):
+        for k in keys:
+            results[k] += 1
+    return results
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    pcs = PCS(example)
+    configs = candidates(pcs, 20000, 5000, 0)
+    frozen = [frozensetKey(config) for config in configs]
+    ordered = [sortedKey(config) for config in configs]
+    objects = [Configuration(pcs, config) for config in configs]
+    assert len(dedup(configs, frozensetKey)) == len(dedup(objects, lambda c: c)) 
+    print('%d configurations of %d parameters (%d distinct)' % (len(configs), len(pcs.paramList), len(set(objects))))
+    print('%-36s %12s' % ('operation', 'time (ms)'))
+    rows = [('dedup, frozenset(items)', lambda: dedup(configs, frozensetKey)),
+            ('dedup, sorted tuple of items', lambda: dedup(configs, sortedKey)),
+            ('dedup, Configuration (incl. build)', lambda: dedup([Configuration(pcs, c) for c in configs], lambda c: c)),
+            ('build Configuration', lambda: [Configuration(pcs, c) for c in configs]),
+            ('Configuration.toDict', lambda: [c.toDict() for c in objects]),
+            ('memo lookups, frozenset keys', lambda: memo(configs, frozen)),
+            ('memo lookups, sorted tuple keys', lambda: memo(configs, ordered)),
+            ('memo lookups, Configuration keys', lambda: memo(configs, objects))]
+    for (name, function) in rows:
+        print('%-36s %12.1f' % (name, 1e3*timeIt(function)))
+
+
+if __name__ == '__main__':
+    main()
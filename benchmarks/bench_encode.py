@@ -0,0 +1,72 @@
+#Compares encoding configurations as feature vectors one at a time, with a
+#loop over the parameters, against PCS.encode and PCS.decode, on the example
+#CPLEX configuration space.
+#
+#Usage: python benchmarks/bench_encode.py
+
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+
+example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'params-cplex.pcs')
+
+
+def loopEncode(pcs, configs, impute=-1.0):
+    #Encodes the configurations one at a time.
+    rows = []
+    for config in configs:
+        row = []
+        for param in pcs.paramList:
+            name = param['name']
+            if(name not in config):
+                row.append(impute)
+            elif(pcs.isNumeric(param)):
+                (lower, upper) = param['values']
+                value = config[name]
+                if(param['log']):
+                    (lower, upper, value) = (math.log(lower), math.log(upper), math.log(value))
+                row.append((value - lower)/(upper - lower))
+            else:
+                row.append(pcs.getNamedValues(param).index(config[name]))
+        rows.append(row)
+    return np.array(rows)
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    pcs = PCS(example)
+    print('%9s %12s %14s %14s %14s %14s' % ('configs', 'loop (s)', 'encode (s)', 'decode (s)', 'encode array', 'decode array'))
+    for n in [10000, 100000, 1000000]:
+        X = pcs.sample(n, seed=0, asArray=True)
+        Z = pcs.encode(X)
+        if(n <= 100000):
+            configs = pcs.arrayToConfigs(X)
+            assert np.allclose(loopEncode(pcs, configs[:1000]), Z[:1000])
+            loop = '%12.3f' % timeIt(lambda: loopEncode(pcs, configs), 1)
+            encode = '%14.3f' % timeIt(lambda: pcs.encode(configs), 1)
+            decode = '%14.3f' % timeIt(lambda: pcs.decode(Z), 1)
+        else:
+            #The configurations alone would take several gigabytes as dicts.
+            (loop, encode, decode) = ('%12s' % '-', '%14s' % '-', '%14s' % '-')
+        encodeArray = timeIt(lambda: pcs.encode(X))
+        decodeArray = timeIt(lambda: pcs.decode(Z, asArray=True))
+        print('%9d %s %s %s %14.3f %14.3f' % (n, loop, encode, decode, encodeArray, decodeArray))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#Measures how quickly configurations are checked against the forbidden 
+#clauses, on synthetic categorical spaces:
+# - loop: evaluating each clause with evalClause, which is what users of 
+#   this parser had to write themselves;
+# - compiled: PCS.isForbidden and PCS.forbiddenMask with every clause 
+#   evaluated by its compiled function;
+# - tables: PCS.isForbidden and PCS.forbiddenMask, which look up the 
+#   conjunctions of equalities in one hash table per set of parameters.
+#
+#Usage: python benchmarks/bench_forbidden.py
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import generateForbiddenPCS
+
+
+class CompiledPCS(PCS):
+    #Evaluates every forbidden clause with its compiled function.
+
+    def getEqualities(self, clause):
+        return None
+
+
+def loopIsForbidden(pcs, config):
+    #Checks a configuration by evaluating every forbidden clause.
+    config = pcs.convertConfigToIdsAndText(config)
+    for forbidden in pcs.forbiddenList:
+        if(pcs.evalClause(forbidden['clause'], config)):
+            return True
+    return False
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    filename = os.path.join(tmpdir, 'forbidden.pcs')
+    print('%7s %10s %8s %12s %12s %12s %14s %14s' % ('params', 'forbidden', 'subsets', 'loop', 'compiled', 'tables', 'compiled batch', 'tables batch'))
+    print('%7s %10s %8s %12s %12s %12s %14s %14s' % ('', '', '', '(cfg/s)', '(cfg/s)', '(cfg/s)', '(cfg/s)', '(cfg/s)'))
+    for (numParams, numForbidden, numSubsets) in [(20, 10, None), (50, 100, None), (100, 1000, None), (100, 1000, 20), (100, 5000, 20)]:
+        with open(filename, 'w') as f_out:
+            f_out.write(generateForbiddenPCS(numParams, numForbidden, domainSize=10, advancedFraction=0.1, numSubsets=numSubsets))
+        pcs = PCS(filename)
+        compiled = CompiledPCS(filename)
+        X = pcs.sampleArray(10000, np.random.default_rng(0))
+        configs = pcs.arrayToConfigs(X)
+        expected = [loopIsForbidden(pcs, config) for config in configs[:200]]
+        assert expected == [pcs.isForbidden(config) for config in configs[:200]]
+        assert expected == [compiled.isForbidden(config) for config in configs[:200]]
+        assert expected == list(pcs.forbiddenMask(X[:200]))
+        loop = 200/timeIt(lambda: [loopIsForbidden(pcs, config) for config in configs[:200]], 1)
+        compiledScalar = len(configs)/timeIt(lambda: [compiled.isForbidden(config) for config in configs], 1)
+        tablesScalar = len(configs)/timeIt(lambda: [pcs.isForbidden(config) for config in configs], 1)
+        compiledBatch = len(configs)/timeIt(lambda: compiled.forbiddenMask(X))
+        tablesBatch = len(configs)/timeIt(lambda: pcs.forbiddenMask(X))
+        print('%7d %10d %8s %12.0f %12.0f %12.0f %14.0f %14.0f' % (numParams, numForbidden, str(len(pcs.getForbiddenPlan()[0])), loop, compiledScalar, tablesScalar, compiledBatch, tablesBatch))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#Measures the overhead of instrumentation (PCS.enableInstrumentation) on 
+#parsing a synthetic space and on checking whether its parameters are active,
+#with instrumentation disabled, with every call timed, and with only every 
+#100th call timed (sampling mode). Instrumentation still counts every call 
+#in sampling mode. The instrumentation statistics of the last run are 
+#printed at the end.
+#
+#Usage: python benchmarks/bench_instrumentation.py [numParams]
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import generatePCS
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def checkActive(pcs, config):
+    #isActive converts the whole configuration on every call, so only a 
+    #sample of the parameters is checked.
+    for param in pcs.paramList[::50]:
+        pcs.isActive(param['name'], config)
+
+
+def main():
+    numParams = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    tmpdir = tempfile.mkdtemp()
+    filename = os.path.join(tmpdir, 'space.pcs')
+    with open(filename, 'w') as f_out:
+        f_out.write(generatePCS(numParams, conditionalFraction=0.5, clauseSize=2))
+    print('%d parameters' % numParams)
+    print('%-20s %12s %9s %14s %9s' % ('instrumentation', 'parse (ms)', 'overhead', 'isActive (ms)', 'overhead'))
+    baseline = None
+    for (name, sampleEvery) in [('disabled', None), ('every call', 1), ('every 100th call', 100)]:
+        parse = timeIt(lambda: PCS(filename, instrument=sampleEvery))
+        pcs = PCS(filename, instrument=sampleEvery)
+        config = pcs.getDefault()
+        active = timeIt(lambda: checkActive(pcs, config))
+        if(baseline is None):
+            baseline = (parse, active)
+        print('%-20s %12.1f %8.1f%% %14.1f %8.1f%%' % (name, 1e3*parse, 100*(parse/baseline[0] - 1), 1e3*active, 100*(active/baseline[1] - 1)))
+    print('')
+    print(pcs.printInstrumentationStats())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#Measures the time to construct a PCS and read its default configuration, 
+#which is all that many tools need, when everything is parsed up front and
+#when the conditional statements, forbidden clauses and comments are parsed
+#lazily (PCS(infile, lazy=True)), on the example CPLEX configuration space 
+#and on synthetic spaces with many conditions and forbidden clauses (in the
+#advanced syntax, which is the most costly to parse).
+#
+#Usage: python benchmarks/bench_lazy.py
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import generatePCS, generateForbiddenPCS
+
+example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'params-cplex.pcs')
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    spaces = [('params-cplex.pcs', example)]
+    filename = os.path.join(tmpdir, 'conditional.pcs')
+    with open(filename, 'w') as f_out:
+        f_out.write(generatePCS(2000, conditionalFraction=0.8, clauseSize=3))
+    spaces.append(('2000 params, conditions', filename))
+    filename = os.path.join(tmpdir, 'forbidden.pcs')
+    with open(filename, 'w') as f_out:
+        f_out.write(generateForbiddenPCS(100, 2000, advancedFraction=1.0))
+    spaces.append(('100 params, 2000 forbidden', filename))
+    print('%-28s %12s %12s %9s %16s' % ('space', 'eager (ms)', 'lazy (ms)', 'speedup', 'first use (ms)'))
+    for (name, filename) in spaces:
+        assert PCS(filename, lazy=True).getDefault() == PCS(filename).getDefault()
+        eager = timeIt(lambda: PCS(filename).getDefault())
+        lazy = timeIt(lambda: PCS(filename, lazy=True).getDefault())
+        pcs = PCS(filename, lazy=True)
+        firstUse = timeIt(lambda: pcs.conditionList, 1)
+        print('%-28s %12.1f %12.1f %8.1fx %16.1f' % (name, 1e3*eager, 1e3*lazy, eager/lazy, 1e3*firstUse))
+
+
+if __name__ == '__main__':
+    main()
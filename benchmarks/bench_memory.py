@@ -0,0 +1,68 @@
+#Compares the memory used by a parsed PCS when its "objects" are instances of
+#the __slots__ classes (PCS.newObject) against the original representation,
+#where every object was a dict. The example CPLEX configuration space is
+#scaled up by repeating it with renamed parameters.
+#
+#Usage: python benchmarks/bench_memory.py
+
+import os
+import re
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+
+example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'params-cplex.pcs')
+
+
+class DictPCS(PCS):
+    #Stores every "object" in a dict, as the original implementation did.
+
+    def newObject(self, objType='object'):
+        obj = {}
+        obj['id'] = self.getID()
+        obj['type'] = objType
+        obj['comment'] = ''
+        self.mem[obj['id']] = obj
+
+        return obj
+
+
+def scaledPCS(copies):
+    #Returns the text of the example configuration space repeated copies
+    #times, with the parameters in the i-th copy renamed to name_i.
+    with open(example) as f_in:
+        text = f_in.read()
+    names = [param['name'] for param in PCS(example).paramList]
+    pattern = re.compile('(?<![A-Za-z0-9_])(' + '|'.join(sorted(names, key=len, reverse=True)) + ')(?![A-Za-z0-9_])')
+    return ''.join([pattern.sub(lambda m: m.group(1) + '_' + str(i), text) for i in range(0, copies)])
+
+
+def measure(cls, filename):
+    #Returns the number of bytes allocated while parsing the file and the
+    #number of parameters in it.
+    tracemalloc.start()
+    pcs = cls(filename)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return current, len(pcs.paramList)
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    print('%7s %9s %16s %16s %9s' % ('params', 'objects', 'dict (B/param)', 'slots (B/param)', 'saving'))
+    for copies in [1, 10, 100]:
+        filename = os.path.join(tmpdir, 'scaled.pcs')
+        with open(filename, 'w') as f_out:
+            f_out.write(scaledPCS(copies))
+        before, numParams = measure(DictPCS, filename)
+        after, numParams = measure(PCS, filename)
+        numObjects = len(PCS(filename).mem)
+        print('%7d %9d %16.0f %16.0f %8.1f%%' % (numParams, numObjects, before/float(numParams), after/float(numParams), 100*(1 - after/float(before))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#Compares generating the one-exchange neighbours of configurations by 
+#re-resolving every parameter for each neighbour (filling in defaults and 
+#calling PCS.removeInactive) against PCS.neighbours, which only re-resolves
+#the descendants of the changed parameter, on the example spaces and on a 
+#deep synthetic conditional tree.
+#
+#Usage: python benchmarks/bench_neighbours.py
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import generateTreePCS
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples')
+
+
+def fullNeighbours(pcs, config):
+    #Generates the same neighbours as PCS.neighbours (in paramList order),
+    #but re-resolves all of the parameters of each neighbour.
+    defaults = pcs.getDefault()
+    for neighbour in pcs.neighbours(config):
+        #Find the parameter that was changed by neighbours and recreate the
+        #neighbour from scratch.
+        changed = [name for name in neighbour if name in config and neighbour[name] != config[name]][0]
+        full = dict(defaults)
+        full.update(config)
+        full[changed] = neighbour[changed]
+        full = pcs.removeInactive(full)
+        if(not pcs.isForbidden(full)):
+            yield full
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    tree = os.path.join(tmpdir, 'tree.pcs')
+    with open(tree, 'w') as f_out:
+        f_out.write(generateTreePCS(6, 2))
+    print('%-22s %7s %12s %16s %16s' % ('space', 'params', 'neighbours', 'full (nbr/s)', 'subtree (nbr/s)'))
+    for filename in [os.path.join(examples, 'params-cplex.pcs'), os.path.join(examples, 'params-lkh.pcs'), tree]:
+        pcs = PCS(filename)
+        configs = pcs.sample(20, seed=0)
+        for config in configs:
+            assert list(fullNeighbours(pcs, config)) == list(pcs.neighbours(config))
+        count = sum([len(list(pcs.neighbours(config))) for config in configs])
+        full = count/timeIt(lambda: [list(fullNeighbours(pcs, config)) for config in configs], 1)
+        subtree = count/timeIt(lambda: [list(pcs.neighbours(config)) for config in configs])
+        print('%-22s %7d %12d %16.0f %16.0f' % (os.path.basename(filename), len(pcs.paramList), count, full, subtree))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+#Measures how parsing a very large synthetic pcs file (with conditions and 
+#comments) scales with the number of processes used by PCS(infile, 
+#workers=n). Besides the wall-clock time, it reports the CPU time used by the
+#main process, which merges the results of the workers. Since the merge is 
+#not parallel, the serial time divided by it bounds the speedup on any 
+#number of cores.
+#
+#Usage: python benchmarks/bench_parallel_parse.py [numParams]
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import generatePCS
+
+
+def main():
+    numParams = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    filename = os.path.join(tempfile.mkdtemp(), 'large.pcs')
+    with open(filename, 'w') as f_out:
+        f_out.write(generatePCS(numParams, conditionalFraction=0.5, clauseSize=2))
+    with open(filename) as f_in:
+        numLines = sum(1 for line in f_in)
+    print('%d parameters, %d lines, %d cores' % (numParams, numLines, os.cpu_count()))
+    print('%8s %10s %9s %17s' % ('workers', 'wall (s)', 'speedup', 'main CPU (s)'))
+    serial = None
+    expected = None
+    for workers in [1, 2, 4, 8]:
+        start = time.perf_counter()
+        startCPU = time.process_time()
+        pcs = PCS(filename, workers=workers)
+        cpu = time.process_time() - startCPU
+        wall = time.perf_counter() - start
+        if(serial is None):
+            serial = wall
+            expected = pcs.printDocument()
+        else:
+            assert pcs.printDocument() == expected
+        print('%8d %10.2f %8.2fx %17.2f' % (workers, wall, serial/wall, cpu))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#Compares the time to parse synthetic pcs files with the current parser and
+#with the parser of a baseline commit (by default, the first commit of the
+#repository, before any of the optimizations). The baseline parser is read
+#from git with "git show <commit>:PCS/pcsParser.py" and loaded as a separate
+#module, so that it runs exactly as it did at that commit.
+#
+#Usage: python benchmarks/bench_parse.py [--baseline COMMIT] [numParams ...]
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, root)
+
+from PCS import PCS
+from synthetic import writePCS
+
+
+def git(*args):
+    return subprocess.check_output(['git'] + list(args), cwd=root).decode()
+
+
+def loadBaseline(commit, tmpdir):
+    #Returns the pcsParser module of the commit.
+    filename = os.path.join(tmpdir, 'baselineParser.py')
+    with open(filename, 'w') as f_out:
+        f_out.write(git('show', commit + ':PCS/pcsParser.py'))
+    spec = importlib.util.spec_from_file_location('baselineParser', filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        #The baseline parser prints some debugging output.
+        with contextlib.redirect_stdout(io.StringIO()):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compares the parse times of the current and a baseline parser.')
+    parser.add_argument('--baseline', default=None, help='the commit to compare with (default: the first commit)')
+    parser.add_argument('sizes', type=int, nargs='*', default=[1000, 5000, 20000], help='the numbers of parameters of the synthetic files')
+    args = parser.parse_args()
+    commit = args.baseline
+    if(commit is None):
+        commit = git('rev-list', '--max-parents=0', 'HEAD').split()[0]
+
+    tmpdir = tempfile.mkdtemp()
+    baseline = loadBaseline(commit, tmpdir)
+    print('Baseline: ' + git('log', '-1', '--format=%h %s', commit).strip())
+    print('%10s %14s %14s %9s' % ('params', 'baseline (s)', 'current (s)', 'speedup'))
+    for size in args.sizes:
+        filename = writePCS(os.path.join(tmpdir, 'synthetic-' + str(size) + '.pcs'), size)
+        original = timeIt(lambda: baseline.PCS(filename))
+        current = timeIt(lambda: PCS(filename))
+        print('%10d %14.4f %14.4f %8.2fx' % (size, original, current, original/current))
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    main()
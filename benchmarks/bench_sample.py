@@ -0,0 +1,62 @@
+#Compares drawing random configurations one at a time, with a loop over the
+#parameters followed by PCS.removeInactive (the way configurators built on 
+#this parser typically do it), against PCS.sample, on the example spaces.
+#
+#Usage: python benchmarks/bench_sample.py
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples')
+
+
+def loopSample(pcs, n, seed):
+    #Draws n configurations one parameter at a time.
+    rng = random.Random(seed)
+    configs = []
+    for i in range(0, n):
+        config = {}
+        for param in pcs.paramList:
+            if(pcs.isNumeric(param)):
+                (lower, upper) = param['values']
+                if(param['log']):
+                    value = math.exp(rng.uniform(math.log(lower), math.log(upper)))
+                else:
+                    value = rng.uniform(lower, upper)
+                if(param['type'] == 'integer'):
+                    value = int(round(value))
+            else:
+                value = rng.choice(pcs.getNamedValues(param))
+            config[param['name']] = value
+        configs.append(pcs.removeInactive(config))
+    return configs
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print('%-22s %7s %15s %15s %15s' % ('space', 'params', 'loop (cfg/s)', 'dicts (cfg/s)', 'array (cfg/s)'))
+    for name in ['params-cplex.pcs', 'params-lkh.pcs', 'params-cadical.pcs']:
+        pcs = PCS(os.path.join(examples, name))
+        loop = 2000/timeIt(lambda: loopSample(pcs, 2000, 0), 1)
+        dicts = 100000/timeIt(lambda: pcs.sample(100000, seed=0))
+        array = 100000/timeIt(lambda: pcs.sample(100000, seed=0, asArray=True))
+        print('%-22s %7d %15.0f %15.0f %15.0f' % (name, len(pcs.paramList), loop, dicts, array))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+#Times the main parse, print and query paths of PCS on the bundled example
+#configuration spaces (examples/*.pcs) and on synthetic hierarchical spaces
+#of increasing size (see synthetic.generateHierarchicalPCS), and stores the
+#results as JSON so that runs can be compared, e.g., before and after a
+#change:
+#
+#    python benchmarks/bench_suite.py --output before.json
+#    python benchmarks/bench_suite.py --output after.json --compare before.json
+#
+#For each space, the suite times constructing the PCS, printDocument,
+#getDefault, isActive (for a sample of the parameters), removeInactive (for
+#the default and random configurations) and removeParameter (on a copy of the
+#space, for a sample of the parameters). Each operation is repeated, and the
+#best and mean times are stored, along with the time per call.
+#
+#Usage: python benchmarks/bench_suite.py [--sizes N ...] [--repeats R]
+#                                        [--output FILE] [--compare FILE]
+
+import argparse
+import glob
+import json
+import os
+import pickle
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import generateHierarchicalPCS
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples')
+
+#The version of the format of the JSON results.
+resultsFormat = 1
+
+#The number of parameters used for isActive and removeParameter, and the
+#number of random configurations used for removeInactive.
+numQueries = 20
+
+
+def timeIt(function, repeats, setup=None):
+    #Returns the best and mean times of calling function. If setup is not
+    #None, it is called before every repetition (without being timed), and
+    #its result is passed to function.
+    times = []
+    for i in range(0, repeats):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        if(setup is not None):
+            function(argument)
+        else:
+            function()
+        times.append(time.perf_counter() - start)
+    return min(times), sum(times)/len(times)
+
+
+def randomConfig(pcs, rng):
+    #Returns a random configuration with a value for every parameter.
+    config = {}
+    for param in pcs.paramList:
+        if(param['type'] == 'real'):
+            config[param['name']] = str(rng.uniform(param['values'][0], param['values'][1]))
+        elif(param['type'] == 'integer'):
+            config[param['name']] = str(rng.randint(param['values'][0], param['values'][1]))
+        else:
+            config[param['name']] = pcs.getAttr(rng.choice(param['values']), 'text')
+    return config
+
+
+def spread(items, n):
+    #Returns at most n items, evenly spread over the list.
+    return items[::max(1, len(items)//n)][:n]
+
+
+def removeParameters(pcs, names):
+    for name in names:
+        if(name in pcs.paramIndex):
+            pcs.removeParameter(pcs.lookupParamID(name))
+
+
+def benchmarkSpace(name, filename, repeats):
+    #Returns the results of timing every operation on the space in filename.
+    pcs = PCS(filename)
+    with open(filename) as f_in:
+        numLines = len(f_in.readlines())
+    space = {'space': name,
+             'params': len(pcs.paramList),
+             'conditions': len(pcs.conditionList),
+             'forbidden': len(pcs.forbiddenList),
+             'lines': numLines}
+    default = pcs.getDefault()
+    rng = random.Random(0)
+    configs = [default] + [randomConfig(pcs, rng) for i in range(0, numQueries - 1)]
+    names = [param['name'] for param in spread(pcs.paramList, numQueries)]
+    state = pickle.dumps(pcs)
+
+    operations = [('parse', 1, lambda: PCS(filename), None),
+                  ('printDocument', 1, pcs.printDocument, None),
+                  ('getDefault', 1, pcs.getDefault, None),
+                  ('isActive', len(names), lambda: [pcs.isActive(name, default) for name in names], None),
+                  ('removeInactive', len(configs), lambda: [pcs.removeInactive(config) for config in configs], None),
+                  ('removeParameter', len(names), lambda copy: removeParameters(copy, names), lambda: pickle.loads(state))]
+    results = []
+    for (operation, calls, function, setup) in operations:
+        (best, mean) = timeIt(function, repeats, setup)
+        result = dict(space)
+        result.update({'operation': operation, 'calls': calls, 'best': best, 'mean': mean, 'perCall': best/calls})
+        results.append(result)
+        print('%-32s %7d %-16s %7d %14.3f %14.3f' % (name, space['params'], operation, calls, 1e3*best, 1e6*best/calls))
+    return results
+
+
+def gitCommit():
+    #Returns the current git commit of the sources, if any.
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)), stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+
+def compare(results, filename):
+    #Prints the ratio of the best times of the results to those in the JSON
+    #file written by an earlier run.
+    with open(filename) as f_in:
+        previous = json.load(f_in)
+    best = dict(((result['space'], result['operation']), result['best']) for result in previous['results'])
+    print('')
+    print('Compared with ' + filename + ' (commit ' + str(previous.get('commit')) + '):')
+    print('%-32s %-16s %14s %14s %9s' % ('space', 'operation', 'before (ms)', 'after (ms)', 'ratio'))
+    for result in results:
+        key = (result['space'], result['operation'])
+        if(key in best):
+            print('%-32s %-16s %14.3f %14.3f %8.2fx' % (key[0], key[1], 1e3*best[key], 1e3*result['best'], result['best']/best[key]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Times the parse, print and query paths of PCS.')
+    parser.add_argument('--sizes', type=int, nargs='*', default=[100, 1000, 10000], help='the numbers of parameters of the synthetic spaces')
+    parser.add_argument('--repeats', type=int, default=3, help='the number of times that each operation is timed')
+    parser.add_argument('--output', default='bench_suite.json', help='the JSON file to write the results to')
+    parser.add_argument('--compare', default=None, help='a JSON file written by an earlier run to compare with')
+    args = parser.parse_args()
+
+    spaces = [(os.path.basename(filename), filename) for filename in sorted(glob.glob(os.path.join(examples, '*.pcs')))]
+    tmpdir = tempfile.mkdtemp()
+    for size in args.sizes:
+        filename = os.path.join(tmpdir, 'hierarchical-' + str(size) + '.pcs')
+        with open(filename, 'w') as f_out:
+            f_out.write(generateHierarchicalPCS(size, clauseSize=2, numForbidden=size//10))
+        spaces.append(('hierarchical-' + str(size), filename))
+
+    print('%-32s %7s %-16s %7s %14s %14s' % ('space', 'params', 'operation', 'calls', 'best (ms)', 'per call (us)'))
+    results = []
+    for (name, filename) in spaces:
+        results.extend(benchmarkSpace(name, filename, args.repeats))
+
+    with open(args.output, 'w') as f_out:
+        json.dump({'format': resultsFormat,
+                   'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   'commit': gitCommit(),
+                   'python': platform.python_version(),
+                   'platform': platform.platform(),
+                   'repeats': args.repeats,
+                   'sizes': args.sizes,
+                   'results': results}, f_out, indent=1)
+    print('')
+    print('Results written to ' + args.output)
+    if(args.compare is not None):
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
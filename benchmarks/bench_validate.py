@@ -0,0 +1,87 @@
+#Measures how quickly batches of configurations are validated, on the example
+#CPLEX configuration space with a mix of valid and broken configurations:
+# - loop: checking each configuration in Python with the functions that 
+#   were available before PCS.validate (getNamedValues, removeInactive and
+#   isForbidden);
+# - validate (dicts): PCS.validate on a list of configurations;
+# - validate (array): PCS.validate on an array encoded by configsToArray.
+#
+#Usage: python benchmarks/bench_validate.py
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+
+example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'params-cplex.pcs')
+
+
+def loopValidate(pcs, config):
+    #Returns True if the configuration is valid.
+    for name in config:
+        if(name not in pcs.paramIndex):
+            return False
+        param = pcs.getObject(pcs.paramIndex[name])
+        value = config[name]
+        if(pcs.isNumeric(param)):
+            (lower, upper) = param['values']
+            if(value < lower or value > upper):
+                return False
+            if(param['type'] == 'integer' and value != int(value)):
+                return False
+        elif(value not in pcs.getNamedValues(param)):
+            return False
+    full = pcs.getDefault()
+    full.update(config)
+    if(pcs.removeInactive(full) != config):
+        return False
+    return not pcs.isForbidden(config)
+
+
+def broken(pcs, n, seed):
+    #Returns n active configurations, a third of which have one value that
+    #is out of range, not a value of its parameter, or missing.
+    configs = pcs.sample(n, seed=seed)
+    rng = random.Random(seed)
+    for config in configs[::3]:
+        name = rng.choice(list(config))
+        param = pcs.getObject(pcs.paramIndex[name])
+        if(pcs.isNumeric(param)):
+            config[name] = param['values'][1] + 1
+        elif(rng.random() < 0.5):
+            config[name] = 'unknown'
+        else:
+            del config[name]
+    return configs
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    pcs = PCS(example)
+    print('%8s %14s %18s %18s' % ('configs', 'loop (cfg/s)', 'dicts (cfg/s)', 'array (cfg/s)'))
+    for n in [1000, 10000, 100000]:
+        configs = broken(pcs, n, 0)
+        (errors, params) = pcs.validate(configs)
+        assert [loopValidate(pcs, config) for config in configs[:1000]] == list(errors[:1000] == 0)
+        valid = [config for (config, error) in zip(configs, errors) if error == 0]
+        X = pcs.configsToArray(valid)
+        loop = 1000/timeIt(lambda: [loopValidate(pcs, config) for config in configs[:1000]], 1)
+        dicts = n/timeIt(lambda: pcs.validate(configs))
+        array = len(valid)/timeIt(lambda: pcs.validate(X))
+        print('%8d %14.0f %18.0f %18.0f' % (n, loop, dicts, array))
+
+
+if __name__ == '__main__':
+    main()
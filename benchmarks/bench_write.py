@@ -0,0 +1,68 @@
+#Compares printing a document by concatenating its lines onto one string, as
+#the original printDocument did, against printDocument (''.join) and 
+#writeDocument (streamed to a file), on multi-megabyte synthetic spaces. Also
+#reports the peak memory allocated while printing or writing the document.
+#
+#Usage: python benchmarks/bench_write.py
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+from synthetic import writePCS
+
+
+def originalPrintDocument(pcs):
+    #The original implementation of printDocument.
+    string = ''
+    for obj in pcs.doc['content']:
+        for line in pcs.printObject(obj):
+            string += line + '\n'
+    return string
+
+
+def timeIt(function, repeats=3):
+    best = float('inf')
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peakMemory(function):
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    outfile = os.path.join(tmpdir, 'out.pcs')
+    print('%7s %9s %14s %14s %14s %16s %16s' % ('params', 'size (MB)', 'original (s)', 'join (s)', 'stream (s)', 'join peak (MB)', 'stream peak (MB)'))
+    for numParams in [10000, 50000, 100000]:
+        filename = os.path.join(tmpdir, 'synthetic-' + str(numParams) + '.pcs')
+        writePCS(filename, numParams)
+        pcs = PCS(filename)
+        text = pcs.printDocument()
+        assert text == originalPrintDocument(pcs)
+        pcs.writeDocument(outfile)
+        with open(outfile) as f_in:
+            assert f_in.read() == text
+        original = timeIt(lambda: originalPrintDocument(pcs))
+        joined = timeIt(lambda: pcs.printDocument())
+        streamed = timeIt(lambda: pcs.writeDocument(outfile))
+        joinedPeak = peakMemory(lambda: pcs.printDocument())
+        streamedPeak = peakMemory(lambda: pcs.writeDocument(outfile))
+        print('%7d %9.1f %14.3f %14.3f %14.3f %16.1f %16.1f' % (numParams, len(text)/1e6, original, joined, streamed, joinedPeak/1e6, streamedPeak/1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+#Generates synthetic parameter configuration space files for the benchmarks.
+
+import random
+
+
+def generatePCS(numParams, seed=0, conditionalFraction=0.3, oldSyntaxFraction=0.1, domainSize=5, clauseSize=1):
+    #Returns the text of a synthetic pcs file with numParams parameters.
+    #Parameters are a mix of real, integer, categorical and ordinal
+    #parameters, some of them written in the old SMAC/ParamILS syntax, with
+    #trailing comments sprinkled throughout. A fraction of the parameters are
+    #made children of earlier categorical parameters, with conditions made up
+    #of clauseSize comparisons joined by && and ||.
+    rng = random.Random(seed)
+    lines = ['#Synthetic parameter configuration space with ' + str(numParams) + ' parameters', '']
+    conditions = []
+    categoricals = []
+    for i in range(0,numParams):
+        name = 'p' + str(i)
+        kind = rng.choice(['real','integer','categorical','ordinal'])
+        old = rng.random() < oldSyntaxFraction
+        comment = ''
+        if(rng.random() < 0.2):
+            comment = ' # generated parameter ' + str(i)
+        if(kind == 'real'):
+            log = rng.random() < 0.5
+            if(old):
+                line = name + ' [0.001, 100] [1]' + ('l' if log else '')
+            else:
+                line = name + ' real [0.001, 100] [1]' + (' log' if log else '')
+        elif(kind == 'integer'):
+            log = rng.random() < 0.5
+            if(old):
+                line = name + ' [1, 1000] [10]' + ('il' if log else 'i')
+            else:
+                line = name + ' integer [1, 1000] [10]' + (' log' if log else '')
+        else:
+            values = ['v' + str(j) for j in range(0,domainSize)]
+            if(old or kind == 'categorical'):
+                categoricals.append((name,values))
+            if(old and kind == 'categorical'):
+                line = name + ' {' + ','.join(values) + '} [' + values[0] + ']'
+            else:
+                line = name + ' ' + kind + ' {' + ', '.join(values) + '} [' + values[0] + ']'
+        lines.append(line + comment)
+        parents = [c for c in categoricals if c[0] != name]
+        if(len(parents) > 0 and rng.random() < conditionalFraction):
+            clauses = []
+            for j in range(0,clauseSize):
+                (parent,values) = rng.choice(parents)
+                comparison = rng.random()
+                if(comparison < 0.4):
+                    clauses.append(parent + ' == ' + rng.choice(values))
+                elif(comparison < 0.6):
+                    clauses.append(parent + ' != ' + rng.choice(values))
+                else:
+                    clauses.append(parent + ' in {' + ', '.join(rng.sample(values,2)) + '}')
+            condition = clauses[0]
+            for clause in clauses[1:]:
+                condition += rng.choice([' && ',' || ']) + clause
+            conditions.append(name + ' | ' + condition)
+    lines.append('')
+    lines.extend(conditions)
+    return '\n'.join(lines) + '\n'
+
+
+def writePCS(filename, numParams, **kwargs):
+    #Writes a synthetic pcs file and returns its name.
+    with open(filename,'w') as f_out:
+        f_out.write(generatePCS(numParams, **kwargs))
+    return filename
+
+
+def generateTreePCS(depth, fanOut, domainSize=3, roots=1):
+    #Returns the text of a synthetic pcs file whose categorical parameters
+    #form complete conditional trees with the given depth and fan-out. Each
+    #child is active only if its parent takes its first value (or, for every
+    #other child, one of its first two values).
+    lines = []
+    conditions = []
+    values = ['v' + str(j) for j in range(0,domainSize)]
+    level = []
+    for r in range(0,roots):
+        level.append('r' + str(r))
+    for d in range(0,depth + 1):
+        nextLevel = []
+        for name in level:
+            lines.append(name + ' categorical {' + ', '.join(values) + '} [' + values[0] + ']')
+            if(d == depth):
+                continue
+            for c in range(0,fanOut):
+                child = name + '_' + str(c)
+                nextLevel.append(child)
+                if(c % 2 == 0):
+                    conditions.append(child + ' | ' + name + ' == ' + values[0])
+                else:
+                    conditions.append(child + ' | ' + name + ' in {' + ', '.join(values[:2]) + '}')
+        level = nextLevel
+    return '\n'.join(lines + [''] + conditions) + '\n'
+
+
+def generateForbiddenPCS(numParams, numForbidden, seed=0, domainSize=5, arity=3, advancedFraction=0.0, numSubsets=None):
+    #Returns the text of a synthetic pcs file with numParams categorical
+    #parameters and numForbidden forbidden clauses, each of which forbids a
+    #combination of values of arity parameters. The clauses are written in
+    #the classic syntax ({a=x, b=y}), except for a fraction of them, which
+    #are written in the advanced syntax ({a == x && b == y}). If numSubsets
+    #is not None, the clauses only use that many different sets of 
+    #parameters.
+    rng = random.Random(seed)
+    values = ['v' + str(j) for j in range(0,domainSize)]
+    names = ['p' + str(i) for i in range(0,numParams)]
+    lines = []
+    for name in names:
+        lines.append(name + ' categorical {' + ', '.join(values) + '} [' + values[0] + ']')
+    lines.append('')
+    subsets = None
+    if(numSubsets is not None):
+        subsets = [rng.sample(names,arity) for i in range(0,numSubsets)]
+    for i in range(0,numForbidden):
+        if(subsets is None):
+            params = rng.sample(names,arity)
+        else:
+            params = rng.choice(subsets)
+        pairs = [(param, rng.choice(values)) for param in params]
+        if(rng.random() < advancedFraction):
+            lines.append('{' + ' && '.join([param + ' == ' + value for (param,value) in pairs]) + '}')
+        else:
+            lines.append('{' + ', '.join([param + '=' + value for (param,value) in pairs]) + '}')
+    return '\n'.join(lines) + '\n'
+
+
+def generateHierarchicalPCS(numParams, seed=0, domainSize=5, depth=3, fanOut=3, clauseSize=1, orFraction=0.5, numForbidden=0, advancedFraction=0.5, arity=2):
+    #Returns the text of a synthetic pcs file with numParams parameters that
+    #form conditional trees with the given depth and fan-out (the last tree
+    #may be incomplete). The parameters with children are categorical with
+    #domainSize values, the leaves are a mix of real, integer, categorical 
+    #and ordinal parameters. Each child is conditioned on its parent and, if
+    #clauseSize > 1, on further comparisons with its ancestors, joined by ||
+    #with probability orFraction and by && otherwise. numForbidden forbidden
+    #clauses each forbid a combination of values of arity categorical
+    #parameters, a fraction advancedFraction of them written in the advanced
+    #syntax. The default configuration is never forbidden.
+    rng = random.Random(seed)
+    values = ['v' + str(j) for j in range(0,domainSize)]
+    lines = ['#Synthetic hierarchical configuration space with ' + str(numParams) + ' parameters', '']
+    conditions = []
+    categoricals = []
+    count = 0
+    tree = 0
+    while(count < numParams):
+        #Each node is (name, ancestors), where ancestors are the names of its
+        #ancestors from the root down.
+        level = [('t' + str(tree), [])]
+        tree += 1
+        for d in range(0,depth + 1):
+            nextLevel = []
+            for (name,ancestors) in level:
+                if(count >= numParams):
+                    break
+                count += 1
+                if(d < depth):
+                    kind = 'categorical'
+                else:
+                    kind = rng.choice(['real','integer','categorical','ordinal'])
+                if(kind == 'real'):
+                    lines.append(name + ' real [0.001, 100] [1]' + rng.choice(['',' log']))
+                elif(kind == 'integer'):
+                    lines.append(name + ' integer [1, 1000] [10]' + rng.choice(['',' log']))
+                else:
+                    lines.append(name + ' ' + kind + ' {' + ', '.join(values) + '} [' + values[0] + ']')
+                    if(kind == 'categorical'):
+                        categoricals.append(name)
+                if(len(ancestors) > 0):
+                    clauses = [ancestors[-1] + ' in {' + ', '.join(rng.sample(values,min(2,domainSize))) + '}']
+                    for j in range(1,clauseSize):
+                        ancestor = rng.choice(ancestors)
+                        if(rng.random() < 0.5):
+                            clauses.append(ancestor + ' == ' + rng.choice(values))
+                        else:
+                            clauses.append(ancestor + ' != ' + rng.choice(values))
+                    condition = clauses[0]
+                    for clause in clauses[1:]:
+                        if(rng.random() < orFraction):
+                            condition += ' || ' + clause
+                        else:
+                            condition += ' && ' + clause
+                    conditions.append(name + ' | ' + condition)
+                if(d < depth):
+                    for c in range(0,fanOut):
+                        nextLevel.append((name + '_' + str(c), ancestors + [name]))
+            level = nextLevel
+    lines.append('')
+    lines.extend(conditions)
+    if(numForbidden > 0 and len(categoricals) >= arity):
+        lines.append('')
+        for i in range(0,numForbidden):
+            params = rng.sample(categoricals,arity)
+            #Forbid a non-default value of the first parameter, so that the 
+            #default configuration is always allowed.
+            pairs = [(params[0], rng.choice(values[1:]))] + [(param, rng.choice(values)) for param in params[1:]]
+            if(rng.random() < advancedFraction):
+                lines.append('{' + ' && '.join([param + ' == ' + value for (param,value) in pairs]) + '}')
+            else:
+                lines.append('{' + ', '.join([param + '=' + value for (param,value) in pairs]) + '}')
+    return '\n'.join(lines) + '\n'
@@ -8,4 +8,5 @@ setup(name='PCS',
       author_email='ypushak@cs.ubc.ca',
       license='BSD-3',
       packages=['PCS'],
+      extras_require={'numpy': ['numpy']},
       zip_safe=False)
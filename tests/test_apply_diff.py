@@ -0,0 +1,183 @@
+#Checks that applyDiff (and reload) update a space in place to what parsing
+#the new text gives, while keeping the IDs of the "objects" on unchanged
+#lines, and that a diff that cannot be applied leaves the space unchanged.
+#
+#Usage: python -m pytest tests (or python -m unittest discover tests)
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS, PCSParseError
+
+space = '\n'.join(['# header',
+                   'a categorical {x,y} [x]',
+                   'b real [0,1] [0.5] # bee',
+                   'c integer [0,10] [3]',
+                   'b | a == x',
+                   '{a == y && c == 4}']) + '\n'
+
+
+def snapshot(pcs):
+    #Returns everything that applyDiff can change.
+    lists = {}
+    for attr in ['paramList', 'conditionList', 'forbiddenList', 'valueList', 'commentList']:
+        lists[attr] = [obj['id'] for obj in getattr(pcs, attr)]
+    return {'mem': dict((key, repr(obj)) for (key, obj) in pcs.mem.items()),
+            'lists': lists,
+            'paramIndex': dict(pcs.paramIndex),
+            'content': list(pcs.doc['content']),
+            'source': dict(pcs.doc['source']),
+            'nextID': pcs.nextID()}
+
+
+class TestApplyDiff(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = self.writeFile('space.pcs', space)
+        self.pcs = PCS(self.filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def writeFile(self, name, text):
+        filename = os.path.join(self.tmpdir, name)
+        with open(filename, 'w') as f_out:
+            f_out.write(text)
+        return filename
+
+    def ids(self):
+        return dict((param['name'], param['id']) for param in self.pcs.paramList)
+
+    def assertSameAsParsed(self, text):
+        #The space is what parsing the text from scratch gives.
+        parsed = PCS(self.writeFile('parsed.pcs', text))
+        self.assertEqual(self.pcs.printDocument(), parsed.printDocument())
+        for attr in ['paramList', 'conditionList', 'forbiddenList']:
+            self.assertEqual([self.pcs.printObject(obj['id']) for obj in getattr(self.pcs, attr)],
+                             [parsed.printObject(obj['id']) for obj in getattr(parsed, attr)], attr)
+        self.assertEqual(self.pcs.getDefault(), parsed.getDefault())
+        names = set(parsed.paramIndex)
+        for config in [{'a': 'x', 'b': 0.5, 'c': 3}, {'a': 'y', 'b': 0.5, 'c': 4}]:
+            config = dict((name, value) for (name, value) in config.items() if name in names)
+            self.assertEqual(self.pcs.removeInactive(config), parsed.removeInactive(config))
+            self.assertEqual(self.pcs.isForbidden(config), parsed.isForbidden(config))
+
+    def test_unchanged(self):
+        before = snapshot(self.pcs)
+        self.assertEqual(self.pcs.applyDiff(space), ([], []))
+        self.assertEqual(snapshot(self.pcs), before)
+
+    def test_edit(self):
+        before = self.ids()
+        text = space.replace('c integer [0,10] [3]', 'c integer [0,20] [5]')
+        (removed, added) = self.pcs.applyDiff(text)
+        self.assertSameAsParsed(text)
+        self.assertIn(before['c'], removed)
+        self.assertEqual(self.ids()['a'], before['a'])
+        self.assertEqual(self.ids()['b'], before['b'])
+        self.assertNotEqual(self.ids()['c'], before['c'])
+        self.assertIn(self.ids()['c'], added)
+
+    def test_edit_parent(self):
+        #The condition of b names a, so it is parsed again against the new a.
+        before = self.ids()
+        condition = self.pcs.conditionList[0]['id']
+        text = space.replace('a categorical {x,y} [x]', 'a categorical {x,y,z} [z]')
+        (removed, added) = self.pcs.applyDiff(text)
+        self.assertSameAsParsed(text)
+        self.assertIn(condition, removed)
+        self.assertNotIn(condition, self.pcs.mem)
+        self.assertEqual(self.ids()['b'], before['b'])
+        self.assertEqual(self.pcs.removeInactive({'a': 'z', 'b': 0.5, 'c': 3}), {'a': 'z', 'c': 3})
+
+    def test_insert(self):
+        before = self.ids()
+        text = space.replace('c integer', 'd ordinal {lo,hi} [lo]\n# new comment\nc integer')
+        (removed, added) = self.pcs.applyDiff(text)
+        self.assertEqual(removed, [])
+        self.assertEqual(len(added), 2)
+        self.assertEqual([param['name'] for param in self.pcs.paramList], ['a', 'b', 'd', 'c'])
+        self.assertEqual(dict((name, pid) for (name, pid) in self.ids().items() if name != 'd'), before)
+        self.assertIn(self.ids()['d'], added)
+
+    def test_delete(self):
+        before = self.ids()
+        forbidden = self.pcs.forbiddenList[0]['id']
+        text = space.replace('{a == y && c == 4}\n', '').replace('c integer [0,10] [3]\n', '')
+        (removed, added) = self.pcs.applyDiff(text)
+        self.assertEqual(added, [])
+        self.assertEqual(set(removed), set([before['c'], forbidden]))
+        self.assertNotIn(before['c'], self.pcs.mem)
+        self.assertEqual(self.ids(), {'a': before['a'], 'b': before['b']})
+        self.assertSameAsParsed(text)
+
+    def test_move(self):
+        #A moved line is parsed again, and so is the forbidden clause that
+        #names the moved parameter. The other parameters keep their IDs.
+        before = self.ids()
+        text = space.replace('c integer [0,10] [3]\n', '').replace('a categorical', 'c integer [0,10] [3]\na categorical')
+        self.pcs.applyDiff(text)
+        self.assertSameAsParsed(text)
+        self.assertEqual([param['name'] for param in self.pcs.paramList], ['c', 'a', 'b'])
+        self.assertEqual(self.ids()['a'], before['a'])
+        self.assertEqual(self.ids()['b'], before['b'])
+
+    def test_duplicate_lines(self):
+        text = space + '# same\n# same\n\n# same\n'
+        (removed, added) = self.pcs.applyDiff(text)
+        self.assertEqual(len(added), 4)
+        self.assertSameAsParsed(text)
+        #Removing one of the duplicates keeps the others.
+        kept = list(self.pcs.doc['content'])
+        text = space + '# same\n\n# same\n'
+        (removed, added) = self.pcs.applyDiff(text)
+        self.assertEqual((len(removed), added), (1, []))
+        self.assertEqual(self.pcs.doc['content'], [oid for oid in kept if oid not in removed])
+        self.assertSameAsParsed(text)
+
+    def test_duplicate_parameter(self):
+        #As when the file is parsed, the name refers to the first of the two
+        #parameters, which is the one that was already there.
+        before = self.ids()
+        text = space.replace('c integer [0,10] [3]\n', 'c integer [0,10] [3]\nc integer [0,10] [3]\n')
+        (removed, added) = self.pcs.applyDiff(text)
+        self.assertEqual((removed, len(added)), ([], 1))
+        self.assertSameAsParsed(text)
+        self.assertEqual([param['name'] for param in self.pcs.paramList], ['a', 'b', 'c', 'c'])
+        self.assertEqual(self.pcs.paramIndex['c'], before['c'])
+        self.assertEqual(self.pcs.paramList[3]['id'], added[0])
+
+    def test_removed_parent(self):
+        before = snapshot(self.pcs)
+        document = self.pcs.printDocument()
+        text = space.replace('a categorical {x,y} [x]\n', '')
+        with self.assertRaises(PCSParseError) as context:
+            self.pcs.applyDiff(text)
+        self.assertEqual(context.exception.kind, 'conditional')
+        self.assertEqual(context.exception.line, 'b | a == x')
+        self.assertEqual(context.exception.lineNumber, 4)
+        self.assertEqual(snapshot(self.pcs), before)
+        self.assertEqual(self.pcs.printDocument(), document)
+        #The space still works, and the next diff starts from it.
+        self.assertEqual(self.pcs.removeInactive({'a': 'y', 'b': 0.5, 'c': 3}), {'a': 'y', 'c': 3})
+        self.pcs.applyDiff(space + '# more\n')
+        self.assertSameAsParsed(space + '# more\n')
+
+    def test_reload(self):
+        text = space.replace('# bee', '# wasp')
+        with open(self.filename, 'w') as f_out:
+            f_out.write(text)
+        before = self.ids()
+        self.pcs.reload()
+        self.assertSameAsParsed(text)
+        self.assertEqual(self.ids()['a'], before['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#Checks that cached spaces are only loaded if the cache file matches the pcs
+#file and could not have been written by anyone else.
+#
+#Usage: python -m pytest tests (or python -m unittest discover tests)
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+
+example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'params-lkh.pcs')
+
+space = '\n'.join(['a categorical {x,y} [x] # first',
+                   'b real [0,1] [0.5]',
+                   'b | a == x',
+                   '{a == y && b == 0.25}']) + '\n'
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'space.pcs')
+        shutil.copy(example, self.filename)
+        self.cacheFile = self.filename + PCS.cacheSuffix
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def loadWithoutParsing(self, **kwargs):
+        #Fails if the space is parsed instead of loaded from the cache.
+        with mock.patch.object(PCS, 'parseDoc', side_effect=AssertionError('parsed instead of loaded')):
+            return PCS(self.filename, cache=True, **kwargs)
+
+    def test_hit(self):
+        first = PCS(self.filename, cache=True)
+        self.assertTrue(os.path.exists(self.cacheFile))
+        second = self.loadWithoutParsing()
+        self.assertEqual(second.printDocument(), first.printDocument())
+        self.assertEqual([param['id'] for param in second.paramList], [param['id'] for param in first.paramList])
+        self.assertEqual(second.getDefault(), first.getDefault())
+        self.assertEqual(second.infile, self.filename)
+
+    def test_cache_directory(self):
+        directory = os.path.join(self.tmpdir, 'cache')
+        first = PCS(self.filename, cache=directory)
+        self.assertEqual(len(os.listdir(directory)), 1)
+        with mock.patch.object(PCS, 'parseDoc', side_effect=AssertionError('parsed instead of loaded')):
+            second = PCS(self.filename, cache=directory)
+        self.assertEqual(second.printDocument(), first.printDocument())
+
+    def test_stale(self):
+        PCS(self.filename, cache=True)
+        with open(self.filename, 'w') as f_out:
+            f_out.write(space)
+        pcs = PCS(self.filename, cache=True)
+        self.assertEqual(pcs.printDocument(), PCS(self.filename).printDocument())
+        self.assertEqual(sorted(pcs.getDefault()), ['a', 'b'])
+        #The cache file now holds the new contents.
+        self.assertEqual(self.loadWithoutParsing().printDocument(), pcs.printDocument())
+
+    def test_writable_by_others(self):
+        PCS(self.filename, cache=True)
+        for (path, mode) in [(self.cacheFile, 0o666), (self.tmpdir, 0o777)]:
+            original = os.stat(path).st_mode & 0o777
+            os.chmod(path, mode)
+            try:
+                with self.assertLogs('PCS', level='WARNING'):
+                    with self.assertRaises(AssertionError):
+                        self.loadWithoutParsing()
+            finally:
+                os.chmod(path, original)
+        self.loadWithoutParsing()
+
+    @unittest.skipIf(not hasattr(os, 'geteuid') or os.geteuid() != 0, 'changing the owner of a file requires root')
+    def test_owned_by_another_user(self):
+        PCS(self.filename, cache=True)
+        os.chown(self.cacheFile, os.getuid() + 1, -1)
+        with self.assertLogs('PCS', level='WARNING') as logs:
+            pcs = PCS(self.filename, cache=True)
+        self.assertIn('Ignoring the cache file', logs.output[0])
+        self.assertEqual(pcs.printDocument(), PCS(self.filename).printDocument())
+
+    def test_untrusted_pickle_is_not_loaded(self):
+        #A cache file that anyone could have written is never unpickled.
+        PCS(self.filename, cache=True)
+        os.chmod(self.cacheFile, 0o666)
+        with mock.patch('pickle.load') as load:
+            with self.assertLogs('PCS', level='WARNING'):
+                pcs = PCS(self.filename, cache=True)
+        self.assertEqual(load.call_count, 0)
+        self.assertEqual(pcs.printDocument(), PCS(self.filename).printDocument())
+
+    def test_lazy_cache_upgraded(self):
+        PCS(self.filename, cache=True, lazy=True)
+        pcs = PCS(self.filename, cache=True)
+        self.assertNotIn('lazyDocument', pcs.__dict__)
+        self.assertEqual(pcs.printDocument(), PCS(self.filename).printDocument())
+        #The complete space replaced the lazy one in the cache file.
+        self.assertNotIn('lazyDocument', self.loadWithoutParsing(lazy=True).__dict__)
+
+
+if __name__ == '__main__':
+    unittest.main()
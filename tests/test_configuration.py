@@ -0,0 +1,50 @@
+#Checks that Configuration objects keep their values when the parameters of
+#their space change after they were created.
+#
+#Usage: python -m pytest tests (or python -m unittest discover tests)
+
+import os
+import pickle
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS, Configuration
+
+example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'params-lkh.pcs')
+
+
+class TestConfigurationSnapshot(unittest.TestCase):
+
+    def test_remove_parameter(self):
+        pcs = PCS(example)
+        default = pcs.getDefault()
+        config = Configuration(pcs, default)
+        first = pcs.paramList[0]['name']
+        pcs.removeParameter(pcs.paramList[0]['id'])
+        self.assertEqual(config.toDict(), default)
+        self.assertEqual(config[first], default[first])
+        reduced = dict(default)
+        del reduced[first]
+        after = Configuration(pcs, reduced)
+        self.assertEqual(after.toDict(), reduced)
+        self.assertNotEqual(config, after)
+
+    def test_unchanged_parameters(self):
+        pcs = PCS(example)
+        before = Configuration(pcs, pcs.getDefault())
+        pcs.clearCaches()
+        after = Configuration(pcs, pcs.getDefault())
+        self.assertEqual(before, after)
+        self.assertEqual(hash(before), hash(after))
+
+    def test_pickle(self):
+        pcs = PCS(example)
+        config = Configuration(pcs, pcs.getDefault())
+        copy = pickle.loads(pickle.dumps(config))
+        self.assertEqual(copy.toDict(), config.toDict())
+
+
+if __name__ == '__main__':
+    unittest.main()
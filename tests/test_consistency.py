@@ -0,0 +1,194 @@
+#Checks that the functions that evaluate one configuration at a time agree
+#with the ones that evaluate batches of configurations as numpy arrays.
+#
+#Usage: python -m pytest tests (or python -m unittest discover tests)
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS, ActiveConfiguration
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def writeSpace(tmpdir, text):
+    filename = os.path.join(tmpdir, 'space.pcs')
+    with open(filename, 'w') as f_out:
+        f_out.write(text)
+    return PCS(filename)
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestNumericEquality(unittest.TestCase):
+
+    space = '\n'.join(['x integer [0,10] [5]',
+                       'r real [0,10] [2.5]',
+                       'c categorical {a,5,b} [a]',
+                       'z real [0,1] [0.5]',
+                       'w real [0,1] [0.5]',
+                       'v real [0,1] [0.5]',
+                       'u real [0,1] [0.5]',
+                       's real [0,1] [0.5]',
+                       'z | x == 5',
+                       'w | x != 5',
+                       'v | r == 2.5',
+                       'u | c == 5',
+                       's | c in {5,b}']) + '\n'
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.pcs = writeSpace(self.tmpdir, self.space)
+        default = self.pcs.getDefault()
+        self.configs = [default,
+                        dict(default, x=4),
+                        dict(default, x='5'),
+                        dict(default, x='5.0'),
+                        dict(default, x=5.0),
+                        dict(default, r=3),
+                        dict(default, r='2.50'),
+                        dict(default, c='5'),
+                        dict(default, c='b')]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_default_is_active(self):
+        #x == 5 holds for the default value x = 5.
+        self.assertIn('z', self.pcs.removeInactive(self.pcs.getDefault()))
+        self.assertNotIn('w', self.pcs.removeInactive(self.pcs.getDefault()))
+
+    def test_remove_inactive_matches_active_mask(self):
+        names = [param['name'] for param in self.pcs.paramList]
+        mask = self.pcs.getActiveMask(self.pcs.configsToArray(self.configs))
+        for (config, row) in zip(self.configs, mask):
+            active = set(self.pcs.removeInactive(config))
+            self.assertEqual(active, set(name for (name, m) in zip(names, row) if m), config)
+            activeConfig = ActiveConfiguration(self.pcs, config)
+            self.assertEqual(active, set(name for name in names if activeConfig.isActive(name)), config)
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestRemovedParameter(unittest.TestCase):
+    #removeParameter keeps the && clauses that name the removed parameter.
+
+    space = '\n'.join(['a categorical {x,y} [x]',
+                       'b categorical {u,v} [u]',
+                       'c categorical {m,n} [m]',
+                       'd real [0,1] [0.5]',
+                       'e categorical {x,y} [y]',
+                       'c | a == x && b == u',
+                       'd | c == m',
+                       'e | a != x || b == v']) + '\n'
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.pcs = writeSpace(self.tmpdir, self.space)
+        self.pcs.removeParameter(self.pcs.getParam('a'))
+        self.configs = [{'b': 'u', 'c': 'm', 'd': 0.5, 'e': 'y'},
+                        {'b': 'v', 'c': 'm', 'd': 0.5, 'e': 'x'},
+                        {'b': 'u', 'c': 'n', 'd': 0.25, 'e': 'x'}]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_active_mask(self):
+        names = [param['name'] for param in self.pcs.paramList]
+        mask = self.pcs.getActiveMask(self.pcs.configsToArray(self.configs))
+        for (config, row) in zip(self.configs, mask):
+            active = set(self.pcs.removeInactive(config))
+            self.assertEqual(active, set(name for (name, m) in zip(names, row) if m), config)
+
+    def test_sample_and_validate(self):
+        samples = self.pcs.sample(20, seed=1)
+        self.assertEqual(len(samples), 20)
+        (codes, positions) = self.pcs.validate(samples)
+        self.assertEqual([int(code) for code in codes], [0]*20)
+        (codes, positions) = self.pcs.validate(self.configs)
+        self.assertEqual(len(codes), len(self.configs))
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestForbiddenNumericLiterals(unittest.TestCase):
+
+    space = '\n'.join(['a categorical {v,w} [w]',
+                       'x integer [0,10] [3]',
+                       'r real [0,1] [0.5]',
+                       'b categorical {v,w} [w]',
+                       '{a == v && x == 5}',
+                       '{a == w && x != 3}',
+                       '{a == w && r == 0.25}',
+                       '{b == v && x == 7}']) + '\n'
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.pcs = writeSpace(self.tmpdir, self.space)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_numbers_and_text(self):
+        configs = [({'a': 'v', 'x': 5, 'r': 0.5, 'b': 'w'}, True),
+                   ({'a': 'v', 'x': '5', 'r': 0.5, 'b': 'w'}, True),
+                   ({'a': 'v', 'x': 5.0, 'r': 0.5, 'b': 'w'}, True),
+                   ({'a': 'w', 'x': '3.0', 'r': 0.5, 'b': 'w'}, False),
+                   ({'a': 'w', 'x': 4, 'r': 0.5, 'b': 'w'}, True),
+                   ({'a': 'w', 'x': 3, 'r': '0.250', 'b': 'w'}, True),
+                   ({'a': 'w', 'x': 3, 'r': 0.5, 'b': 'v'}, False),
+                   ({'a': 'v', 'x': '7.0', 'r': 0.5, 'b': 'v'}, True)]
+        mask = self.pcs.forbiddenMask([config for (config, forbidden) in configs])
+        for ((config, forbidden), masked) in zip(configs, mask):
+            self.assertEqual(self.pcs.isForbidden(config), forbidden, config)
+            self.assertEqual(bool(masked), forbidden, config)
+
+    def test_neighbours_are_not_forbidden(self):
+        config = {'a': 'v', 'x': 4, 'r': 0.5, 'b': 'v'}
+        neighbours = list(self.pcs.neighbours(config, numericSteps=(0.1, 0.3)))
+        self.assertTrue(len(neighbours) > 0)
+        self.assertFalse(self.pcs.forbiddenMask(neighbours).any())
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestLargeForbiddenTables(unittest.TestCase):
+    #The combinations of values of nine 100-value parameters do not fit in
+    #a float exactly, and those of ten do not fit in a 64 bit integer.
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def check(self, numParams):
+        values = ','.join(['v' + str(i) for i in range(0, 100)])
+        lines = ['p%d categorical {%s} [v0]' % (i, values) for i in range(0, numParams)]
+        forbidden = []
+        for k in range(0, 3):
+            forbidden.append(dict(('p%d' % i, 'v%d' % ((7*i + 13*k) % 100)) for i in range(0, numParams)))
+            lines.append('{' + ' && '.join(['%s == %s' % item for item in sorted(forbidden[-1].items())]) + '}')
+        pcs = writeSpace(self.tmpdir, '\n'.join(lines) + '\n')
+        configs = list(forbidden)
+        #Differs from a forbidden configuration in the first parameter only.
+        configs.append(dict(forbidden[0], p0='v99'))
+        configs.append(dict(('p%d' % i, 'v%d' % ((3*i) % 100)) for i in range(0, numParams)))
+        expected = [True, True, True, False, False]
+        self.assertEqual([pcs.isForbidden(config) for config in configs], expected)
+        self.assertEqual([bool(masked) for masked in pcs.forbiddenMask(configs)], expected)
+        self.assertEqual([int(code) for code in pcs.validate(configs)[0]], [7, 7, 7, 0, 0])
+
+    def test_nine_parameters(self):
+        self.check(9)
+
+    def test_ten_parameters(self):
+        self.check(10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#Checks that encode and decode are inverses of each other on conditional
+#spaces, including spaces from which parameters have been removed.
+#
+#Usage: python -m pytest tests (or python -m unittest discover tests)
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestEncodeDecode(unittest.TestCase):
+
+    space = '\n'.join(['a categorical {x,y,z} [x]',
+                       'b ordinal {low,mid,high} [mid]',
+                       'r real [0.001,10] [1] log',
+                       'i integer [1,1000] [10] log',
+                       'u real [-1,1] [0]',
+                       'n integer [0,5] [2]',
+                       'c categorical {m,n} [m]',
+                       'r | a == x',
+                       'i | a in {x,y}',
+                       'u | b != low',
+                       'c | a == y && b == high',
+                       'n | c == m']) + '\n'
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        filename = os.path.join(self.tmpdir, 'space.pcs')
+        with open(filename, 'w') as f_out:
+            f_out.write(self.space)
+        self.pcs = PCS(filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def assertRoundTrip(self, configs):
+        X = self.pcs.configsToArray(configs)
+        Z = self.pcs.encode(configs)
+        present = ~numpy.isnan(X)
+        #Every parameter that is set is scaled to [0, 1] (or encoded as the
+        #index of its value) and every missing one is imputed.
+        self.assertTrue(numpy.all(Z[~present] == -1))
+        for (j, param) in enumerate(self.pcs.paramList):
+            column = Z[present[:, j], j]
+            if(self.pcs.isNumeric(param)):
+                self.assertTrue(numpy.all((column >= 0) & (column <= 1)), param['name'])
+            else:
+                self.assertTrue(numpy.all(column == numpy.round(column)), param['name'])
+        self.assertTrue(numpy.allclose(self.pcs.decode(Z, asArray=True), X, equal_nan=True))
+        decoded = self.pcs.decode(Z)
+        self.assertEqual([sorted(config) for config in decoded], [sorted(config) for config in configs])
+        for (config, original) in zip(decoded, configs):
+            for name in config:
+                if(isinstance(original[name], str)):
+                    self.assertEqual(config[name], original[name])
+                else:
+                    self.assertAlmostEqual(float(config[name]), float(original[name]))
+        self.assertEqual([int(code) for code in self.pcs.validate(decoded)[0]], [0]*len(configs))
+
+    def test_default(self):
+        self.assertRoundTrip([self.pcs.removeInactive(self.pcs.getDefault())])
+
+    def test_inactive_parameters(self):
+        configs = [{'a': 'y', 'b': 'high', 'i': 1000, 'u': 1.0, 'c': 'n'},
+                   {'a': 'y', 'b': 'high', 'i': 1, 'u': -1.0, 'c': 'm', 'n': 5},
+                   {'a': 'z', 'b': 'low'},
+                   {'a': 'x', 'b': 'low', 'r': 0.001, 'i': 37}]
+        self.assertRoundTrip(configs)
+
+    def test_samples(self):
+        self.assertRoundTrip(self.pcs.sample(200, seed=3))
+
+    def test_removed_parameters(self):
+        #Removing b keeps the clause of c, which can then never be satisfied,
+        #and removing r changes the positions of the other columns.
+        self.pcs.removeParameter(self.pcs.getParam('b'))
+        self.pcs.removeParameter(self.pcs.getParam('r'))
+        self.assertEqual([param['name'] for param in self.pcs.paramList], ['a', 'i', 'u', 'n', 'c'])
+        self.assertRoundTrip(self.pcs.sample(100, seed=5))
+
+    def test_inactive_values_are_ignored(self):
+        #decode resolves which parameters are active from the decoded values,
+        #so whatever a model proposes for an inactive parameter is dropped.
+        Z = self.pcs.encode([{'a': 'z', 'b': 'low'}])
+        Z[0, :] = numpy.where(Z[0, :] == -1, 0.5, Z[0, :])
+        self.assertEqual(self.pcs.decode(Z), [{'a': 'z', 'b': 'low'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
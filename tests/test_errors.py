@@ -0,0 +1,59 @@
+#Checks that lines that cannot be parsed raise a PCSParseError that tells
+#where the error is.
+#
+#Usage: python -m pytest tests (or python -m unittest discover tests)
+
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS, PCSParseError
+
+
+class TestParseErrors(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'space.pcs')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def parse(self, text, **kwargs):
+        with open(self.filename, 'w') as f_out:
+            f_out.write(text)
+        with self.assertRaises(PCSParseError) as context:
+            PCS(self.filename, **kwargs)
+        return context.exception
+
+    def test_unknown_value_in_condition(self):
+        error = self.parse('a categorical {x,y} [x]\n'
+                           'b real [0,1] [0.5]\n'
+                           'b | a == zz\n')
+        self.assertEqual(error.message, 'Conditional statement specifies a parameter value that does not exist for the parameter.')
+        self.assertEqual(error.infile, self.filename)
+        self.assertEqual(error.lineNumber, 3)
+        self.assertEqual(error.kind, 'conditional')
+        self.assertEqual(error.line, 'b | a == zz')
+        self.assertEqual(str(error), error.message + ' (file "' + self.filename + '", line 3, conditional, \'b | a == zz\')')
+
+    def test_unknown_value_in_condition_in_parallel(self):
+        error = self.parse('a categorical {x,y} [x]\n'
+                           'b real [0,1] [0.5]\n'
+                           'b | a == zz\n', workers=2)
+        self.assertEqual(error.message, 'Conditional statement specifies a parameter value that does not exist for the parameter.')
+        self.assertEqual((error.lineNumber, error.kind, error.line), (3, 'conditional', 'b | a == zz'))
+
+    def test_pickle(self):
+        error = PCSParseError('message', 'space.pcs', 3, 'b | a == zz', 'conditional')
+        copy = pickle.loads(pickle.dumps(error))
+        self.assertEqual(str(copy), str(error))
+
+
+if __name__ == '__main__':
+    unittest.main()
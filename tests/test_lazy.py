@@ -0,0 +1,82 @@
+#Checks that lazily parsed spaces end up identical to eagerly parsed ones, and
+#that they keep failing the same way if their remaining lines cannot be
+#parsed.
+#
+#Usage: python -m pytest tests (or python -m unittest discover tests)
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS, PCSParseError
+
+example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'params-lkh.pcs')
+
+
+class TestLazy(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = os.path.join(self.tmpdir, 'cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def writeFile(self, text):
+        filename = os.path.join(self.tmpdir, 'space.pcs')
+        with open(filename, 'w') as f_out:
+            f_out.write(text)
+        return filename
+
+    def test_same_as_eager(self):
+        pcs = PCS(example, lazy=True)
+        self.assertIn('lazyDocument', pcs.__dict__)
+        self.assertEqual(pcs.printDocument(), PCS(example).printDocument())
+
+    def test_comments_of_parameters(self):
+        filename = self.writeFile('a categorical {x,y} [x] # first\n'
+                                  'b real [0,1] [0.5] # second\n'
+                                  'b | a == x\n')
+        lazy = PCS(filename, lazy=True)
+        eager = PCS(filename)
+        self.assertEqual(len(lazy.commentList), len(eager.commentList))
+        self.assertEqual(lazy.printDocument(), eager.printDocument())
+
+    def test_error_is_raised_every_time(self):
+        filename = self.writeFile('a categorical {x,y} [x]\n'
+                                  'b real [0,1] [0.5]\n'
+                                  'b | a == zz\n')
+        pcs = PCS(filename, lazy=True)
+        default = pcs.getDefault()
+        for function in [lambda: pcs.isActive('b', default),
+                         lambda: pcs.isActive('b', default),
+                         lambda: pcs.removeInactive(default),
+                         pcs.printDocument]:
+            with self.assertRaises(PCSParseError) as context:
+                function()
+            self.assertEqual(context.exception.lineNumber, 3)
+
+    def test_lazy_cache_loaded_eagerly(self):
+        pcs = PCS(example, cache=self.cache, lazy=True)
+        self.assertIn('lazyDocument', pcs.__dict__)
+        pcs = PCS(example, cache=self.cache)
+        self.assertNotIn('lazyDocument', pcs.__dict__)
+        self.assertEqual(pcs.printDocument(), PCS(example).printDocument())
+        #The cache file now holds the complete space.
+        self.assertNotIn('lazyDocument', PCS(example, cache=self.cache, lazy=True).__dict__)
+
+    def test_lazy_cache_with_error_loaded_eagerly(self):
+        filename = self.writeFile('a categorical {x,y} [x]\n'
+                                  'b real [0,1] [0.5]\n'
+                                  'b | a == zz\n')
+        PCS(filename, cache=self.cache, lazy=True)
+        with self.assertRaises(PCSParseError):
+            PCS(filename, cache=self.cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#Checks that parsing a file with a pool of processes (workers > 1) gives the
+#same space as parsing it in this process, down to the IDs of the "objects".
+#
+#Usage: python -m pytest tests (or python -m unittest discover tests)
+
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, root)
+sys.path.insert(0, os.path.join(root, 'benchmarks'))
+
+from PCS import PCS
+from synthetic import generatePCS, generateForbiddenPCS
+
+
+def snapshot(pcs):
+    #Returns everything that identifies the parsed "objects" and where they
+    #are referenced from.
+    lists = {}
+    for attr in ['paramList', 'conditionList', 'forbiddenList', 'valueList', 'commentList']:
+        lists[attr] = [obj['id'] for obj in getattr(pcs, attr)]
+    indices = {}
+    for attr in ['conditionsByChild', 'conditionsByParent']:
+        indices[attr] = dict((pid, [condition['id'] for condition in conditions]) for (pid, conditions) in getattr(pcs, attr).items())
+    return {'mem': dict((key, repr(obj)) for (key, obj) in pcs.mem.items()),
+            'lists': lists,
+            'indices': indices,
+            'paramIndex': dict(pcs.paramIndex),
+            'content': list(pcs.doc['content']),
+            'nextID': pcs.nextID()}
+
+
+class TestParallelParse(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def writeFile(self, name, text):
+        filename = os.path.join(self.tmpdir, name)
+        with open(filename, 'w') as f_out:
+            f_out.write(text)
+        return filename
+
+    def assertSameAsSerial(self, filename, workers=(2, 3)):
+        serial = PCS(filename)
+        expected = snapshot(serial)
+        for n in workers:
+            parallel = PCS(filename, workers=n)
+            self.assertEqual(parallel.printDocument(), serial.printDocument(), (filename, n))
+            found = snapshot(parallel)
+            for key in expected:
+                self.assertEqual(found[key], expected[key], (filename, n, key))
+
+    def test_examples(self):
+        filenames = sorted(glob.glob(os.path.join(root, 'examples', '*.pcs')))
+        self.assertTrue(len(filenames) > 0)
+        for filename in filenames:
+            self.assertSameAsSerial(filename)
+
+    def test_synthetic_conditions(self):
+        self.assertSameAsSerial(self.writeFile('conditions.pcs', generatePCS(1000, conditionalFraction=0.5, clauseSize=2)))
+
+    def test_synthetic_forbidden(self):
+        self.assertSameAsSerial(self.writeFile('forbidden.pcs', generateForbiddenPCS(30, 200, advancedFraction=0.5)))
+
+    def test_lazy(self):
+        filename = self.writeFile('conditions.pcs', generatePCS(300, conditionalFraction=0.5))
+        lazy = PCS(filename, workers=2, lazy=True)
+        self.assertEqual(lazy.printDocument(), PCS(filename).printDocument())
+
+    def test_later_ids(self):
+        #The next free ID is the same, so objects created after parsing get
+        #the same IDs too.
+        filename = self.writeFile('conditions.pcs', generatePCS(300, conditionalFraction=0.5))
+        serial = PCS(filename)
+        parallel = PCS(filename, workers=2)
+        self.assertEqual(serial.newComment('added')['id'], parallel.newComment('added')['id'])
+
+
+if __name__ == '__main__':
+    unittest.main()
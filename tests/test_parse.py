@@ -0,0 +1,62 @@
+#Checks that parameter lines are parsed into the same objects as by the
+#original parser, whichever path classifyLine sends them down.
+#
+#Usage: python -m pytest tests (or python -m unittest discover tests)
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+
+
+class TestLogScale(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def parseLine(self, line):
+        filename = os.path.join(self.tmpdir, 'space.pcs')
+        with open(filename, 'w') as f_out:
+            f_out.write(line + '\n')
+        pcs = PCS(filename)
+        return pcs.paramList[0]
+
+    def test_log_flag(self):
+        #Each line is given in the common form, and with the irregular
+        #spacing that only the original patterns recognize.
+        expected = [('x real [1,100] [10] log', True),
+                    ('x real [0, 1] [0.5] log', True),
+                    ('x integer [0, 10] [1] log', True),
+                    ('x integer [1,100] [10]', False),
+                    ('x [1,100] [10]l', True),
+                    ('x [1,100] [10]il', True),
+                    ('x [-1,10] [1]l', True),
+                    #The original parser ignores the log flag of the current
+                    #syntax if the bounds have signs or exponents.
+                    ('x real [1e-7, 1e-3] [1e-5] log', False),
+                    ('x real [-1, 10] [1] log', False),
+                    ('x integer [-1, 10] [1] log', False)]
+        for (line, log) in expected:
+            for variant in [line, line.replace(' [', '  [')]:
+                param = self.parseLine(variant)
+                self.assertEqual(param['log'], log, variant)
+
+    def test_log_flag_printed(self):
+        filename = os.path.join(self.tmpdir, 'space.pcs')
+        with open(filename, 'w') as f_out:
+            f_out.write('x real [1e-7, 1e-3] [1e-5] log\ny real [0, 1] [0.5] log\n')
+        lines = PCS(filename).printDocument().splitlines()
+        self.assertFalse(lines[0].rstrip().endswith('log'), lines[0])
+        self.assertTrue(lines[1].rstrip().endswith('log'), lines[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
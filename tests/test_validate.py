@@ -0,0 +1,100 @@
+#Checks the error codes that validate returns for each kind of invalid
+#configuration, for lists of configurations and for encoded arrays.
+#
+#Usage: python -m pytest tests (or python -m unittest discover tests)
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PCS import PCS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestValidate(unittest.TestCase):
+
+    space = '\n'.join(['a categorical {x,y} [x]',
+                       'r real [0,10] [1]',
+                       'i integer [0,10] [2]',
+                       'c categorical {m,n} [m]',
+                       'c | a == x',
+                       '{a == y && i == 3}']) + '\n'
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        filename = os.path.join(self.tmpdir, 'space.pcs')
+        with open(filename, 'w') as f_out:
+            f_out.write(self.space)
+        self.pcs = PCS(filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def check(self, configs, expected):
+        (codes, params) = self.pcs.validate(configs)
+        names = [param['name'] for param in self.pcs.paramList]
+        found = [(PCS.validationErrors[code], names[j] if j >= 0 else None) for (code, j) in zip(codes, params)]
+        self.assertEqual(found, expected)
+
+    def test_codes(self):
+        valid = {'a': 'x', 'r': 1, 'i': 2, 'c': 'm'}
+        self.check([valid,
+                    dict(valid, q=1),
+                    dict(valid, a='w'),
+                    dict(valid, r='abc'),
+                    dict(valid, r=11),
+                    dict(valid, i=-1),
+                    dict(valid, i=2.5),
+                    {'a': 'y', 'r': 1, 'i': 2, 'c': 'm'},
+                    {'a': 'x', 'r': 1, 'i': 2},
+                    {'a': 'y', 'r': 1, 'i': 3},
+                    {'a': 'y', 'r': 1, 'i': '3.0'},
+                    {'a': 'y', 'r': 1, 'i': 4}],
+                   [('valid', None),
+                    ('unknown parameter', None),
+                    ('invalid value', 'a'),
+                    ('invalid value', 'r'),
+                    ('out of range', 'r'),
+                    ('out of range', 'i'),
+                    ('not an integer', 'i'),
+                    ('inactive parameter present', 'c'),
+                    ('active parameter missing', 'c'),
+                    ('forbidden', None),
+                    ('forbidden', None),
+                    ('valid', None)])
+
+    def test_first_failed_check(self):
+        #An out of range value is reported before a forbidden combination,
+        #and an unknown value is treated as missing when resolving activity.
+        self.check([{'a': 'y', 'r': -0.5, 'i': 3},
+                    {'a': 'w', 'r': 1, 'i': 2, 'c': 'm'}],
+                   [('out of range', 'r'),
+                    ('invalid value', 'a')])
+
+    def test_array(self):
+        configs = [{'a': 'x', 'r': 1, 'i': 2, 'c': 'm'},
+                   {'a': 'y', 'r': 1, 'i': 2, 'c': 'm'},
+                   {'a': 'y', 'r': 1, 'i': 3}]
+        X = self.pcs.configsToArray(configs)
+        self.check(X, [('valid', None), ('inactive parameter present', 'c'), ('forbidden', None)])
+        X[0, 1] = 10.5
+        X[1, 0] = 2
+        X[2, 2] = 0.5
+        self.check(X, [('out of range', 'r'), ('invalid value', 'a'), ('not an integer', 'i')])
+
+    def test_samples_are_valid(self):
+        samples = self.pcs.sample(100, seed=7)
+        self.assertEqual([int(code) for code in self.pcs.validate(samples)[0]], [0]*100)
+
+
+if __name__ == '__main__':
+    unittest.main()